@@ -0,0 +1,150 @@
+"""
+Cost of building the models of large responses, validated or trusted.
+
+Run from the root of the repository with `python -m benchmarks.deserialization [--items 10000] [--dim 1536]`: it
+reports, for each payload, the time spent building the models from the decoded body with full validation (one model
+at a time, as before, and through a cached TypeAdapter) and as the `trusted_responses` mode does, which skips the
+validation of the models holding vectors and validates the others, since pydantic-core is as fast as skipping it.
+"""
+import argparse
+import random
+import timeit
+from typing import Any, Callable, Dict, List
+
+from cheshirecat_python_sdk.models.api.conversations import ConversationHistoryOutput, ConversationsResponse
+from cheshirecat_python_sdk.models.api.memories import MemoryPointsOutput
+from cheshirecat_python_sdk.models.api.plugins import PluginCollectionOutput
+from cheshirecat_python_sdk.models.api.users import UserOutput
+from cheshirecat_python_sdk.utils import deserialize, deserialize_list
+
+
+def users(items: int) -> List[Dict]:
+    return [
+        {
+            "id": f"user-{i}",
+            "username": f"user{i}",
+            "permissions": {"MEMORY": ["READ", "LIST"], "CONVERSATION": ["READ", "WRITE", "DELETE"]},
+            "metadata": {"team": "benchmarks"},
+            "created_at": 1700000000.0 + i,
+            "updated_at": None,
+        }
+        for i in range(items)
+    ]
+
+
+def conversations(items: int) -> List[Dict]:
+    return [
+        {
+            "chat_id": f"chat-{i}",
+            "name": f"Conversation {i}",
+            "num_messages": i % 50,
+            "metadata": {},
+            "created_at": 1700000000.0 + i,
+            "updated_at": 1700000000.0 + i,
+        }
+        for i in range(items)
+    ]
+
+
+def history(items: int) -> Dict:
+    memory = [{"id": f"{i}", "page_content": "text " * 50, "metadata": {}, "score": 0.5} for i in range(5)]
+    return {
+        "history": [
+            {
+                "who": "assistant" if i % 2 else "user",
+                "when": 1700000000.0 + i,
+                "content": {
+                    "text": "Hello world! " * 20,
+                    "why": {"input": "Hello", "intermediate_steps": [["tool", "output"]] * 3, "memory": memory},
+                },
+            }
+            for i in range(items)
+        ]
+    }
+
+
+def plugins(items: int) -> Dict:
+    plugin = {
+        "name": "Plugin",
+        "description": "A plugin " * 10,
+        "author_name": "Author",
+        "tags": ["one", "two", "three"],
+        "version": "1.0.0",
+    }
+    return {
+        "filters": {"query": None},
+        "installed": [{**plugin, "id": f"installed-{i}", "local_info": {"active": True}} for i in range(items)],
+        "registry": [{**plugin, "id": f"registry-{i}", "url": "https://example.com"} for i in range(items)],
+    }
+
+
+def memory_points(items: int, dim: int) -> Dict:
+    return {
+        "points": [
+            {"id": f"{i}", "payload": {"page_content": "text " * 50, "metadata": {}}, "vector": [random.random()] * dim}
+            for i in range(items)
+        ],
+        "next_offset": None,
+    }
+
+
+def per_call(function: Callable[[], Any], number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=3)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10000, help="items of the list payloads")
+    parser.add_argument("--points", type=int, default=1000, help="memory points of the page")
+    parser.add_argument("--dim", type=int, default=1536, help="size of the vectors of the memory points")
+    args = parser.parse_args()
+
+    user_list, conversation_list = users(args.items), conversations(args.items)
+    conversation_history = history(args.items // 10)
+    plugin_collection, page = plugins(args.items // 10), memory_points(args.points, args.dim)
+
+    cases = [
+        (
+            f"{args.items} users",
+            lambda: [deserialize(item, UserOutput) for item in user_list],
+            lambda: deserialize_list(user_list, UserOutput),
+            lambda: deserialize_list(user_list, UserOutput, trusted=True),
+        ),
+        (
+            f"{args.items} conversations",
+            lambda: [deserialize(item, ConversationsResponse) for item in conversation_list],
+            lambda: deserialize_list(conversation_list, ConversationsResponse),
+            lambda: deserialize_list(conversation_list, ConversationsResponse, trusted=True),
+        ),
+        (
+            f"{args.items // 10} history messages",
+            None,
+            lambda: deserialize(conversation_history, ConversationHistoryOutput),
+            lambda: deserialize(conversation_history, ConversationHistoryOutput, trusted=True),
+        ),
+        (
+            f"{args.items // 10} x 2 plugins",
+            None,
+            lambda: deserialize(plugin_collection, PluginCollectionOutput),
+            lambda: deserialize(plugin_collection, PluginCollectionOutput, trusted=True),
+        ),
+        (
+            f"{args.points} points x {args.dim} dims",
+            None,
+            lambda: deserialize(page, MemoryPointsOutput),
+            lambda: deserialize(page, MemoryPointsOutput, trusted=True),
+        ),
+    ]
+
+    print(f"{'payload':<32}{'per item ms':>14}{'validated ms':>14}{'trusted ms':>12}{'speedup':>10}")
+    for name, one_by_one, validated, trusted in cases:
+        per_item = f"{per_call(one_by_one, 3) * 1e3:.2f}" if one_by_one else "-"
+        validated_cost, trusted_cost = per_call(validated, 3), per_call(trusted, 3)
+        print(
+            f"{name:<32}{per_item:>14}{validated_cost * 1e3:>14.2f}{trusted_cost * 1e3:>12.2f}"
+            f"{validated_cost / trusted_cost:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
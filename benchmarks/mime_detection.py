@@ -0,0 +1,76 @@
+"""
+Cost of detecting the MIME types of the files to upload.
+
+Run from the root of the repository with `python -m benchmarks.mime_detection [--files 2000]`: it writes a directory of
+small text, markdown and PDF files, then reports the time per file spent detecting their types with a new libmagic
+instance per file, as before, with the shared detector, without and with its cache, and as a batch.
+"""
+import argparse
+import os
+import tempfile
+import timeit
+from typing import Any, Callable, List
+
+import magic
+
+from cheshirecat_python_sdk.utils import MimeTypeDetector
+
+CONTENTS = {
+    ".txt": b"Some plain text, to be ingested.\n" * 40,
+    ".md": b"# Title\n\nSome *markdown* text.\n" * 40,
+    ".pdf": b"%PDF-1.7\n" + b"0" * 1024,
+    ".dat": b"Text without a known extension.\n" * 40,
+}
+
+
+def write_files(directory: str, files: int) -> List[str]:
+    paths = []
+    extensions = list(CONTENTS)
+    for i in range(files):
+        extension = extensions[i % len(extensions)]
+        path = os.path.join(directory, f"file-{i}{extension}")
+        with open(path, "wb") as file:
+            file.write(CONTENTS[extension])
+        paths.append(path)
+    return paths
+
+
+def per_file(function: Callable[[], Any], files: int) -> float:
+    return min(timeit.repeat(function, number=1, repeat=3)) / files
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=2000, help="files to detect")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_files(directory, args.files)
+
+        def new_instance():
+            for path in paths:
+                with open(path, "rb") as file:
+                    magic.Magic(mime=True).from_buffer(file.read(2048))
+
+        def uncached():
+            detector = MimeTypeDetector(cache_size=0)
+            for path in paths:
+                detector.detect_file(path)
+
+        cached_detector = MimeTypeDetector()
+        cached_detector.detect_files(paths)
+
+        cases = [
+            ("new libmagic per file", new_instance),
+            ("shared detector", uncached),
+            ("shared detector, cached", lambda: [cached_detector.detect_file(path) for path in paths]),
+            ("batch", lambda: MimeTypeDetector().detect_files(paths)),
+        ]
+
+        print(f"{'detection':<32}{'per file us':>14}")
+        for name, function in cases:
+            print(f"{name:<32}{per_file(function, args.files) * 1e6:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
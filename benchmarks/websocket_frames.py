@@ -0,0 +1,92 @@
+"""
+Per-frame cost of the websocket receive path, at token-stream rates.
+
+Run from the root of the repository with `python -m benchmarks.websocket_frames [--chats 1000] [--rate 100]`: it
+reports the time spent turning a frame into an event, and the share of one CPU core needed to keep up with `chats`
+concurrent chats receiving `rate` frames per second each.
+"""
+import argparse
+import asyncio
+import json
+import time
+import timeit
+
+from cheshirecat_python_sdk.endpoints.message import to_stream_event
+from cheshirecat_python_sdk.models.api.messages import ChatOutputEvent
+
+TOKEN_FRAME = json.dumps({"type": "chat_token", "content": " token"})
+FINAL_FRAME = json.dumps({
+    "agent_id": "agent",
+    "user_id": "user",
+    "chat_id": "chat",
+    "message": {"text": "Hello world! " * 20, "type": "chat", "why": {"input": "Hello", "memory": []}},
+})
+
+
+def substring_matching(frame: str):
+    # the previous receive loop: a substring test, then the consumer parsing the token frame again
+    if '"type":"chat"' not in frame:
+        return json.loads(frame)
+    return None
+
+
+def per_frame(function, frame: str, number: int) -> float:
+    return min(timeit.repeat(lambda: function(frame), number=number, repeat=5)) / number
+
+
+async def stream_chats(chats: int, frames: int, buffer_size: int) -> float:
+    """
+    Pushes `frames` token frames and a final answer through the event conversion and a bounded queue, for each one of
+    `chats` concurrent chats, as MessageStream does.
+    """
+    async def chat():
+        queue = asyncio.Queue(maxsize=buffer_size)
+
+        async def receive():
+            for _ in range(frames):
+                await queue.put(to_stream_event(TOKEN_FRAME))
+            await queue.put(to_stream_event(FINAL_FRAME))
+
+        producer = asyncio.create_task(receive())
+        while not isinstance(await queue.get(), ChatOutputEvent):
+            pass
+        await producer
+
+    start = time.perf_counter()
+    await asyncio.gather(*[chat() for _ in range(chats)])
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chats", type=int, default=1000, help="concurrent chats")
+    parser.add_argument("--rate", type=int, default=100, help="frames per second of each chat")
+    parser.add_argument("--frames", type=int, default=100, help="token frames per answer in the end-to-end run")
+    parser.add_argument("--buffer-size", type=int, default=64, help="size of the buffer of each stream")
+    args = parser.parse_args()
+
+    required = args.chats * args.rate
+    print(f"target: {args.chats} chats x {args.rate} frames/s = {required} frames/s\n")
+
+    print(f"{'frame conversion':<40}{'us/frame':>10}{'core share':>12}")
+    for name, function in [
+        ("token, substring matching + json.loads", substring_matching),
+        ("token, to_stream_event", to_stream_event),
+    ]:
+        cost = per_frame(function, TOKEN_FRAME, 20000)
+        print(f"{name:<40}{cost * 1e6:>10.2f}{cost * required:>11.1%}")
+
+    # the final answer is validated, but it comes once per answer
+    cost = per_frame(to_stream_event, FINAL_FRAME, 20000)
+    print(f"{'final answer, to_stream_event':<40}{cost * 1e6:>10.2f}{'-':>12}")
+
+    total = args.chats * (args.frames + 1)
+    elapsed = asyncio.run(stream_chats(args.chats, args.frames, args.buffer_size))
+    print(
+        f"\nend-to-end, {args.chats} concurrent streams of {args.frames + 1} frames: "
+        f"{elapsed * 1e6 / total:.2f} us/frame, {total / elapsed:,.0f} frames/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
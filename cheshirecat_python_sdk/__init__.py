@@ -1,6 +1,15 @@
-from cheshirecat_python_sdk.client import CheshireCatClient
-from cheshirecat_python_sdk.clients import HttpClient, WSClient
+from cheshirecat_python_sdk.client import CheshireCatClient, AsyncCheshireCatClient
+from cheshirecat_python_sdk.clients import (
+    AsyncHttpClient,
+    HttpClient,
+    WSClient,
+    RetryPolicy,
+    CircuitBreakerPolicy,
+    deadline,
+)
 from cheshirecat_python_sdk.configuration import Configuration
+from cheshirecat_python_sdk.ingestion import IngestionJob, AsyncIngestionJob
+from cheshirecat_python_sdk.models.vectors import compact_vectors
 
 
 from cheshirecat_python_sdk.builders import *
@@ -0,0 +1,231 @@
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Tuple
+
+from cheshirecat_python_sdk.models.api.memories import MemoryRecallOutput
+from cheshirecat_python_sdk.models.dtos import FilterSource
+from cheshirecat_python_sdk.models.vectors import is_compact_vectors
+
+RecallKey = Tuple[str, str, str | None, str, int | None, str | None, bool, bool]
+SourceKey = Tuple[str, str | None, str, str]
+
+
+class _CacheEntry:
+    __slots__ = ("value", "expires_at", "generation")
+
+    def __init__(self, value: Any, expires_at: float, generation: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.generation = generation
+
+
+class AgentCache:
+    """
+    A thread-safe LRU cache whose entries expire after `ttl` seconds, and whose keys start with the ID of an agent.
+
+    The entries of an agent are invalidated all at once: each agent has a generation, bumped by `invalidate`, and the
+    entries of an older generation are misses.
+    """
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        # generations only grow: the last one assigned, and the one of the agents never invalidated on their own
+        self.__last_generation = 0
+        self.__base_generation = 0
+        self.__generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _get_generation(self, agent_id: str) -> int:
+        return self.__generations.get(agent_id, self.__base_generation)
+
+    def get_generation(self, agent_id: str) -> int:
+        """
+        Returns the current generation of the agent: read it before sending a request, and store the result with it, so
+        that an invalidation happening meanwhile is not lost.
+        """
+        with self._lock:
+            return self._get_generation(agent_id)
+
+    def _get(self, key: Tuple) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.expires_at <= time.monotonic() or entry.generation != self._get_generation(key[0]):
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def get(self, key: Tuple) -> Any:
+        with self._lock:
+            value = self._get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def put(self, key: Tuple, value: Any, generation: int):
+        with self._lock:
+            self._entries[key] = _CacheEntry(value, time.monotonic() + self.ttl, generation)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _invalidate(self, agent_id: str | None):
+        self.__last_generation += 1
+        if agent_id is None:
+            self._entries.clear()
+            self.__generations.clear()
+            self.__base_generation = self.__last_generation
+        else:
+            self.__generations[agent_id] = self.__last_generation
+
+    def invalidate(self, agent_id: str | None = None):
+        """
+        Invalidates the entries of the given agent, or all the entries if no agent is given.
+        """
+        with self._lock:
+            self._invalidate(agent_id)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RecallCache(AgentCache):
+    """
+    The cache of the memory recalls. The cached results are shared among the callers, hence they must not be modified.
+
+    Writes and deletions of memory points, uploads to the rabbit hole and the end of the ingestions awaited, performed
+    through the same client, invalidate the entries of the agent; the changes made by other clients are only caught by
+    the expiration.
+    """
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0):
+        super().__init__(max_size, ttl)
+
+    @staticmethod
+    def get_key(
+        agent_id: str,
+        user_id: str,
+        chat_id: str | None,
+        text: str,
+        k: int | None,
+        metadata: str | None,
+        with_vectors: bool = True,
+    ) -> RecallKey:
+        """
+        Builds the key of a recall: texts differing only by whitespace share the same key, while the recalls with
+        compact vectors or without vectors are kept apart from the others.
+        :param metadata: The metadata filter, JSON-encoded with sorted keys.
+        :param with_vectors: Whether the recall returns the vectors.
+        """
+        return (
+            agent_id, user_id, chat_id, " ".join(text.split()), k or None, metadata, is_compact_vectors(), with_vectors
+        )
+
+    def get(self, key: RecallKey) -> MemoryRecallOutput | None:
+        return super().get(key)
+
+
+class BloomFilter:
+    """
+    A set of keys in constant memory, answering either "surely absent" or "present", the latter being wrong with
+    probability `error_rate` once `capacity` keys have been added.
+    """
+    def __init__(self, capacity: int, error_rate: float = 1e-6):
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.__bits = bytearray((self.size + 7) // 8)
+
+    def __positions(self, key: Tuple):
+        digest = hashlib.blake2b(repr(key).encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, key: Tuple):
+        for position in self.__positions(key):
+            self.__bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: Tuple) -> bool:
+        return all(self.__bits[position >> 3] & (1 << (position & 7)) for position in self.__positions(key))
+
+
+class SourceCache(AgentCache):
+    """
+    What the client knows about the sources already stored in the memory of the agents: both the sources found and the
+    ones not found are cached, and the sources ingested through the same client are recorded as found.
+
+    With `bloom_capacity`, the sources found are recorded in a Bloom filter per agent instead: they never expire and
+    take constant memory, at the price of reporting a source as found, with probability `bloom_error_rate`, when it is
+    not.
+    Writes and deletions of memory points performed through the same client invalidate everything known about the agent.
+    """
+    def __init__(
+        self,
+        max_size: int = 100_000,
+        ttl: float = 300.0,
+        bloom_capacity: int | None = None,
+        bloom_error_rate: float = 1e-6,
+    ):
+        super().__init__(max_size, ttl)
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+        self.__blooms: Dict[str, BloomFilter] = {}
+
+    @staticmethod
+    def get_key(agent_id: str, filter_source: FilterSource, chat_id: str | None = None) -> SourceKey:
+        if filter_source.source:
+            return agent_id, chat_id, "source", filter_source.source
+        return agent_id, chat_id, "hash", filter_source.hash
+
+    def get(self, key: SourceKey) -> bool | None:
+        with self._lock:
+            value = self._get(key)
+            if value is None and key[0] in self.__blooms:
+                value = True if key in self.__blooms[key[0]] else None
+
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def put(self, key: SourceKey, value: bool, generation: int):
+        if not value or not self.bloom_capacity:
+            super().put(key, value, generation)
+            return
+
+        with self._lock:
+            if generation != self._get_generation(key[0]):
+                return
+            self._entries.pop(key, None)
+            bloom = self.__blooms.get(key[0])
+            if bloom is None:
+                bloom = self.__blooms[key[0]] = BloomFilter(self.bloom_capacity, self.bloom_error_rate)
+            bloom.add(key)
+
+    def remember(self, agent_id: str, filter_source: FilterSource, chat_id: str | None = None):
+        """
+        Records a source as found, e.g. after its ingestion.
+        """
+        self.put(self.get_key(agent_id, filter_source, chat_id), True, self.get_generation(agent_id))
+
+    def invalidate(self, agent_id: str | None = None):
+        with self._lock:
+            self._invalidate(agent_id)
+            if agent_id is None:
+                self.__blooms.clear()
+            else:
+                self.__blooms.pop(agent_id, None)
@@ -1,4 +1,5 @@
-from cheshirecat_python_sdk.clients import HttpClient, WSClient
+from cheshirecat_python_sdk.cache import RecallCache, SourceCache
+from cheshirecat_python_sdk.clients import AsyncHttpClient, HttpClient, JsonCodec, WSClient, get_json_codec
 from cheshirecat_python_sdk.configuration import Configuration
 from cheshirecat_python_sdk.endpoints import (
     AdminsEndpoint,
@@ -19,24 +20,78 @@ from cheshirecat_python_sdk.endpoints import (
     VectorDatabaseEndpoint,
     HealthCheckEndpoint,
     AgenticWorkflowEndpoint,
+    AsyncAdminsEndpoint,
+    AsyncAuthEndpoint,
+    AsyncAuthHandlerEndpoint,
+    AsyncChunkerEndpoint,
+    AsyncConversationEndpoint,
+    AsyncCustomEndpoint,
+    AsyncEmbedderEndpoint,
+    AsyncFileManagerEndpoint,
+    AsyncLargeLanguageModelEndpoint,
+    AsyncMemoryEndpoint,
+    AsyncMessageEndpoint,
+    AsyncPluginsEndpoint,
+    AsyncRabbitHoleEndpoint,
+    AsyncUsersEndpoint,
+    AsyncUtilsEndpoint,
+    AsyncVectorDatabaseEndpoint,
+    AsyncHealthCheckEndpoint,
+    AsyncAgenticWorkflowEndpoint,
 )
 
 
 class CheshireCatClient:
     def __init__(self, configuration: Configuration, token: str | None = None):
+        json_codec = get_json_codec(configuration.json_codec)
+        self.__trusted_responses = configuration.trusted_responses
+        self.__server_projection = configuration.server_projection
         self.__http_client = HttpClient(
             host=configuration.host,
             port=configuration.port,
             apikey=configuration.auth_key,
-            is_https=configuration.secure_connection
+            is_https=configuration.secure_connection,
+            pool_connections=configuration.pool_connections,
+            pool_maxsize=configuration.pool_maxsize,
+            pool_block=configuration.pool_block,
+            keep_alive=configuration.keep_alive,
+            retry_policy=configuration.retry_policy,
+            circuit_breaker_policy=configuration.circuit_breaker_policy,
+            transport_hook=configuration.transport_hook,
+            connect_timeout=configuration.connect_timeout,
+            read_timeout=configuration.read_timeout,
+            json_codec=json_codec,
         )
         self.__ws_client = WSClient(
             host=configuration.host,
             port=configuration.port,
             apikey=configuration.auth_key,
-            is_wss=configuration.secure_connection
+            is_wss=configuration.secure_connection,
+            connect_timeout=configuration.connect_timeout,
+            read_timeout=configuration.read_timeout,
+            ping_interval=configuration.ws_ping_interval,
+            ping_timeout=configuration.ws_ping_timeout,
+            max_connections=configuration.ws_max_connections,
+            idle_timeout=configuration.ws_idle_timeout,
+            json_codec=json_codec,
+        )
+        self.__recall_cache = (
+            RecallCache(configuration.recall_cache_size, configuration.recall_cache_ttl)
+            if configuration.recall_cache_size
+            else None
+        )
+        self.__source_cache = (
+            SourceCache(
+                configuration.source_cache_size,
+                configuration.source_cache_ttl,
+                bloom_capacity=configuration.source_cache_bloom_capacity,
+            )
+            if configuration.source_cache_size
+            else None
         )
 
+        self.__rabbit_hole = None
+
         if token:
             self.add_token(token)
 
@@ -45,6 +100,19 @@ class CheshireCatClient:
         self.__http_client.set_token(token)
         return self
 
+    def close(self):
+        """
+        Releases the pooled HTTP connections of the client. The websocket connections live in the event loop that
+        opened them: close them from there with `await client.ws_client.close()`.
+        """
+        self.__http_client.close()
+
+    def __enter__(self) -> 'CheshireCatClient':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     @property
     def http_client(self) -> HttpClient:
         return self.__http_client
@@ -53,6 +121,26 @@ class CheshireCatClient:
     def ws_client(self) -> WSClient:
         return self.__ws_client
 
+    @property
+    def json_codec(self) -> JsonCodec:
+        return self.__http_client.json_codec
+
+    @property
+    def trusted_responses(self) -> bool:
+        return self.__trusted_responses
+
+    @property
+    def server_projection(self) -> bool:
+        return self.__server_projection
+
+    @property
+    def recall_cache(self) -> RecallCache | None:
+        return self.__recall_cache
+
+    @property
+    def source_cache(self) -> SourceCache | None:
+        return self.__source_cache
+
     @property
     def admins(self):
         return AdminsEndpoint(self)
@@ -103,7 +191,10 @@ class CheshireCatClient:
 
     @property
     def rabbit_hole(self):
-        return RabbitHoleEndpoint(self)
+        # kept for the life of the client, since it caches what it learns of the agents
+        if self.__rabbit_hole is None:
+            self.__rabbit_hole = RabbitHoleEndpoint(self)
+        return self.__rabbit_hole
 
     @property
     def users(self):
@@ -124,3 +215,177 @@ class CheshireCatClient:
     @property
     def health_check(self):
         return HealthCheckEndpoint(self)
+
+
+class AsyncCheshireCatClient:
+    def __init__(self, configuration: Configuration, token: str | None = None):
+        json_codec = get_json_codec(configuration.json_codec)
+        self.__trusted_responses = configuration.trusted_responses
+        self.__server_projection = configuration.server_projection
+        self.__http_client = AsyncHttpClient(
+            host=configuration.host,
+            port=configuration.port,
+            apikey=configuration.auth_key,
+            is_https=configuration.secure_connection,
+            pool_maxsize=configuration.pool_maxsize,
+            keep_alive=configuration.keep_alive,
+            retry_policy=configuration.retry_policy,
+            circuit_breaker_policy=configuration.circuit_breaker_policy,
+            transport_hook=configuration.transport_hook,
+            connect_timeout=configuration.connect_timeout,
+            read_timeout=configuration.read_timeout,
+            json_codec=json_codec,
+        )
+        self.__ws_client = WSClient(
+            host=configuration.host,
+            port=configuration.port,
+            apikey=configuration.auth_key,
+            is_wss=configuration.secure_connection,
+            connect_timeout=configuration.connect_timeout,
+            read_timeout=configuration.read_timeout,
+            ping_interval=configuration.ws_ping_interval,
+            ping_timeout=configuration.ws_ping_timeout,
+            max_connections=configuration.ws_max_connections,
+            idle_timeout=configuration.ws_idle_timeout,
+            json_codec=json_codec,
+        )
+        self.__recall_cache = (
+            RecallCache(configuration.recall_cache_size, configuration.recall_cache_ttl)
+            if configuration.recall_cache_size
+            else None
+        )
+        self.__source_cache = (
+            SourceCache(
+                configuration.source_cache_size,
+                configuration.source_cache_ttl,
+                bloom_capacity=configuration.source_cache_bloom_capacity,
+            )
+            if configuration.source_cache_size
+            else None
+        )
+
+        self.__rabbit_hole = None
+
+        if token:
+            self.add_token(token)
+
+    def add_token(self, token: str) -> 'AsyncCheshireCatClient':
+        self.__ws_client.set_token(token)
+        self.__http_client.set_token(token)
+        return self
+
+    async def close(self):
+        """
+        Releases the pooled HTTP and websocket connections of the client.
+        """
+        await self.__http_client.close()
+        await self.__ws_client.close()
+
+    async def __aenter__(self) -> 'AsyncCheshireCatClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @property
+    def http_client(self) -> AsyncHttpClient:
+        return self.__http_client
+
+    @property
+    def ws_client(self) -> WSClient:
+        return self.__ws_client
+
+    @property
+    def json_codec(self) -> JsonCodec:
+        return self.__http_client.json_codec
+
+    @property
+    def trusted_responses(self) -> bool:
+        return self.__trusted_responses
+
+    @property
+    def server_projection(self) -> bool:
+        return self.__server_projection
+
+    @property
+    def recall_cache(self) -> RecallCache | None:
+        return self.__recall_cache
+
+    @property
+    def source_cache(self) -> SourceCache | None:
+        return self.__source_cache
+
+    @property
+    def admins(self):
+        return AsyncAdminsEndpoint(self)
+
+    @property
+    def auth(self):
+        return AsyncAuthEndpoint(self)
+
+    @property
+    def auth_handler(self):
+        return AsyncAuthHandlerEndpoint(self)
+
+    @property
+    def agentic_workflow(self):
+        return AsyncAgenticWorkflowEndpoint(self)
+
+    @property
+    def chunker(self):
+        return AsyncChunkerEndpoint(self)
+
+    @property
+    def conversation(self):
+        return AsyncConversationEndpoint(self)
+
+    @property
+    def embedder(self):
+        return AsyncEmbedderEndpoint(self)
+
+    @property
+    def file_manager(self):
+        return AsyncFileManagerEndpoint(self)
+
+    @property
+    def large_language_model(self):
+        return AsyncLargeLanguageModelEndpoint(self)
+
+    @property
+    def memory(self):
+        return AsyncMemoryEndpoint(self)
+
+    @property
+    def message(self):
+        return AsyncMessageEndpoint(self)
+
+    @property
+    def plugins(self):
+        return AsyncPluginsEndpoint(self)
+
+    @property
+    def rabbit_hole(self):
+        # kept for the life of the client, since it caches what it learns of the agents
+        if self.__rabbit_hole is None:
+            self.__rabbit_hole = AsyncRabbitHoleEndpoint(self)
+        return self.__rabbit_hole
+
+    @property
+    def users(self):
+        return AsyncUsersEndpoint(self)
+
+    @property
+    def utils(self):
+        return AsyncUtilsEndpoint(self)
+
+    @property
+    def custom(self):
+        return AsyncCustomEndpoint(self)
+
+    @property
+    def vector_database(self):
+        return AsyncVectorDatabaseEndpoint(self)
+
+    @property
+    def health_check(self):
+        return AsyncHealthCheckEndpoint(self)
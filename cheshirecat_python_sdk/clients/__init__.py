@@ -1,2 +1,21 @@
-from cheshirecat_python_sdk.clients.http_client import HttpClient
+from cheshirecat_python_sdk.clients.async_http_client import AsyncHttpClient, AsyncHttpSession
+from cheshirecat_python_sdk.clients.codec import (
+    JsonCodec,
+    MsgspecJsonCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    get_json_codec,
+)
+from cheshirecat_python_sdk.clients.deadline import Deadline, DeadlineExceeded, deadline
+from cheshirecat_python_sdk.clients.http_client import HttpClient, HttpSession
+from cheshirecat_python_sdk.clients.json_stream import JsonFragment, JsonStreamSplitter
+from cheshirecat_python_sdk.clients.multipart import MultipartStream
+from cheshirecat_python_sdk.clients.resilience import (
+    CircuitBreakerEvent,
+    CircuitBreakerPolicy,
+    CircuitOpenError,
+    RateLimiter,
+    RetryEvent,
+    RetryPolicy,
+)
 from cheshirecat_python_sdk.clients.websocket_client import WSClient
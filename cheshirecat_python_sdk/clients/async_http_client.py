@@ -0,0 +1,187 @@
+import asyncio
+import httpx
+from typing import Mapping, Tuple
+
+from cheshirecat_python_sdk.clients.base import BaseHttpClient
+from cheshirecat_python_sdk.clients.codec import JsonCodec
+from cheshirecat_python_sdk.clients.deadline import DeadlineExceeded, cap_timeout, fits_deadline, get_current_deadline
+from cheshirecat_python_sdk.clients.resilience import (
+    CircuitBreakerPolicy,
+    RetryEvent,
+    RetryPolicy,
+    TransportHook,
+    is_replayable,
+)
+
+
+def as_httpx_timeout(timeout: float | Tuple[float | None, float | None] | None) -> httpx.Timeout:
+    if not isinstance(timeout, tuple):
+        return httpx.Timeout(timeout)
+
+    connect, read = timeout
+    return httpx.Timeout(connect=connect, read=read, write=read, pool=connect)
+
+
+class AsyncHttpSession:
+    """
+    The asynchronous counterpart of HttpSession: a view over the pooled httpx.AsyncClient of an AsyncHttpClient, sending
+    its own set of headers with every request, with the same retry and circuit breaker semantics.
+    """
+    def __init__(self, client: "AsyncHttpClient", headers: Mapping[str, str]):
+        self.client = client
+        self.session = client.get_base_session()
+        self.headers = headers
+
+    async def request(self, method: str, url: str, stream: bool = False, **kwargs) -> httpx.Response:
+        headers = {**self.headers, **(kwargs.pop("headers", None) or {})}
+        timeout = kwargs.pop("timeout", (self.client.connect_timeout, self.client.read_timeout))
+        current_deadline = get_current_deadline()
+
+        body = kwargs.pop("json", None)
+        if body is not None:
+            # JSON bodies are encoded by the codec of the client, straight to bytes
+            kwargs["content"] = self.client.json_codec.dumps(body)
+            headers.setdefault("Content-Type", "application/json")
+
+        policy = self.client.retry_policy if is_replayable(kwargs) else None
+        breaker = self.client.circuit_breaker
+        host = self.client.get_netloc()
+
+        attempt = 0
+        while True:
+            if breaker:
+                breaker.before_request(host)
+
+            try:
+                request = self.session.build_request(
+                    method,
+                    url,
+                    headers=headers,
+                    timeout=as_httpx_timeout(cap_timeout(timeout, current_deadline)),
+                    **kwargs,
+                )
+                response = await self.session.send(request, stream=stream)
+            except httpx.TransportError as e:
+                if breaker:
+                    breaker.record_failure(host)
+                if current_deadline is not None and current_deadline.expired():
+                    raise DeadlineExceeded("The deadline of the call has been exceeded") from e
+                connect_failed = isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+                delay = policy.get_delay(attempt) if policy else 0.0
+                if (
+                    policy is None
+                    or attempt >= policy.max_retries
+                    or not policy.should_retry_error(method, connect_failed)
+                    or not fits_deadline(delay, current_deadline)
+                ):
+                    raise
+                reason, status_code = type(e).__name__, None
+            except BaseException:
+                # neither a response nor a transport failure, e.g. too many redirects or an interruption
+                if breaker:
+                    breaker.release(host)
+                raise
+            else:
+                if breaker:
+                    if response.status_code >= 500:
+                        breaker.record_failure(host)
+                    else:
+                        breaker.record_success(host)
+                delay = policy.get_delay(attempt, response.headers.get("Retry-After")) if policy else 0.0
+                if (
+                    policy is None
+                    or attempt >= policy.max_retries
+                    or not policy.should_retry_status(method, response.status_code)
+                    or not fits_deadline(delay, current_deadline)
+                ):
+                    return response
+                reason, status_code = f"HTTP {response.status_code}", response.status_code
+                await response.aclose()
+
+            attempt += 1
+            self.client.emit(RetryEvent(
+                method=method, url=url, attempt=attempt, delay=delay, reason=reason, status_code=status_code
+            ))
+            await asyncio.sleep(delay)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("DELETE", url, **kwargs)
+
+
+class AsyncHttpClient(BaseHttpClient):
+    def __init__(
+        self,
+        host: str,
+        port: int | None = None,
+        apikey: str | None = None,
+        is_https: bool = False,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker_policy: CircuitBreakerPolicy | None = None,
+        transport_hook: TransportHook | None = None,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        json_codec: JsonCodec | None = None,
+    ):
+        super().__init__(
+            host,
+            port,
+            apikey,
+            is_https,
+            retry_policy,
+            circuit_breaker_policy,
+            transport_hook,
+            connect_timeout,
+            read_timeout,
+            json_codec,
+        )
+
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+
+        self.__session: httpx.AsyncClient | None = None
+
+    def get_client(
+        self,
+        agent_id: str | None = None,
+        user_id: str | None = None,
+        chat_id: str | None = None,
+    ) -> AsyncHttpSession:
+        return AsyncHttpSession(self, self.get_headers(agent_id, user_id, chat_id))
+
+    def get_base_session(self) -> httpx.AsyncClient:
+        """
+        Returns the long-lived httpx.AsyncClient of the client, creating it on first use. The client owns the connection
+        pool, so that concurrent coroutines share the same keep-alive connections.
+        :return: httpx.AsyncClient, the pooled client
+        """
+        if self.__session is None:
+            self.__session = httpx.AsyncClient(
+                base_url=self.get_http_uri(),
+                limits=httpx.Limits(
+                    max_connections=self.pool_maxsize,
+                    max_keepalive_connections=self.pool_maxsize if self.keep_alive else 0,
+                ),
+                timeout=as_httpx_timeout((self.connect_timeout, self.read_timeout)),
+            )
+
+        return self.__session
+
+    async def close(self):
+        """
+        Closes the pooled client and all its connections. A new client is created if this one is used again.
+        """
+        session, self.__session = self.__session, None
+
+        if session is not None:
+            await session.aclose()
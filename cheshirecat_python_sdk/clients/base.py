@@ -0,0 +1,138 @@
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping
+from urllib.parse import urlunparse
+
+from cheshirecat_python_sdk.clients.codec import JsonCodec, get_json_codec
+from cheshirecat_python_sdk.clients.resilience import (
+    CircuitBreaker,
+    CircuitBreakerEvent,
+    CircuitBreakerPolicy,
+    RetryEvent,
+    RetryPolicy,
+    TransportHook,
+)
+
+
+class BaseHttpClient(ABC):
+    """
+    Common ground of the synchronous and asynchronous HTTP clients. The headers of a request are never stored on the
+    client: they are built from scratch for each (agent_id, user_id, chat_id) combination, frozen and cached, so that
+    one client can be safely shared by many threads or coroutines.
+    """
+    headers_cache_size = 1024
+
+    def __init__(
+        self,
+        host: str,
+        port: int | None = None,
+        apikey: str | None = None,
+        is_https: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker_policy: CircuitBreakerPolicy | None = None,
+        transport_hook: TransportHook | None = None,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        json_codec: JsonCodec | None = None,
+    ):
+        self.host = host
+        self.port = port
+        self.apikey = apikey
+        self.token = None
+        self.is_https = is_https
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.json_codec = json_codec or get_json_codec()
+
+        self.retry_policy = retry_policy
+        self.transport_hook = transport_hook
+        self.circuit_breaker = (
+            CircuitBreaker(circuit_breaker_policy, transport_hook) if circuit_breaker_policy else None
+        )
+
+        self.middlewares: List[Callable[[Dict[str, str], str | None, str | None, str | None], None]] = [
+            self.__before_secure_request,
+            self.__before_jwt_request,
+        ]
+        self.__cached_headers = lru_cache(maxsize=self.headers_cache_size)(self.__build_headers)
+
+    def set_token(self, token: str):
+        self.token = token
+        # swap the cache rather than clearing it, so that a concurrent request can never store stale headers in it
+        self.__cached_headers = lru_cache(maxsize=self.headers_cache_size)(self.__build_headers)
+        return self
+
+    def get_http_uri(self) -> str:
+        scheme = "https" if self.is_https else "http"
+
+        return urlunparse((scheme, self.get_netloc(), "", "", "", ""))
+
+    def get_netloc(self) -> str:
+        return f"{self.host}:{self.port}" if self.port else self.host
+
+    def emit(self, event: RetryEvent | CircuitBreakerEvent):
+        if self.transport_hook:
+            self.transport_hook(event)
+
+    def __before_secure_request(
+        self, headers: Dict[str, str], agent_id: str | None, user_id: str | None, chat_id: str | None
+    ):
+        if self.apikey:
+            headers["Authorization"] = f"Bearer {self.apikey}"
+        if agent_id:
+            headers["X-Agent-ID"] = agent_id
+        if user_id:
+            headers["X-User-ID"] = user_id
+        if chat_id:
+            headers["X-Chat-ID"] = chat_id
+
+    def __before_jwt_request(
+        self, headers: Dict[str, str], agent_id: str | None, user_id: str | None, chat_id: str | None
+    ):
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        if agent_id:
+            headers["X-Agent-ID"] = agent_id
+        if chat_id:
+            headers["X-Chat-ID"] = chat_id
+
+    def __build_headers(
+        self, agent_id: str | None, user_id: str | None, chat_id: str | None
+    ) -> Mapping[str, str]:
+        headers = {}
+        for middleware in self.middlewares:
+            middleware(headers, agent_id, user_id, chat_id)
+
+        return MappingProxyType(headers)
+
+    def get_headers(
+        self,
+        agent_id: str | None = None,
+        user_id: str | None = None,
+        chat_id: str | None = None,
+    ) -> Mapping[str, str]:
+        """
+        Returns the read-only set of headers to send for the given agent, user and chat.
+        :param agent_id: The agent ID (optional).
+        :param user_id: The user ID (optional).
+        :param chat_id: The chat ID (optional).
+        :return: Mapping[str, str], the headers
+        """
+        if not self.apikey and not self.token:
+            raise ValueError("You must provide an apikey or a token")
+
+        return self.__cached_headers(agent_id, user_id, chat_id)
+
+    @abstractmethod
+    def get_client(
+        self,
+        agent_id: str | None = None,
+        user_id: str | None = None,
+        chat_id: str | None = None,
+    ) -> Any:
+        pass
+
+    @abstractmethod
+    def get_base_session(self) -> Any:
+        pass
@@ -0,0 +1,104 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Type
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # msgspec is optional
+    msgspec = None
+
+
+class JsonCodec(ABC):
+    """
+    Encodes request bodies and decodes response bodies and websocket frames. Bodies are encoded straight to bytes and
+    decoded from bytes, so that no intermediate str is built on the way.
+    """
+    name: str
+
+    @abstractmethod
+    def dumps(self, data: Any, sort_keys: bool = False) -> bytes:
+        pass
+
+    @abstractmethod
+    def loads(self, data: bytes | str) -> Any:
+        pass
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class StdlibJsonCodec(JsonCodec):
+    name = "json"
+
+    def dumps(self, data: Any, sort_keys: bool = False) -> bytes:
+        return json.dumps(data, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed: pip install cheshirecat-python-sdk[orjson]")
+
+    def dumps(self, data: Any, sort_keys: bool = False) -> bytes:
+        # non-str keys are allowed, as the json module does
+        options = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(data, option=options)
+
+    def loads(self, data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecJsonCodec(JsonCodec):
+    name = "msgspec"
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError("msgspec is not installed: pip install cheshirecat-python-sdk[msgspec]")
+        self.__encoder = msgspec.json.Encoder()
+        self.__sorted_encoder = msgspec.json.Encoder(order="sorted")
+        self.__decoder = msgspec.json.Decoder()
+
+    def dumps(self, data: Any, sort_keys: bool = False) -> bytes:
+        return (self.__sorted_encoder if sort_keys else self.__encoder).encode(data)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self.__decoder.decode(data)
+
+
+JSON_CODECS: Dict[str, Type[JsonCodec]] = {
+    StdlibJsonCodec.name: StdlibJsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecJsonCodec.name: MsgspecJsonCodec,
+}
+
+
+def get_json_codec(codec: str | JsonCodec = "auto") -> JsonCodec:
+    """
+    Returns the codec with the given name, or the fastest one installed for "auto": orjson, then msgspec, then the
+    json module of the standard library.
+    :param codec: The name of the codec, "auto", or a codec instance, returned as it is.
+    :return: JsonCodec, the codec
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+
+    if codec == "auto":
+        if orjson is not None:
+            return OrjsonCodec()
+        if msgspec is not None:
+            return MsgspecJsonCodec()
+        return StdlibJsonCodec()
+
+    if codec not in JSON_CODECS:
+        raise ValueError(f"Unknown JSON codec: {codec}. Choose among auto, {', '.join(JSON_CODECS)}")
+    return JSON_CODECS[codec]()
@@ -0,0 +1,97 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Tuple
+
+
+class DeadlineExceeded(TimeoutError):
+    pass
+
+
+class Deadline:
+    """
+    A point in time by which a whole SDK call, retries and websocket receive loops included, must be completed.
+    """
+    __slots__ = ("expires_at",)
+
+    def __init__(self, timeout: float):
+        self.expires_at = time.monotonic() + timeout
+
+    def remaining(self) -> float:
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def check(self):
+        if self.expired():
+            raise DeadlineExceeded("The deadline of the call has been exceeded")
+
+    def cap(self, timeout: float | None) -> float:
+        """
+        Shortens the given timeout so that it does not outlive the deadline.
+        :param timeout: The timeout to cap, None meaning no timeout.
+        :return: float, the capped timeout
+        """
+        self.check()
+        remaining = self.remaining()
+        return remaining if timeout is None else min(timeout, remaining)
+
+
+_current_deadline: ContextVar[Deadline | None] = ContextVar("cheshirecat_deadline", default=None)
+
+
+def get_current_deadline() -> Deadline | None:
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline(timeout: float | None) -> Iterator[Deadline | None]:
+    """
+    Gives every SDK call performed inside the block, in the current thread or task, a budget of `timeout` seconds.
+    Nested blocks can only shorten the budget of the outer ones. A None timeout leaves the current budget untouched.
+
+    Example:
+        with deadline(30):
+            client.message.send_http_message(message, "agent", "user")
+
+    :param timeout: The budget in seconds.
+    :return: Deadline | None, the deadline in force inside the block
+    """
+    current = _current_deadline.get()
+    if timeout is None:
+        yield current
+        return
+
+    new = Deadline(timeout)
+    if current is not None and current.expires_at < new.expires_at:
+        new = current
+
+    token = _current_deadline.set(new)
+    try:
+        yield new
+    finally:
+        _current_deadline.reset(token)
+
+
+def cap_timeout(
+    timeout: float | Tuple[float | None, float | None] | None, current_deadline: Deadline | None
+) -> float | Tuple[float, float] | None:
+    """
+    Shortens a requests-style timeout, either a single value or a (connect, read) tuple, to fit the given deadline.
+    :param timeout: The timeout to cap.
+    :param current_deadline: The deadline in force, if any.
+    :return: The capped timeout
+    """
+    if current_deadline is None:
+        return timeout
+    if isinstance(timeout, tuple):
+        return tuple(current_deadline.cap(value) for value in timeout)  # type: ignore
+    return current_deadline.cap(timeout)
+
+
+def fits_deadline(delay: float, current_deadline: Deadline | None) -> bool:
+    """
+    Tells whether waiting for `delay` seconds still leaves some room before the deadline.
+    """
+    return current_deadline is None or delay < current_deadline.remaining()
@@ -1,79 +1,208 @@
+import threading
+import time
+from requests import Response
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, ConnectTimeout, Timeout
 from requests_toolbelt.sessions import BaseUrlSession
-from urllib.parse import urlunparse
-from typing import Callable, List
+from typing import Mapping
+from urllib3.exceptions import NewConnectionError
 
+from cheshirecat_python_sdk.clients.base import BaseHttpClient
+from cheshirecat_python_sdk.clients.codec import JsonCodec
+from cheshirecat_python_sdk.clients.deadline import DeadlineExceeded, cap_timeout, fits_deadline, get_current_deadline
+from cheshirecat_python_sdk.clients.resilience import (
+    CircuitBreakerPolicy,
+    RetryEvent,
+    RetryPolicy,
+    TransportHook,
+    is_replayable,
+)
 
-class HttpClient:
+
+def is_connect_failure(error: Exception) -> bool:
+    """
+    Tells whether the request failed before reaching the server, so that it is safe to send it again.
+    """
+    if isinstance(error, ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+class HttpSession:
+    """
+    A lightweight view over the pooled session of an HttpClient: every request sent through it carries its own set of
+    headers, so that the shared session is never mutated between calls. Requests are retried according to the retry
+    policy of the client, and go through its circuit breaker, if any.
+    """
+    def __init__(self, client: "HttpClient", headers: Mapping[str, str]):
+        self.client = client
+        self.session = client.get_base_session()
+        self.headers = headers
+
+    def request(self, method: str, url: str, **kwargs) -> Response:
+        headers = {**self.headers, **(kwargs.pop("headers", None) or {})}
+        timeout = kwargs.pop("timeout", (self.client.connect_timeout, self.client.read_timeout))
+        current_deadline = get_current_deadline()
+
+        body = kwargs.pop("json", None)
+        if body is not None:
+            # JSON bodies are encoded by the codec of the client, straight to bytes
+            kwargs["data"] = self.client.json_codec.dumps(body)
+            headers.setdefault("Content-Type", "application/json")
+
+        policy = self.client.retry_policy if is_replayable(kwargs) else None
+        breaker = self.client.circuit_breaker
+        host = self.client.get_netloc()
+
+        attempt = 0
+        while True:
+            if breaker:
+                breaker.before_request(host)
+
+            try:
+                response = self.session.request(
+                    method, url, headers=headers, timeout=cap_timeout(timeout, current_deadline), **kwargs
+                )
+            except (ConnectionError, Timeout) as e:
+                if breaker:
+                    breaker.record_failure(host)
+                if current_deadline is not None and current_deadline.expired():
+                    raise DeadlineExceeded("The deadline of the call has been exceeded") from e
+                delay = policy.get_delay(attempt) if policy else 0.0
+                if (
+                    policy is None
+                    or attempt >= policy.max_retries
+                    or not policy.should_retry_error(method, is_connect_failure(e))
+                    or not fits_deadline(delay, current_deadline)
+                ):
+                    raise
+                reason, status_code = type(e).__name__, None
+            except BaseException:
+                # neither a response nor a transport failure, e.g. too many redirects or an interruption
+                if breaker:
+                    breaker.release(host)
+                raise
+            else:
+                if breaker:
+                    if response.status_code >= 500:
+                        breaker.record_failure(host)
+                    else:
+                        breaker.record_success(host)
+                delay = policy.get_delay(attempt, response.headers.get("Retry-After")) if policy else 0.0
+                if (
+                    policy is None
+                    or attempt >= policy.max_retries
+                    or not policy.should_retry_status(method, response.status_code)
+                    or not fits_deadline(delay, current_deadline)
+                ):
+                    return response
+                reason, status_code = f"HTTP {response.status_code}", response.status_code
+                response.close()
+
+            attempt += 1
+            self.client.emit(RetryEvent(
+                method=method, url=url, attempt=attempt, delay=delay, reason=reason, status_code=status_code
+            ))
+            time.sleep(delay)
+
+    def get(self, url: str, **kwargs) -> Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> Response:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> Response:
+        return self.request("DELETE", url, **kwargs)
+
+
+class HttpClient(BaseHttpClient):
     def __init__(
         self,
         host: str,
         port: int | None = None,
         apikey: str | None = None,
-        is_https: bool = False
+        is_https: bool = False,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker_policy: CircuitBreakerPolicy | None = None,
+        transport_hook: TransportHook | None = None,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        json_codec: JsonCodec | None = None,
     ):
-        self.host = host
-        self.port = port
-        self.apikey = apikey
-        self.token = None
-        self.agent_id = None
-        self.user_id = None
-        self.chat_id = None
-        self.is_https = is_https
-        self.headers = {}
-
-        self.middlewares: List[Callable] = [
-            self.__before_secure_request,
-            self.__before_jwt_request,
-        ]
-
-    def set_token(self, token: str):
-        self.token = token
-        return self
-
-    def get_http_uri(self) -> str:
-        scheme = "https" if self.is_https else "http"
-        netloc = f"{self.host}:{self.port}" if self.port else self.host
-
-        return urlunparse((scheme, netloc, "", "", "", ""))
-
-    def __before_secure_request(self):
-        if self.apikey:
-            self.headers["Authorization"] = f"Bearer {self.apikey}"
-        if self.agent_id:
-            self.headers["X-Agent-ID"] = self.agent_id
-        if self.user_id:
-            self.headers["X-User-ID"] = self.user_id
-        if self.chat_id:
-            self.headers["X-Chat-ID"] = self.chat_id
-
-    def __before_jwt_request(self):
-        if self.token:
-            self.headers["Authorization"] = f"Bearer {self.token}"
-        if self.agent_id:
-            self.headers["X-Agent-ID"] = self.agent_id
-        if self.chat_id:
-            self.headers["X-Chat-ID"] = self.chat_id
+        super().__init__(
+            host,
+            port,
+            apikey,
+            is_https,
+            retry_policy,
+            circuit_breaker_policy,
+            transport_hook,
+            connect_timeout,
+            read_timeout,
+            json_codec,
+        )
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+
+        self.__session: BaseUrlSession | None = None
+        self.__session_lock = threading.Lock()
 
     def get_client(
         self,
         agent_id: str | None = None,
         user_id: str | None = None,
         chat_id: str | None = None,
-    ) -> BaseUrlSession:
-        if not self.apikey and not self.token:
-            raise ValueError("You must provide an apikey or a token")
-
-        self.agent_id = agent_id
-        self.user_id = user_id
-        self.chat_id = chat_id
+    ) -> HttpSession:
+        return HttpSession(self, self.get_headers(agent_id, user_id, chat_id))
 
-        for middleware in self.middlewares:
-            middleware()
+    def get_base_session(self) -> BaseUrlSession:
+        """
+        Returns the long-lived session of the client, creating it on first use. The session owns the connection pools,
+        so that TCP and TLS handshakes are paid once per host instead of once per request.
+        :return: BaseUrlSession, the pooled session
+        """
+        session = self.__session
+        if session is not None:
+            return session
 
-        return self.get_base_session()
+        with self.__session_lock:
+            if self.__session is None:
+                self.__session = self.__create_session()
+            return self.__session
 
-    def get_base_session(self) -> BaseUrlSession:
+    def __create_session(self) -> BaseUrlSession:
         session = BaseUrlSession(base_url=self.get_http_uri())
-        session.headers = self.headers
+
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
 
         return session
+
+    def close(self):
+        """
+        Closes the pooled session and all its connections. A new session is created if the client is used again.
+        """
+        with self.__session_lock:
+            session, self.__session = self.__session, None
+
+        if session is not None:
+            session.close()
@@ -0,0 +1,218 @@
+import json
+import re
+from typing import List, NamedTuple, Sequence, Tuple
+
+JsonPath = Tuple[str, ...]
+
+_STRUCTURAL = re.compile(rb'["\[\]{}]')
+_STRING_TAIL = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_NON_WHITESPACE = re.compile(rb"[^ \t\n\r]")
+_SCALAR_END = re.compile(rb"[ \t\n\r,\]}]")
+
+_QUOTE, _COLON, _COMMA = ord('"'), ord(":"), ord(",")
+_OPEN_OBJECT, _CLOSE_OBJECT, _OPEN_ARRAY, _CLOSE_ARRAY = ord("{"), ord("}"), ord("["), ord("]")
+
+# what the splitter expects next
+_VALUE, _ITEM, _KEY, _KEY_SEPARATOR, _NEXT, _CAPTURE, _DONE = range(7)
+
+
+class JsonFragment(NamedTuple):
+    path: JsonPath  # the keys leading to the value or, for an item, to its array
+    data: bytes  # the JSON text of the value
+    item: bool  # whether the value is an item of one of the arrays split
+
+
+class JsonStreamSplitter:
+    """
+    Splits a JSON document, fed in chunks as they come from the network, into the items of some of its arrays, so that
+    each item can be decoded and dropped before the next one is read. Only the objects leading to those arrays are
+    parsed: any other value is returned whole, as a fragment with its path. The memory held is bounded by the size of
+    the largest item, plus the size of a chunk, however large the document is.
+
+    Arrays are given by the keys leading to them, "*" matching any key, e.g. ("vectors", "collections", "*") for the
+    memory points of every collection of a recall, or () for a document made of an array.
+
+    Example:
+        splitter = JsonStreamSplitter([("points",)])
+        for chunk in chunks:
+            for fragment in splitter.feed(chunk):
+                ...
+        fragments = splitter.close()
+    """
+    def __init__(self, arrays: Sequence[JsonPath]):
+        self.arrays = [tuple(array) for array in arrays]
+
+        self.__buffer = bytearray()
+        self.__pos = 0
+        self.__state = _VALUE
+        self.__stack: List[list] = []  # [path, is split, current key] of the open containers
+
+        # the value being captured
+        self.__start = 0
+        self.__scan = 0
+        self.__depth = 0
+        self.__path: JsonPath = ()
+        self.__item = False
+
+    def feed(self, chunk: bytes) -> List[JsonFragment]:
+        """
+        Adds a chunk of the document.
+        :param chunk: The next bytes of the document.
+        :return: List[JsonFragment], the values completed by the chunk
+        """
+        self.__buffer += chunk
+        fragments: List[JsonFragment] = []
+        while self.__step(fragments, False):
+            pass
+
+        # drop what has been consumed, so that the buffer does not grow with the document
+        consumed = self.__start if self.__state == _CAPTURE else self.__pos
+        if consumed:
+            del self.__buffer[:consumed]
+            self.__pos -= consumed
+            self.__scan -= consumed
+            self.__start -= consumed
+
+        return fragments
+
+    def close(self) -> List[JsonFragment]:
+        """
+        Ends the document, checking that it is complete.
+        :return: List[JsonFragment], the values completed by the end of the document
+        """
+        fragments: List[JsonFragment] = []
+        while self.__step(fragments, True):
+            pass
+
+        if self.__state != _DONE or _NON_WHITESPACE.search(self.__buffer, self.__pos):
+            raise ValueError("The JSON document is truncated")
+        return fragments
+
+    def __is_split(self, path: JsonPath) -> bool:
+        return any(self.__matches(path, array) for array in self.arrays)
+
+    def __leads_to_split(self, path: JsonPath) -> bool:
+        return any(len(path) < len(array) and self.__matches(path, array[:len(path)]) for array in self.arrays)
+
+    @staticmethod
+    def __matches(path: JsonPath, pattern: JsonPath) -> bool:
+        return len(path) == len(pattern) and all(
+            key == expected or expected == "*" for key, expected in zip(path, pattern)
+        )
+
+    def __close_container(self, pos: int):
+        self.__stack.pop()
+        self.__pos = pos + 1
+        self.__state = _NEXT if self.__stack else _DONE
+
+    def __step(self, fragments: List[JsonFragment], final: bool) -> bool:
+        if self.__state == _CAPTURE:
+            return self.__capture(fragments, final)
+
+        buffer = self.__buffer
+        match = _NON_WHITESPACE.search(buffer, self.__pos)
+        if match is None:
+            self.__pos = len(buffer)
+            return False
+
+        pos = match.start()
+        char = buffer[pos]
+        state = self.__state
+
+        if state in (_VALUE, _ITEM):
+            if state == _ITEM and char == _CLOSE_ARRAY:
+                self.__close_container(pos)
+                return True
+
+            frame = self.__stack[-1] if self.__stack else None
+            if frame is None:
+                path, item = (), False
+            elif frame[1]:
+                path, item = frame[0], True
+            else:
+                path, item = frame[0] + (frame[2],), False
+
+            if not item and char == _OPEN_OBJECT and self.__leads_to_split(path):
+                self.__stack.append([path, False, None])
+                self.__pos, self.__state = pos + 1, _KEY
+            elif not item and char == _OPEN_ARRAY and self.__is_split(path):
+                self.__stack.append([path, True, None])
+                self.__pos, self.__state = pos + 1, _ITEM
+            else:
+                self.__start = self.__scan = pos
+                self.__depth = 0
+                self.__path, self.__item = path, item
+                self.__state = _CAPTURE
+            return True
+
+        if state == _KEY:
+            if char == _CLOSE_OBJECT:
+                self.__close_container(pos)
+                return True
+            if char != _QUOTE:
+                raise ValueError(f"Invalid JSON document: expected a key, got {chr(char)!r}")
+            tail = _STRING_TAIL.match(buffer, pos + 1)
+            if tail is None:
+                self.__pos = pos
+                return False
+            self.__stack[-1][2] = json.loads(buffer[pos:tail.end()])
+            self.__pos, self.__state = tail.end(), _KEY_SEPARATOR
+            return True
+
+        if state == _KEY_SEPARATOR:
+            if char != _COLON:
+                raise ValueError(f"Invalid JSON document: expected ':', got {chr(char)!r}")
+            self.__pos, self.__state = pos + 1, _VALUE
+            return True
+
+        if state == _NEXT:
+            if char == _COMMA:
+                self.__pos = pos + 1
+                self.__state = _ITEM if self.__stack[-1][1] else _KEY
+            elif char in (_CLOSE_OBJECT, _CLOSE_ARRAY):
+                self.__close_container(pos)
+            else:
+                raise ValueError(f"Invalid JSON document: expected ',' or the end of a container, got {chr(char)!r}")
+            return True
+
+        raise ValueError("Invalid JSON document: unexpected data after its end")
+
+    def __capture(self, fragments: List[JsonFragment], final: bool) -> bool:
+        buffer, start = self.__buffer, self.__start
+
+        if buffer[start] not in (_OPEN_OBJECT, _OPEN_ARRAY, _QUOTE):
+            # a number, a boolean or null: it ends where a separator or the document does
+            match = _SCALAR_END.search(buffer, self.__scan)
+            if match is None and not final:
+                self.__scan = len(buffer)
+                return False
+            end = match.start() if match is not None else len(buffer)
+        else:
+            # skips straight to the brackets and quotes, and from the quotes to the end of the strings, so that long
+            # runs of numbers, like vectors, are crossed without looking at each byte in Python
+            pos, depth = self.__scan, self.__depth
+            while True:
+                match = _STRUCTURAL.search(buffer, pos)
+                if match is None:
+                    self.__scan, self.__depth = len(buffer), depth
+                    return False
+
+                char = buffer[match.start()]
+                if char == _QUOTE:
+                    tail = _STRING_TAIL.match(buffer, match.end())
+                    if tail is None:
+                        self.__scan, self.__depth = match.start(), depth
+                        return False
+                    pos = tail.end()
+                else:
+                    depth += 1 if char in (_OPEN_OBJECT, _OPEN_ARRAY) else -1
+                    pos = match.end()
+
+                if depth == 0:
+                    break
+            end = pos
+
+        fragments.append(JsonFragment(self.__path, bytes(buffer[start:end]), self.__item))
+        self.__pos = end
+        self.__state = _NEXT if self.__stack else _DONE
+        return True
@@ -0,0 +1,157 @@
+import asyncio
+import os
+import uuid
+from typing import Any, AsyncIterable, AsyncIterator, BinaryIO, Callable, Dict, Iterable, Iterator, List, Tuple
+
+# what a file can be uploaded from: a path, its content, a binary file-like object, or an iterable of chunks
+UploadSource = str | os.PathLike | bytes | bytearray | memoryview | BinaryIO | Iterable[bytes] | AsyncIterable[bytes]
+UploadFile = Tuple[str, Tuple[str, UploadSource, str]]  # (field name, (file name, source, content type))
+
+# called with the bytes sent so far and the total size of the body, None if unknown
+ProgressCallback = Callable[[int, int | None], None]
+
+CHUNK_SIZE = 64 * 1024
+
+
+def is_path(source: Any) -> bool:
+    return isinstance(source, (str, os.PathLike))
+
+
+def get_source_size(source: Any) -> int | None:
+    """
+    Returns the number of bytes a source will produce, or None if it cannot be known before reading it.
+    """
+    if is_path(source):
+        return os.path.getsize(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return memoryview(source).nbytes
+    if hasattr(source, "read"):
+        try:
+            position = source.tell()
+            end = source.seek(0, os.SEEK_END)
+            source.seek(position)
+            return end - position
+        except (AttributeError, OSError, ValueError):  # not seekable
+            return None
+    return None
+
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+class MultipartStream:
+    """
+    A multipart/form-data body produced chunk by chunk while it is sent, so that files are read from their source a
+    chunk at a time instead of being assembled in memory. The size of the body is known in advance, and sent as
+    Content-Length, unless a source is a non-seekable stream or an iterator, in which case the body is sent chunked.
+
+    The body can be iterated over once: the file-like sources are read from their current position, and are not closed,
+    while the files given by path are opened and closed along the way.
+    """
+    def __init__(
+        self,
+        data: Dict[str, Any] | None = None,
+        files: List[UploadFile] | None = None,
+        on_progress: ProgressCallback | None = None,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self.on_progress = on_progress
+        self.chunk_size = chunk_size
+        self.sent = 0
+
+        self.__parts: List[Tuple[bytes, Any]] = []  # (headers, body) of each part
+        for name, value in (data or {}).items():
+            body = value if isinstance(value, (bytes, bytearray, memoryview)) else str(value).encode()
+            self.__parts.append((self.__get_part_headers(name), body))
+        for name, (file_name, source, content_type) in files or []:
+            self.__parts.append((self.__get_part_headers(name, file_name, content_type), source))
+        self.__closing = f"--{self.boundary}--\r\n".encode()
+
+        # read as "len" by requests, which sends the body chunked when it is None
+        sizes = [get_source_size(body) for _, body in self.__parts]
+        self.len = None if None in sizes else (
+            sum(len(headers) + size + 2 for (headers, _), size in zip(self.__parts, sizes)) + len(self.__closing)
+        )
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        headers = {"Content-Type": self.content_type}
+        if self.len is not None:
+            headers["Content-Length"] = str(self.len)
+        return headers
+
+    def __get_part_headers(self, name: str, file_name: str | None = None, content_type: str | None = None) -> bytes:
+        disposition = f'form-data; name="{_quote(name)}"'
+        if file_name is not None:
+            disposition += f'; filename="{_quote(file_name)}"'
+
+        headers = f"--{self.boundary}\r\nContent-Disposition: {disposition}\r\n"
+        if content_type:
+            headers += f"Content-Type: {content_type}\r\n"
+        return (headers + "\r\n").encode()
+
+    def __advance(self, chunk: bytes) -> bytes:
+        self.sent += len(chunk)
+        if self.on_progress is not None:
+            self.on_progress(self.sent, self.len)
+        return chunk
+
+    def __iter_source(self, source: Any) -> Iterator[bytes]:
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            view = memoryview(source).cast("B")
+            for start in range(0, len(view), self.chunk_size):
+                yield bytes(view[start:start + self.chunk_size])
+        elif is_path(source):
+            with open(source, "rb") as file:
+                yield from iter(lambda: file.read(self.chunk_size), b"")
+        elif hasattr(source, "read"):
+            yield from iter(lambda: source.read(self.chunk_size), b"")
+        elif isinstance(source, Iterable):
+            yield from source
+        else:
+            raise TypeError(f"Cannot upload from {type(source).__name__} synchronously")
+
+    async def __aiter_source(self, source: Any) -> AsyncIterator[bytes]:
+        # the files are read in the executor, so that the event loop is never blocked on the disk
+        loop = asyncio.get_running_loop()
+        if isinstance(source, AsyncIterable):
+            async for chunk in source:
+                yield chunk
+        elif is_path(source):
+            file = await loop.run_in_executor(None, open, source, "rb")
+            try:
+                while chunk := await loop.run_in_executor(None, file.read, self.chunk_size):
+                    yield chunk
+            finally:
+                file.close()
+        elif hasattr(source, "read"):
+            while chunk := await loop.run_in_executor(None, source.read, self.chunk_size):
+                yield chunk
+        else:
+            for chunk in self.__iter_source(source):
+                yield chunk
+
+    def __iter__(self) -> Iterator[bytes]:
+        for headers, source in self.__parts:
+            yield self.__advance(headers)
+            for chunk in self.__iter_source(source):
+                if chunk:
+                    yield self.__advance(chunk)
+            yield self.__advance(b"\r\n")
+        yield self.__advance(self.__closing)
+
+    async def aiter(self) -> AsyncIterator[bytes]:
+        """
+        Iterates over the body asynchronously, taking the chunks of asynchronous iterables as well, and reading the files
+        in the executor.
+        """
+        for headers, source in self.__parts:
+            yield self.__advance(headers)
+            async for chunk in self.__aiter_source(source):
+                if chunk:
+                    yield self.__advance(chunk)
+            yield self.__advance(b"\r\n")
+        yield self.__advance(self.__closing)
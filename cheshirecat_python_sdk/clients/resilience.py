@@ -0,0 +1,231 @@
+import asyncio
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Set
+from pydantic import BaseModel, Field
+
+from cheshirecat_python_sdk.enums import CircuitState
+
+
+class RetryPolicy(BaseModel):
+    """
+    How failed requests are retried. Idempotent methods are retried on connection errors and on the statuses in
+    `retry_on_status`; the other methods only when the request surely did not reach the server, i.e. when the
+    connection could not be established or the server answered 429/503.
+    """
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    backoff_max: float = 30.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+    retry_on_status: Set[int] = Field(default_factory=lambda: {429, 502, 503, 504})
+    idempotent_methods: Set[str] = Field(default_factory=lambda: {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def is_idempotent(self, method: str) -> bool:
+        return method.upper() in self.idempotent_methods
+
+    def should_retry_status(self, method: str, status_code: int) -> bool:
+        if status_code not in self.retry_on_status:
+            return False
+        return self.is_idempotent(method) or status_code in (429, 503)
+
+    def should_retry_error(self, method: str, connect_failed: bool) -> bool:
+        return connect_failed or self.is_idempotent(method)
+
+    def get_delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """
+        Computes how long to wait before the given retry attempt (0-based): the value of the Retry-After header when
+        present, an exponential backoff with full jitter otherwise. The delay never exceeds `backoff_max`.
+        :param attempt: The number of retries already performed.
+        :param retry_after: The value of the Retry-After header of the response, if any.
+        :return: float, the delay in seconds
+        """
+        if retry_after and self.respect_retry_after:
+            delay = parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self.backoff_max)
+
+        delay = min(self.backoff_max, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+class CircuitBreakerPolicy(BaseModel):
+    failure_threshold: int = 5
+    recovery_timeout: float = 30.0
+
+
+class RetryEvent(BaseModel):
+    method: str
+    url: str
+    attempt: int
+    delay: float
+    reason: str
+    status_code: int | None = None
+
+
+class CircuitBreakerEvent(BaseModel):
+    host: str
+    previous_state: CircuitState
+    state: CircuitState
+
+
+TransportHook = Callable[[RetryEvent | CircuitBreakerEvent], None]
+
+
+class CircuitOpenError(RuntimeError):
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"Circuit breaker open for {host}: failing fast for the next {retry_in:.1f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "opened_at", "probing")
+
+    def __init__(self):
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+
+
+class CircuitBreaker:
+    """
+    A per-host circuit breaker. After `failure_threshold` consecutive failures the circuit opens and every request
+    fails fast with CircuitOpenError; after `recovery_timeout` seconds a single probe request is let through
+    (half-open), which closes the circuit on success or opens it again on failure.
+    """
+    def __init__(self, policy: CircuitBreakerPolicy, hook: TransportHook | None = None):
+        self.policy = policy
+        self.hook = hook
+        self.__circuits: Dict[str, _Circuit] = {}
+        self.__lock = threading.Lock()
+
+    def get_state(self, host: str) -> CircuitState:
+        with self.__lock:
+            circuit = self.__circuits.get(host)
+            return circuit.state if circuit else CircuitState.CLOSED
+
+    def before_request(self, host: str):
+        with self.__lock:
+            circuit = self.__circuits.setdefault(host, _Circuit())
+            if circuit.state == CircuitState.CLOSED:
+                return
+
+            elapsed = time.monotonic() - circuit.opened_at
+            if circuit.state == CircuitState.OPEN and elapsed >= self.policy.recovery_timeout:
+                self.__transition(host, circuit, CircuitState.HALF_OPEN)
+
+            if circuit.state == CircuitState.HALF_OPEN and not circuit.probing:
+                circuit.probing = True
+                return
+
+        raise CircuitOpenError(host, max(self.policy.recovery_timeout - elapsed, 0.0))
+
+    def record_success(self, host: str):
+        with self.__lock:
+            circuit = self.__circuits.setdefault(host, _Circuit())
+            circuit.failures = 0
+            circuit.probing = False
+            if circuit.state != CircuitState.CLOSED:
+                self.__transition(host, circuit, CircuitState.CLOSED)
+
+    def record_failure(self, host: str):
+        with self.__lock:
+            circuit = self.__circuits.setdefault(host, _Circuit())
+            circuit.failures += 1
+            circuit.probing = False
+            if circuit.state == CircuitState.HALF_OPEN or (
+                circuit.state == CircuitState.CLOSED and circuit.failures >= self.policy.failure_threshold
+            ):
+                circuit.opened_at = time.monotonic()
+                self.__transition(host, circuit, CircuitState.OPEN)
+
+    def release(self, host: str):
+        """
+        Ends a request let through by `before_request` without recording its outcome, e.g. when it was interrupted or
+        failed on the client side, so that the next request can probe the host if the circuit is half-open.
+        """
+        with self.__lock:
+            circuit = self.__circuits.get(host)
+            if circuit is not None:
+                circuit.probing = False
+
+    def __transition(self, host: str, circuit: _Circuit, state: CircuitState):
+        previous_state, circuit.state = circuit.state, state
+        if self.hook:
+            self.hook(CircuitBreakerEvent(host=host, previous_state=previous_state, state=state))
+
+
+class RateLimiter:
+    """
+    Spaces requests out to at most `rate` per second, letting bursts of up to `burst` requests through at once. It is
+    shared by threads and coroutines alike: each caller books the next free slot and waits until then, so that the
+    callers are served in order.
+    """
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("The rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.__next_slot = 0.0
+        self.__lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Books the next slot.
+        :return: float, the number of seconds to wait before sending the request
+        """
+        interval = 1.0 / self.rate
+        with self.__lock:
+            now = time.monotonic()
+            slot = max(self.__next_slot, now - (self.burst - 1) * interval)
+            self.__next_slot = slot + interval
+            return max(0.0, slot - now)
+
+    def acquire(self):
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def aacquire(self):
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def is_replayable(request_options: Dict) -> bool:
+    """
+    Tells whether a request can be sent again as it is: uploads and streamed bodies are consumed by the first attempt.
+    :param request_options: The keyword arguments of the request.
+    :return: bool, True if the request can be retried
+    """
+    if request_options.get("files"):
+        return False
+
+    data = request_options.get("data", request_options.get("content"))
+    return data is None or isinstance(data, (dict, str, bytes))
+
+
+def parse_retry_after(value: str) -> float | None:
+    """
+    Parses the value of a Retry-After header, expressed either in seconds or as an HTTP date.
+    :param value: The header value.
+    :return: float | None, the number of seconds to wait, or None if the value cannot be parsed
+    """
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
@@ -1,6 +1,54 @@
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Tuple
 from urllib.parse import urlencode
 from websockets import connect, ClientConnection
 from websockets.exceptions import InvalidURI
+from websockets.protocol import State
+
+from cheshirecat_python_sdk.clients.codec import JsonCodec, get_json_codec
+from cheshirecat_python_sdk.clients.deadline import DeadlineExceeded, cap_timeout, get_current_deadline
+
+ConnectionKey = Tuple[str, str, str | None]
+FrameHandler = Callable[[str | bytes], None]
+ErrorHandler = Callable[[BaseException], None]
+
+
+class _PooledConnection:
+    __slots__ = ("websocket", "lock", "last_used", "credentials")
+
+    def __init__(self, websocket: ClientConnection, credentials: str | None):
+        self.websocket = websocket
+        self.lock = asyncio.Lock()
+        self.last_used = time.monotonic()
+        self.credentials = credentials
+
+
+class _Listener:
+    """
+    The subscribers to the frames of a connection, and the task receiving them.
+    """
+    __slots__ = ("subscribers", "stopped", "task")
+
+    def __init__(self):
+        self.subscribers: Dict[object, Tuple[FrameHandler, ErrorHandler | None]] = {}
+        self.stopped = asyncio.Event()
+        self.task: asyncio.Task | None = None
+
+
+class _ConnectionPool:
+    """
+    The connections opened within one event loop, in least-recently-used order, and their listeners.
+    """
+    def __init__(self):
+        self.connections: OrderedDict[ConnectionKey, _PooledConnection] = OrderedDict()
+        self.released = asyncio.Condition()
+        self.listeners: Dict[ConnectionKey, _Listener] = {}
+        # the connections being opened, which hold a slot of the pool until they are
+        self.connecting: Dict[ConnectionKey, asyncio.Future] = {}
 
 
 class WSClient:
@@ -10,18 +58,46 @@ class WSClient:
         port: int | None = None,
         apikey: str | None = None,
         is_wss: bool | None = False,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        ping_interval: float | None = 20,
+        ping_timeout: float | None = 20,
+        max_connections: int = 100,
+        idle_timeout: float | None = 300,
+        json_codec: JsonCodec | None = None,
     ):
         self.host = host
         self.port = port
         self.apikey = apikey
         self.token = None
         self.is_wss = is_wss
-        self.ws_client = None
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.json_codec = json_codec or get_json_codec()
+
+        # websocket connections are bound to the event loop that opened them, hence one pool per loop
+        self.__pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _ConnectionPool] = (
+            weakref.WeakKeyDictionary()
+        )
 
     def set_token(self, token: str) -> "WSClient":
+        # connections opened with the previous credentials are replaced as soon as they are released
         self.token = token
         return self
 
+    def __get_credentials(self) -> str:
+        credentials = self.token or self.apikey
+        if not credentials:
+            raise ValueError("You must provide an apikey or a token")
+        return credentials
+
+    def __is_usable(self, entry: _PooledConnection) -> bool:
+        return entry.websocket.state is State.OPEN and entry.credentials == (self.token or self.apikey)
+
     def get_ws_uri(
         self,
         agent_id: str,
@@ -40,21 +116,262 @@ class WSClient:
 
         return f"{scheme}://{self.host}{port_suffix}/{path}?{query_string}"
 
-    async def get_client(self, agent_id: str, user_id: str, chat_id: str | None = None) -> ClientConnection:
+    def __get_pool(self) -> _ConnectionPool:
+        loop = asyncio.get_running_loop()
+        pool = self.__pools.get(loop)
+        if pool is None:
+            pool = self.__pools[loop] = _ConnectionPool()
+        return pool
+
+    async def __connect(self, agent_id: str, user_id: str, chat_id: str | None) -> _PooledConnection:
         uri = self.get_ws_uri(agent_id, user_id, chat_id)
-        if self.ws_client is None:
-            try:
-                if self.token:
-                    headers = {"Authorization": f"Bearer {self.token}"}
-                elif self.apikey:
-                    headers = {"Authorization": f"Bearer {self.apikey}"}
-                else:
-                    raise ValueError("You must provide an apikey or a token")
-
-                # Create a WebSocket connection
-                websocket = await connect(uri, ping_interval=100000, ping_timeout=100000, additional_headers=headers)
-                self.ws_client = websocket
-            except InvalidURI as e:
-                raise ValueError(f"Invalid WebSocket URI: {uri}") from e
-
-        return self.ws_client
+        credentials = self.__get_credentials()
+        try:
+            # Create a WebSocket connection
+            current_deadline = get_current_deadline()
+            websocket = await connect(
+                uri,
+                open_timeout=cap_timeout(self.connect_timeout, current_deadline),
+                ping_interval=self.ping_interval,
+                ping_timeout=self.ping_timeout,
+                additional_headers={"Authorization": f"Bearer {credentials}"},
+            )
+        except InvalidURI as e:
+            raise ValueError(f"Invalid WebSocket URI: {uri}") from e
+
+        return _PooledConnection(websocket, credentials)
+
+    async def __evict(self, pool: _ConnectionPool, key: ConnectionKey):
+        entry = pool.connections.pop(key, None)
+        if entry is not None:
+            await entry.websocket.close()
+
+    async def __make_room(self, pool: _ConnectionPool):
+        """
+        Closes the connections idle for longer than the idle timeout and, while the pool is full, the least recently
+        used idle one. If every connection is busy, waits for one to be released. The connections being opened count
+        as part of the pool.
+        """
+        now = time.monotonic()
+        for key, entry in list(pool.connections.items()):
+            if entry.lock.locked():
+                continue
+            expired = self.idle_timeout is not None and now - entry.last_used > self.idle_timeout
+            if expired or not self.__is_usable(entry):
+                await self.__evict(pool, key)
+
+        while len(pool.connections) + len(pool.connecting) >= self.max_connections:
+            idle = next((key for key, entry in pool.connections.items() if not entry.lock.locked()), None)
+            if idle is not None:
+                await self.__evict(pool, idle)
+                continue
+
+            async with pool.released:
+                await pool.released.wait()
+
+    async def __get_entry(self, agent_id: str, user_id: str, chat_id: str | None) -> _PooledConnection:
+        pool = self.__get_pool()
+        key = (agent_id, user_id, chat_id)
+
+        while True:
+            entry = pool.connections.get(key)
+            if entry is not None and self.__is_usable(entry):
+                pool.connections.move_to_end(key)
+                return entry
+
+            connecting = pool.connecting.get(key)
+            if connecting is not None:
+                # another borrower is opening the same connection: share it, or try again if it failed
+                await asyncio.wait({connecting})
+                continue
+
+            await self.__make_room(pool)
+            entry = pool.connections.get(key)
+            if key not in pool.connecting and (entry is None or not self.__is_usable(entry)):
+                break
+
+        # the slot is taken right away, before yielding to the other borrowers
+        connecting = pool.connecting[key] = asyncio.get_running_loop().create_future()
+        try:
+            entry = await self.__connect(agent_id, user_id, chat_id)
+            stale = pool.connections.pop(key, None)
+            if stale is not None and not stale.lock.locked():
+                await stale.websocket.close()
+            pool.connections[key] = entry
+        finally:
+            del pool.connecting[key]
+            connecting.set_result(None)
+            async with pool.released:
+                pool.released.notify_all()
+
+        return entry
+
+    async def get_client(self, agent_id: str, user_id: str, chat_id: str | None = None) -> ClientConnection:
+        """
+        Returns the pooled connection for the given agent, user and chat, opening it if needed. Prefer `connection()`
+        when sending messages, since it also grants exclusive use of the connection for the duration of a turn.
+        :param agent_id: The agent ID.
+        :param user_id: The user ID.
+        :param chat_id: The chat ID (optional).
+        :return: ClientConnection, the open connection
+        """
+        entry = await self.__get_entry(agent_id, user_id, chat_id)
+        return entry.websocket
+
+    @asynccontextmanager
+    async def connection(
+        self, agent_id: str, user_id: str, chat_id: str | None = None
+    ) -> AsyncIterator[ClientConnection]:
+        """
+        Borrows the pooled connection for the given agent, user and chat, keeping it open for the next turns. Concurrent
+        borrowers of the same connection wait for their turn. The connection is dropped if the block raises, since its
+        state is then unknown.
+        :param agent_id: The agent ID.
+        :param user_id: The user ID.
+        :param chat_id: The chat ID (optional).
+        """
+        pool = self.__get_pool()
+        key = (agent_id, user_id, chat_id)
+
+        while True:
+            entry = await self.__get_entry(agent_id, user_id, chat_id)
+            await entry.lock.acquire()
+            # the previous borrower may have dropped the connection while we were waiting for it
+            if self.__is_usable(entry) and pool.connections.get(key) is entry:
+                break
+            entry.lock.release()
+
+        failed = False
+        try:
+            yield entry.websocket
+        except BaseException:
+            failed = True
+            if pool.connections.get(key) is entry:
+                del pool.connections[key]
+            raise
+        finally:
+            entry.last_used = time.monotonic()
+            entry.lock.release()
+            if failed:
+                # the frames of the interrupted turn may still be in flight: skip the closing handshake
+                entry.websocket.transport.abort()
+            elif pool.connections.get(key) is not entry:
+                # replaced while in use, e.g. after a change of token
+                await entry.websocket.close()
+            async with pool.released:
+                pool.released.notify_all()
+
+    def subscribe(
+        self,
+        agent_id: str,
+        user_id: str,
+        chat_id: str | None = None,
+        on_frame: FrameHandler | None = None,
+        on_error: ErrorHandler | None = None,
+    ) -> Callable[[], None]:
+        """
+        Forwards the frames received by the connection for the given agent, user and chat, like the notifications the
+        server sends outside of a conversation turn, to `on_frame`, until the returned function is called. The
+        connection is borrowed as long as there is a subscriber, so that the messages sent through it meanwhile wait
+        for the last subscriber to be gone; it is then released, and kept open, as soon as it is.
+        :param agent_id: The agent ID.
+        :param user_id: The user ID.
+        :param chat_id: The chat ID (optional).
+        :param on_frame: The callback notified of each frame.
+        :param on_error: The callback notified if the connection fails; the subscription is then over.
+        :return: Callable[[], None], the function ending the subscription
+        """
+        pool = self.__get_pool()
+        key = (agent_id, user_id, chat_id)
+
+        listener = pool.listeners.get(key)
+        if listener is None or listener.stopped.is_set():
+            listener = pool.listeners[key] = _Listener()
+            listener.task = asyncio.create_task(self.__listen(pool, key, listener))
+
+        token = object()
+        listener.subscribers[token] = (on_frame or (lambda frame: None), on_error)
+
+        def unsubscribe():
+            listener.subscribers.pop(token, None)
+            if not listener.subscribers:
+                listener.stopped.set()
+
+        return unsubscribe
+
+    async def __listen(self, pool: _ConnectionPool, key: ConnectionKey, listener: _Listener):
+        try:
+            async with self.connection(*key) as websocket:
+                stopped = asyncio.ensure_future(listener.stopped.wait())
+                try:
+                    while not listener.stopped.is_set():
+                        received = asyncio.ensure_future(websocket.recv())
+                        await asyncio.wait({received, stopped}, return_when=asyncio.FIRST_COMPLETED)
+                        if not received.done():
+                            # receiving can be cancelled without losing a frame: the connection stays usable
+                            received.cancel()
+                            await asyncio.wait({received})
+                            break
+
+                        frame = received.result()
+                        for on_frame, _ in list(listener.subscribers.values()):
+                            on_frame(frame)
+                finally:
+                    stopped.cancel()
+        except Exception as e:
+            for _, on_error in list(listener.subscribers.values()):
+                if on_error is not None:
+                    on_error(e)
+        finally:
+            listener.stopped.set()
+            if pool.listeners.get(key) is listener:
+                del pool.listeners[key]
+
+    async def warm_up(self, agent_id: str, user_id: str, chat_id: str | None = None):
+        """
+        Opens the connection for the given agent, user and chat in advance, so that the first message of the
+        conversation skips the websocket handshake.
+        :param agent_id: The agent ID.
+        :param user_id: The user ID.
+        :param chat_id: The chat ID (optional).
+        """
+        await self.__get_entry(agent_id, user_id, chat_id)
+
+    async def discard(self, agent_id: str, user_id: str, chat_id: str | None = None):
+        """
+        Closes the pooled connection for the given agent, user and chat, if any.
+        """
+        await self.__evict(self.__get_pool(), (agent_id, user_id, chat_id))
+
+    async def close(self):
+        """
+        Closes all the connections opened within the running event loop, ending their subscriptions.
+        """
+        pool = self.__get_pool()
+        for listener in list(pool.listeners.values()):
+            error = ConnectionError("The websocket client has been closed")
+            for _, on_error in list(listener.subscribers.values()):
+                if on_error is not None:
+                    on_error(error)
+            listener.subscribers.clear()
+            listener.stopped.set()
+            if listener.task is not None:
+                await asyncio.wait({listener.task})
+
+        for key in list(pool.connections):
+            await self.__evict(pool, key)
+
+    async def receive(self, websocket: ClientConnection) -> str | bytes:
+        """
+        Waits for the next frame of the given connection, for at most the read timeout and never beyond the deadline
+        of the current call.
+        :param websocket: The connection to read from.
+        :return: str | bytes, the frame
+        """
+        current_deadline = get_current_deadline()
+        try:
+            return await asyncio.wait_for(websocket.recv(), cap_timeout(self.read_timeout, current_deadline))
+        except asyncio.TimeoutError as e:
+            if current_deadline is not None and current_deadline.expired():
+                raise DeadlineExceeded("The deadline of the call has been exceeded") from e
+            raise TimeoutError(f"No message received within {self.read_timeout}s") from e
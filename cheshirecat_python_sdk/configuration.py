@@ -1,11 +1,49 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from cheshirecat_python_sdk.clients.codec import JsonCodec
+from cheshirecat_python_sdk.clients.resilience import CircuitBreakerPolicy, RetryPolicy, TransportHook
 
 
 class Configuration(BaseModel):
     """
     Class containing all the configuration options and variables used by the package
     """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     host: str = "localhost"
     port: int = 1865
     auth_key: str | None = None
     secure_connection: bool = False
+    # HTTP connection pooling: number of per-host pools to cache and max number of connections kept in each pool
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    keep_alive: bool = True
+    # timeouts, in seconds: time to establish a connection and max time to wait for data from the server
+    connect_timeout: float | None = 10
+    read_timeout: float | None = 120
+    ws_ping_interval: float | None = 20
+    ws_ping_timeout: float | None = 20
+    # websocket connections kept open per (agent, user, chat) and closed after `ws_idle_timeout` seconds without use
+    ws_max_connections: int = 100
+    ws_idle_timeout: float | None = 300
+    # resilience: retries with exponential backoff and circuit breaker, both disabled when None, and a hook notified of
+    # both; requests are sent once unless a retry policy is given
+    retry_policy: RetryPolicy | None = None
+    circuit_breaker_policy: CircuitBreakerPolicy | None = None
+    transport_hook: TransportHook | None = None
+    # JSON codec of the HTTP and websocket payloads: "auto" (orjson, then msgspec, then json), a codec name or instance
+    json_codec: str | JsonCodec = "auto"
+    # build the models of the responses without validating them: only for servers whose responses can be trusted
+    trusted_responses: bool = False
+    # send `with_vectors` and `payload_fields` to the server, to spare the bandwidth when it supports them; they are
+    # applied to the responses by the client either way
+    server_projection: bool = False
+    # local cache of memory recalls: max number of entries (disabled when None) and their time to live, in seconds
+    recall_cache_size: int | None = None
+    recall_cache_ttl: float = 60.0
+    # local cache of the sources found and not found: max number of entries (disabled when None), their time to live, in
+    # seconds, and the capacity of the Bloom filters recording the sources found (plain entries when None)
+    source_cache_size: int | None = None
+    source_cache_ttl: float = 300.0
+    source_cache_bloom_capacity: int | None = None
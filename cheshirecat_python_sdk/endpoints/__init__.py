@@ -1,18 +1,23 @@
-from cheshirecat_python_sdk.endpoints.admins import AdminsEndpoint
-from cheshirecat_python_sdk.endpoints.agentic_workflow import AgenticWorkflowEndpoint
-from cheshirecat_python_sdk.endpoints.auth import AuthEndpoint
-from cheshirecat_python_sdk.endpoints.auth_handler import AuthHandlerEndpoint
-from cheshirecat_python_sdk.endpoints.chunker import ChunkerEndpoint
-from cheshirecat_python_sdk.endpoints.conversation import ConversationEndpoint
-from cheshirecat_python_sdk.endpoints.custom_endpoint import CustomEndpoint
-from cheshirecat_python_sdk.endpoints.embedder import EmbedderEndpoint
-from cheshirecat_python_sdk.endpoints.file_manager import FileManagerEndpoint
-from cheshirecat_python_sdk.endpoints.large_language_model import LargeLanguageModelEndpoint
-from cheshirecat_python_sdk.endpoints.memory import MemoryEndpoint
-from cheshirecat_python_sdk.endpoints.message import MessageEndpoint
-from cheshirecat_python_sdk.endpoints.plugins import PluginsEndpoint
-from cheshirecat_python_sdk.endpoints.rabbit_hole import RabbitHoleEndpoint
-from cheshirecat_python_sdk.endpoints.users import UsersEndpoint
-from cheshirecat_python_sdk.endpoints.utils import UtilsEndpoint
-from cheshirecat_python_sdk.endpoints.vector_database import VectorDatabaseEndpoint
-from cheshirecat_python_sdk.endpoints.health_check import HealthCheckEndpoint
+from cheshirecat_python_sdk.endpoints.admins import AdminsEndpoint, AsyncAdminsEndpoint
+from cheshirecat_python_sdk.endpoints.agentic_workflow import AgenticWorkflowEndpoint, AsyncAgenticWorkflowEndpoint
+from cheshirecat_python_sdk.endpoints.auth import AuthEndpoint, AsyncAuthEndpoint
+from cheshirecat_python_sdk.endpoints.auth_handler import AuthHandlerEndpoint, AsyncAuthHandlerEndpoint
+from cheshirecat_python_sdk.endpoints.chunker import ChunkerEndpoint, AsyncChunkerEndpoint
+from cheshirecat_python_sdk.endpoints.conversation import ConversationEndpoint, AsyncConversationEndpoint
+from cheshirecat_python_sdk.endpoints.custom_endpoint import CustomEndpoint, AsyncCustomEndpoint
+from cheshirecat_python_sdk.endpoints.embedder import EmbedderEndpoint, AsyncEmbedderEndpoint
+from cheshirecat_python_sdk.endpoints.file_manager import FileManagerEndpoint, AsyncFileManagerEndpoint
+from cheshirecat_python_sdk.endpoints.large_language_model import LargeLanguageModelEndpoint, AsyncLargeLanguageModelEndpoint
+from cheshirecat_python_sdk.endpoints.memory import (
+    MemoryEndpoint,
+    AsyncMemoryEndpoint,
+    MemoryRecallBatch,
+    AsyncMemoryRecallBatch,
+)
+from cheshirecat_python_sdk.endpoints.message import MessageEndpoint, AsyncMessageEndpoint, MessageStream
+from cheshirecat_python_sdk.endpoints.plugins import PluginsEndpoint, AsyncPluginsEndpoint
+from cheshirecat_python_sdk.endpoints.rabbit_hole import RabbitHoleEndpoint, AsyncRabbitHoleEndpoint
+from cheshirecat_python_sdk.endpoints.users import UsersEndpoint, AsyncUsersEndpoint
+from cheshirecat_python_sdk.endpoints.utils import UtilsEndpoint, AsyncUtilsEndpoint
+from cheshirecat_python_sdk.endpoints.vector_database import VectorDatabaseEndpoint, AsyncVectorDatabaseEndpoint
+from cheshirecat_python_sdk.endpoints.health_check import HealthCheckEndpoint, AsyncHealthCheckEndpoint
@@ -1,4 +1,5 @@
-from cheshirecat_python_sdk.endpoints.base import AbstractEndpoint, MultipartPayload
+from cheshirecat_python_sdk.clients.multipart import ProgressCallback, UploadSource
+from cheshirecat_python_sdk.endpoints.base import AbstractEndpoint, AsyncAbstractEndpoint, MultipartPayload
 from cheshirecat_python_sdk.models.api.admins import (
     PluginInstallOutput,
     PluginInstallFromRegistryOutput,
@@ -7,7 +8,7 @@ from cheshirecat_python_sdk.models.api.admins import (
 )
 from cheshirecat_python_sdk.models.api.nested.plugins import PluginSettingsOutput
 from cheshirecat_python_sdk.models.api.plugins import PluginCollectionOutput, PluginsSettingsOutput, PluginToggleOutput
-from cheshirecat_python_sdk.utils import file_attributes
+from cheshirecat_python_sdk.utils import upload_attributes
 
 
 class AdminsEndpoint(AbstractEndpoint):
@@ -28,18 +29,29 @@ class AdminsEndpoint(AbstractEndpoint):
             query={"query": plugin_name} if plugin_name else None,
         )
 
-    def post_install_plugin_from_zip(self, path_zip: str) -> PluginInstallOutput:
-        payload = MultipartPayload()
+    def post_install_plugin_from_zip(
+        self,
+        path_zip: UploadSource,
+        file_name: str | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> PluginInstallOutput:
+        """
+        Install a plugin from a zip archive, streamed a chunk at a time.
+        :param path_zip: The path to the zip archive, or its content, as bytes, a binary file-like object or an
+            iterable of chunks.
+        :param file_name: The name of the archive; required unless path_zip is a path.
+        :param on_progress: The callback notified of the bytes sent so far and of the total, None if unknown.
+        :return: PluginInstallOutput, the details of the installation.
+        """
+        file_name, source, content_type = upload_attributes(file_name, path_zip)
+        payload = MultipartPayload(files=[("file", (file_name, source, content_type))], on_progress=on_progress)
 
-        with open(path_zip, "rb") as file:
-            payload.files = [("file", file_attributes(path_zip, file))]
-            result = self.post_multipart(
-                self.format_url("/install/upload"),
-                self.system_id,
-                output_class=PluginInstallOutput,
-                payload=payload,
-            )
-        return result
+        return self.post_multipart(
+            self.format_url("/install/upload"),
+            self.system_id,
+            output_class=PluginInstallOutput,
+            payload=payload,
+        )
 
     def post_install_plugin_from_registry(self, url: str) -> PluginInstallFromRegistryOutput:
         """
@@ -98,3 +110,104 @@ class AdminsEndpoint(AbstractEndpoint):
             self.system_id,
             output_class=PluginToggleOutput,
         )
+
+
+class AsyncAdminsEndpoint(AsyncAbstractEndpoint):
+    def __init__(self, client: "AsyncCheshireCatClient"):
+        super().__init__(client)
+        self.prefix = "/plugins"
+
+    async def get_available_plugins(self, plugin_name: str | None = None) -> PluginCollectionOutput:
+        """
+        Get a list of all available plugins.
+        :param plugin_name: The name of the plugin.
+        :return: PluginCollectionOutput, the details of the plugins.
+        """
+        return await self.get(
+            self.format_url("/installed"),
+            self.system_id,
+            output_class=PluginCollectionOutput,
+            query={"query": plugin_name} if plugin_name else None,
+        )
+
+    async def post_install_plugin_from_zip(
+        self,
+        path_zip: UploadSource,
+        file_name: str | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> PluginInstallOutput:
+        """
+        Install a plugin from a zip archive, streamed a chunk at a time.
+        :param path_zip: The path to the zip archive, or its content, as bytes, a binary file-like object or an
+            iterable of chunks.
+        :param file_name: The name of the archive; required unless path_zip is a path.
+        :param on_progress: The callback notified of the bytes sent so far and of the total, None if unknown.
+        :return: PluginInstallOutput, the details of the installation.
+        """
+        file_name, source, content_type = upload_attributes(file_name, path_zip)
+        payload = MultipartPayload(files=[("file", (file_name, source, content_type))], on_progress=on_progress)
+
+        return await self.post_multipart(
+            self.format_url("/install/upload"),
+            self.system_id,
+            output_class=PluginInstallOutput,
+            payload=payload,
+        )
+
+    async def post_install_plugin_from_registry(self, url: str) -> PluginInstallFromRegistryOutput:
+        """
+        Install a new plugin from a registry. The plugin is installed asynchronously.
+        :param url: The URL of the plugin.
+        :return: PluginInstallFromRegistryOutput, the details of the installation.
+        """
+        return await self.post_json(
+            self.format_url("/install/registry"),
+            self.system_id,
+            output_class=PluginInstallFromRegistryOutput,
+            payload={"url": url},
+        )
+
+    async def get_plugins_settings(self) -> PluginsSettingsOutput:
+        """
+        Get the default settings of all the plugins.
+        :return: PluginsSettingsOutput, the details of the settings.
+        """
+        return await self.get(self.format_url("/system/settings"), self.system_id, output_class=PluginsSettingsOutput)
+
+    async def get_plugin_settings(self, plugin_id: str) -> PluginSettingsOutput:
+        """
+        Get the default settings of a specific plugin.
+        :param plugin_id: The ID of the plugin.
+        :return: PluginSettingsOutput, the details of the settings.
+        """
+        return await self.get(
+            self.format_url(f"/system/settings/{plugin_id}"), self.system_id, output_class=PluginSettingsOutput
+        )
+
+    async def get_plugin_details(self, plugin_id: str) -> PluginDetailsOutput:
+        """
+        Get the details of a specific plugin.
+        :param plugin_id: The ID of the plugin.
+        :return: PluginDetailsOutput, the details of the plugin.
+        """
+        return await self.get(self.format_url(f"/system/details/{plugin_id}"), self.system_id, output_class=PluginDetailsOutput)
+
+    async def delete_plugin(self, plugin_id: str) -> PluginDeleteOutput:
+        """
+        Delete a specific plugin.
+        :param plugin_id: The ID of the plugin.
+        :return: PluginDeleteOutput, the details of the plugin.
+        """
+        return await self.delete(self.format_url(f"/uninstall/{plugin_id}"), self.system_id, output_class=PluginDeleteOutput)
+
+    async def put_toggle_plugin(self, plugin_id: str) -> PluginToggleOutput:
+        """
+        This endpoint toggles a plugin, on a system level
+        :param plugin_id: The id of the plugin to toggle
+        :return: PluginToggleOutput, the toggled plugin
+        """
+        return await self.put(
+            self.format_url(f"/system/toggle/{plugin_id}"),
+            self.system_id,
+            output_class=PluginToggleOutput,
+        )
@@ -1,16 +1,21 @@
 from abc import ABC
-from typing import Dict, Any, List, Tuple, Type
-import requests
+from typing import AsyncIterator, Dict, Any, Iterator, List, Sequence, Tuple, Type
+import httpx
 from pydantic import BaseModel
 from requests_toolbelt.sessions import BaseUrlSession
 from websockets import ClientConnection
 
-from cheshirecat_python_sdk.utils import T, deserialize
+from cheshirecat_python_sdk.clients.async_http_client import AsyncHttpSession
+from cheshirecat_python_sdk.clients.http_client import HttpSession
+from cheshirecat_python_sdk.clients.json_stream import JsonFragment, JsonPath, JsonStreamSplitter
+from cheshirecat_python_sdk.clients.multipart import MultipartStream, ProgressCallback
+from cheshirecat_python_sdk.utils import T, deserialize, deserialize_list
 
 
 class MultipartPayload(BaseModel):
     data: Dict[str, Any] | None = None
     files: List[Tuple] | None = None
+    on_progress: ProgressCallback | None = None
 
 
 class AbstractEndpoint(ABC):
@@ -27,12 +32,31 @@ class AbstractEndpoint(ABC):
         agent_id: str | None = None,
         user_id: str | None = None,
         chat_id: str | None = None,
-    ) -> requests.Session:
+    ) -> HttpSession:
         return self.client.http_client.get_client(agent_id, user_id, chat_id)
 
     def get_http_session(self) -> BaseUrlSession:
         return self.client.http_client.get_base_session()
 
+    def decode(self, response: Any) -> Any:
+        """
+        Decodes the JSON body of a response with the codec of the client, straight from its bytes.
+        """
+        return self.client.json_codec.loads(response.content)
+
+    def deserialize(self, data: Any, output_class: Type[T]) -> T:
+        """
+        Builds the model of a decoded response body, without validating it if the client trusts the responses.
+        """
+        return deserialize(data, output_class, self.client.trusted_responses)
+
+    def deserialize_list(self, data: Any, output_class: Type[T]) -> List[T]:
+        """
+        Builds the models of a decoded response body made of a list, without validating them if the client trusts the
+        responses.
+        """
+        return deserialize_list(data, output_class, self.client.trusted_responses)
+
     async def get_ws_client(self, agent_id: str, user_id: str, chat_id: str | None = None) -> ClientConnection:
         return await self.client.ws_client.get_client(agent_id, user_id, chat_id)
 
@@ -53,8 +77,38 @@ class AbstractEndpoint(ABC):
         response.raise_for_status()
 
         if output_class is None:
-            return response.json()
-        return deserialize(response.json(), output_class)
+            return self.decode(response)
+        return self.deserialize(self.decode(response), output_class)
+
+    def stream(
+        self,
+        endpoint: str,
+        agent_id: str,
+        arrays: Sequence[JsonPath],
+        query: Dict[str, Any] | None = None,
+        user_id: str | None = None,
+        chat_id: str | None = None,
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[JsonFragment]:
+        """
+        Sends a GET request and splits its body, while it is read from the network, into the items of the given arrays
+        and the other values of the document, so that the whole body is never held in memory.
+        :return: Iterator[JsonFragment], the fragments of the body, still encoded
+        """
+        options = {}
+        if query:
+            options["params"] = query
+
+        response = self.get_http_client(agent_id, user_id, chat_id).get(endpoint, stream=True, **options)
+        try:
+            response.raise_for_status()
+
+            splitter = JsonStreamSplitter(arrays)
+            for chunk in response.iter_content(chunk_size):
+                yield from splitter.feed(chunk)
+            yield from splitter.close()
+        finally:
+            response.close()
 
     def post_json(
         self,
@@ -73,8 +127,8 @@ class AbstractEndpoint(ABC):
         response.raise_for_status()
 
         if output_class is None:
-            return response.json()
-        return deserialize(response.json(), output_class)
+            return self.decode(response)
+        return self.deserialize(self.decode(response), output_class)
 
     def post_multipart(
         self,
@@ -84,18 +138,14 @@ class AbstractEndpoint(ABC):
         payload: MultipartPayload | None = None,
         user_id: str | None = None,
     ) -> T:
-        options = {}
-        if payload.data:
-            options["data"] = payload.data
-        if payload.files:
-            options["files"] = payload.files
-
-        response = self.get_http_client(agent_id, user_id).post(endpoint, **options)
+        # the body is streamed from the sources of the files, instead of being assembled in memory
+        body = MultipartStream(payload.data, payload.files, payload.on_progress)
+        response = self.get_http_client(agent_id, user_id).post(endpoint, data=body, headers=body.headers)
         response.raise_for_status()
 
         if output_class is None:
-            return response.json()
-        return deserialize(response.json(), output_class)
+            return self.decode(response)
+        return self.deserialize(self.decode(response), output_class)
 
     def put(
         self,
@@ -114,8 +164,8 @@ class AbstractEndpoint(ABC):
         response.raise_for_status()
 
         if output_class is None:
-            return response.json()
-        return deserialize(response.json(), output_class)
+            return self.decode(response)
+        return self.deserialize(self.decode(response), output_class)
 
     def delete(
         self,
@@ -134,5 +184,179 @@ class AbstractEndpoint(ABC):
         response.raise_for_status()
 
         if output_class is None:
-            return response.json()
-        return deserialize(response.json(), output_class)
+            return self.decode(response)
+        return self.deserialize(self.decode(response), output_class)
+
+
+class AsyncAbstractEndpoint(ABC):
+    def __init__(self, client: "AsyncCheshireCatClient"):
+        self.client = client
+        self.prefix = ""
+        self.system_id = "system"
+
+    def format_url(self, endpoint: str) -> str:
+        return f"/{self.prefix}/{endpoint}".replace("//", "/")
+
+    def get_http_client(
+        self,
+        agent_id: str | None = None,
+        user_id: str | None = None,
+        chat_id: str | None = None,
+    ) -> AsyncHttpSession:
+        return self.client.http_client.get_client(agent_id, user_id, chat_id)
+
+    def get_http_session(self) -> httpx.AsyncClient:
+        return self.client.http_client.get_base_session()
+
+    def decode(self, response: Any) -> Any:
+        """
+        Decodes the JSON body of a response with the codec of the client, straight from its bytes.
+        """
+        return self.client.json_codec.loads(response.content)
+
+    def deserialize(self, data: Any, output_class: Type[T]) -> T:
+        """
+        Builds the model of a decoded response body, without validating it if the client trusts the responses.
+        """
+        return deserialize(data, output_class, self.client.trusted_responses)
+
+    def deserialize_list(self, data: Any, output_class: Type[T]) -> List[T]:
+        """
+        Builds the models of a decoded response body made of a list, without validating them if the client trusts the
+        responses.
+        """
+        return deserialize_list(data, output_class, self.client.trusted_responses)
+
+    async def get_ws_client(self, agent_id: str, user_id: str, chat_id: str | None = None) -> ClientConnection:
+        return await self.client.ws_client.get_client(agent_id, user_id, chat_id)
+
+    async def get(
+        self,
+        endpoint: str,
+        agent_id: str,
+        output_class: Type[T] | None = None,
+        query: Dict[str, Any] | None = None,
+        user_id: str | None = None,
+        chat_id: str | None = None,
+    ) -> T:
+        options = {}
+        if query:
+            options["params"] = query
+
+        response = await self.get_http_client(agent_id, user_id, chat_id).get(endpoint, **options)
+        response.raise_for_status()
+
+        if output_class is None:
+            return self.decode(response)
+        return self.deserialize(self.decode(response), output_class)
+
+    async def stream(
+        self,
+        endpoint: str,
+        agent_id: str,
+        arrays: Sequence[JsonPath],
+        query: Dict[str, Any] | None = None,
+        user_id: str | None = None,
+        chat_id: str | None = None,
+        chunk_size: int = 64 * 1024,
+    ) -> AsyncIterator[JsonFragment]:
+        """
+        Sends a GET request and splits its body, while it is read from the network, into the items of the given arrays
+        and the other values of the document, so that the whole body is never held in memory.
+        :return: AsyncIterator[JsonFragment], the fragments of the body, still encoded
+        """
+        options = {}
+        if query:
+            options["params"] = query
+
+        response = await self.get_http_client(agent_id, user_id, chat_id).get(endpoint, stream=True, **options)
+        try:
+            response.raise_for_status()
+
+            splitter = JsonStreamSplitter(arrays)
+            async for chunk in response.aiter_bytes(chunk_size):
+                for fragment in splitter.feed(chunk):
+                    yield fragment
+            for fragment in splitter.close():
+                yield fragment
+        finally:
+            await response.aclose()
+
+    async def post_json(
+        self,
+        endpoint: str,
+        agent_id: str,
+        output_class: Type[T] | None = None,
+        payload: Dict[str, Any] | None = None,
+        user_id: str | None = None,
+        chat_id: str | None = None,
+    ) -> T:
+        options = {}
+        if payload:
+            options["json"] = payload
+
+        response = await self.get_http_client(agent_id, user_id, chat_id).post(endpoint, **options)
+        response.raise_for_status()
+
+        if output_class is None:
+            return self.decode(response)
+        return self.deserialize(self.decode(response), output_class)
+
+    async def post_multipart(
+        self,
+        endpoint: str,
+        agent_id: str,
+        output_class: Type[T] | None = None,
+        payload: MultipartPayload | None = None,
+        user_id: str | None = None,
+    ) -> T:
+        # the body is streamed from the sources of the files, instead of being assembled in memory
+        body = MultipartStream(payload.data, payload.files, payload.on_progress)
+        response = await self.get_http_client(agent_id, user_id).post(
+            endpoint, content=body.aiter(), headers=body.headers
+        )
+        response.raise_for_status()
+
+        if output_class is None:
+            return self.decode(response)
+        return self.deserialize(self.decode(response), output_class)
+
+    async def put(
+        self,
+        endpoint: str,
+        agent_id: str,
+        output_class: Type[T] | None = None,
+        payload: Dict[str, Any] | None = None,
+        user_id: str | None = None,
+        chat_id: str | None = None,
+    ) -> T:
+        options = {}
+        if payload:
+            options["json"] = payload
+
+        response = await self.get_http_client(agent_id, user_id, chat_id).put(endpoint, **options)
+        response.raise_for_status()
+
+        if output_class is None:
+            return self.decode(response)
+        return self.deserialize(self.decode(response), output_class)
+
+    async def delete(
+        self,
+        endpoint: str,
+        agent_id: str,
+        output_class: Type[T] | None = None,
+        user_id: str | None = None,
+        chat_id: str | None = None,
+        payload: Dict[str, Any] | None = None,
+    ) -> T:
+        options = {}
+        if payload:
+            options["json"] = payload
+
+        response = await self.get_http_client(agent_id, user_id, chat_id).delete(endpoint, **options)
+        response.raise_for_status()
+
+        if output_class is None:
+            return self.decode(response)
+        return self.deserialize(self.decode(response), output_class)
@@ -1,13 +1,13 @@
-from typing import List, Dict
+from typing import AsyncIterator, Dict, Iterator, List
 
-from cheshirecat_python_sdk.endpoints.base import AbstractEndpoint
+from cheshirecat_python_sdk.endpoints.base import AbstractEndpoint, AsyncAbstractEndpoint
 from cheshirecat_python_sdk.models.api.conversations import (
     ConversationHistoryOutput,
     ConversationDeleteOutput,
     ConversationsResponse,
     ConversationAttributesChangeOutput,
 )
-from cheshirecat_python_sdk.utils import deserialize
+from cheshirecat_python_sdk.models.api.nested.memories import ConversationMessage
 
 
 class ConversationEndpoint(AbstractEndpoint):
@@ -30,6 +30,22 @@ class ConversationEndpoint(AbstractEndpoint):
             output_class=ConversationHistoryOutput,
         )
 
+    def stream_conversation_history(self, agent_id: str, user_id: str, chat_id: str) -> Iterator[ConversationMessage]:
+        """
+        This method streams the conversation history: the messages are built one at a time, while the response is read
+        from the network, so that the memory used does not grow with the length of the history.
+        :param agent_id: The agent ID.
+        :param user_id: The user ID to filter the conversation history.
+        :param chat_id: The chat ID to filter the conversation history.
+        :return: Iterator[ConversationMessage], the conversation history entries.
+        """
+        loads = self.client.json_codec.loads
+        for fragment in self.stream(
+            self.format_url(f"{chat_id}/history"), agent_id, [("history",)], user_id=user_id
+        ):
+            if fragment.item:
+                yield self.deserialize(loads(fragment.data), ConversationMessage)
+
     def get_conversations(self, agent_id: str, user_id: str) -> List[ConversationsResponse]:
         """
         This endpoint returns the attributes of the different conversations, given the `agent_id` and the `user_id`.
@@ -40,7 +56,7 @@ class ConversationEndpoint(AbstractEndpoint):
         response = self.get_http_client(agent_id, user_id).get(self.prefix)
         response.raise_for_status()
 
-        return [deserialize(item, ConversationsResponse) for item in response.json()]
+        return self.deserialize_list(self.decode(response), ConversationsResponse)
 
     def get_conversation(self, agent_id: str, user_id: str, chat_id: str) -> ConversationsResponse:
         """
@@ -106,3 +122,119 @@ class ConversationEndpoint(AbstractEndpoint):
             payload=payload,
             user_id=user_id,
         )
+
+
+class AsyncConversationEndpoint(AsyncAbstractEndpoint):
+    def __init__(self, client: "AsyncCheshireCatClient"):
+        super().__init__(client)
+        self.prefix = "/conversations"
+
+    async def get_conversation_history(self, agent_id: str, user_id: str, chat_id: str) -> ConversationHistoryOutput:
+        """
+        This endpoint returns the conversation history.
+        :param agent_id: The agent ID.
+        :param user_id: The user ID to filter the conversation history.
+        :param chat_id: The chat ID to filter the conversation history.
+        :return: ConversationHistoryOutput, a list of conversation history entries.
+        """
+        return await self.get(
+            self.format_url(f"{chat_id}/history"),
+            agent_id,
+            user_id=user_id,
+            output_class=ConversationHistoryOutput,
+        )
+
+    async def stream_conversation_history(
+        self, agent_id: str, user_id: str, chat_id: str
+    ) -> AsyncIterator[ConversationMessage]:
+        """
+        This method streams the conversation history: the messages are built one at a time, while the response is read
+        from the network, so that the memory used does not grow with the length of the history.
+        :param agent_id: The agent ID.
+        :param user_id: The user ID to filter the conversation history.
+        :param chat_id: The chat ID to filter the conversation history.
+        :return: AsyncIterator[ConversationMessage], the conversation history entries.
+        """
+        loads = self.client.json_codec.loads
+        async for fragment in self.stream(
+            self.format_url(f"{chat_id}/history"), agent_id, [("history",)], user_id=user_id
+        ):
+            if fragment.item:
+                yield self.deserialize(loads(fragment.data), ConversationMessage)
+
+    async def get_conversations(self, agent_id: str, user_id: str) -> List[ConversationsResponse]:
+        """
+        This endpoint returns the attributes of the different conversations, given the `agent_id` and the `user_id`.
+        :param agent_id: The agent ID.
+        :param user_id: The user ID to filter the conversation history.
+        :return: List[ConversationsResponse], a list of conversation attributes.
+        """
+        response = await self.get_http_client(agent_id, user_id).get(self.prefix)
+        response.raise_for_status()
+
+        return self.deserialize_list(self.decode(response), ConversationsResponse)
+
+    async def get_conversation(self, agent_id: str, user_id: str, chat_id: str) -> ConversationsResponse:
+        """
+        This endpoint returns the attributes of a specific conversation, given the `agent_id`, the `user_id` and the
+        `chat_id`.
+        :param agent_id: The agent ID.
+        :param user_id: The user ID to filter the conversation history.
+        :param chat_id: The chat ID to filter the conversation history.
+        :return: ConversationsResponse, the conversation attributes.
+        """
+        return await self.get(
+            self.format_url(chat_id),
+            agent_id,
+            user_id=user_id,
+            output_class=ConversationsResponse,
+        )
+
+    async def delete_conversation(self, agent_id: str, user_id: str, chat_id: str) -> ConversationDeleteOutput:
+        """
+        This endpoint deletes the conversation.
+        :param agent_id: The agent ID.
+        :param user_id: The user ID to filter the conversation history.
+        :param chat_id: The chat ID to filter the conversation history.
+        :return: ConversationDeleteOutput, a message indicating whether the conversation was deleted.
+        """
+        return await self.delete(
+            self.format_url(chat_id),
+            agent_id,
+            output_class=ConversationDeleteOutput,
+            user_id=user_id,
+        )
+
+    async def put_conversation_attributes(
+        self,
+        agent_id: str,
+        user_id: str,
+        chat_id: str,
+        name: str | None,
+        metadata: Dict | None = None,
+    ) -> ConversationAttributesChangeOutput:
+        """
+        This endpoint creates a new element in the conversation history.
+        :param agent_id: The agent ID.
+        :param user_id: The user ID to filter the conversation history.
+        :param chat_id: The chat ID to filter the conversation history.
+        :param name: The new name to assign to the conversation
+        :param metadata: The metadata to assign to the conversation
+        :return: ConversationNameChangeOutput, a message indicating whether the conversation name was changed.
+        """
+        if not name and not metadata:
+            raise ValueError("Either name or metadata must be provided")
+
+        payload = {}
+        if name:
+            payload = {"name": name}
+        if metadata:
+            payload["metadata"] = metadata
+
+        return await self.put(
+            self.format_url(chat_id),
+            agent_id,
+            output_class=ConversationAttributesChangeOutput,
+            payload=payload,
+            user_id=user_id,
+        )
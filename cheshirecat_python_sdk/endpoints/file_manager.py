@@ -1,10 +1,120 @@
-from typing import Dict, Any
+import asyncio
+import os
+import re
+import threading
+import time
+import httpx
+import urllib3
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Dict, Any, List, Tuple
 from requests import Response
+from requests.exceptions import ChunkedEncodingError, ConnectionError, Timeout
 
-from cheshirecat_python_sdk.endpoints.base import AbstractEndpoint
+from cheshirecat_python_sdk.clients.async_http_client import AsyncHttpSession
+from cheshirecat_python_sdk.clients.http_client import HttpSession
+from cheshirecat_python_sdk.clients.multipart import ProgressCallback
+from cheshirecat_python_sdk.clients.resilience import RetryPolicy
+from cheshirecat_python_sdk.endpoints.base import AbstractEndpoint, AsyncAbstractEndpoint
 from cheshirecat_python_sdk.models.api.factories import FactoryObjectSettingOutput, FactoryObjectSettingsOutput
 from cheshirecat_python_sdk.models.api.file_managers import FileManagerAttributes, FileManagerDeletedFiles
 
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+PARALLEL_DOWNLOAD_THRESHOLD = 64 * 1024 * 1024
+
+_CONTENT_RANGE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)")
+
+
+class DownloadProgress:
+    """
+    The bytes downloaded so far by the parts of a download, reported to an optional callback. Safe to be advanced by
+    several threads.
+    """
+    def __init__(self, total: int | None, on_progress: ProgressCallback | None = None):
+        self.total = total
+        self.on_progress = on_progress
+        self.received = 0
+        self.__lock = threading.Lock()
+
+    def advance(self, size: int):
+        with self.__lock:
+            self.received += size
+            if self.on_progress is not None:
+                self.on_progress(self.received, self.total)
+
+
+def get_download_size(status_code: int, headers: Any) -> Tuple[int | None, bool]:
+    """
+    Reads the size of a file from the answer to a request of its whole content as a range, and whether the server
+    serves it by ranges.
+    :param status_code: The status code of the response.
+    :param headers: The headers of the response.
+    :return: Tuple[int | None, bool], the size of the file, None if unknown, and whether ranges are supported
+    """
+    if status_code == 206:
+        match = _CONTENT_RANGE.match(headers.get("Content-Range", ""))
+        if match and match.group(3) != "*":
+            return int(match.group(3)), True
+
+    length = headers.get("Content-Length")
+    encoded = headers.get("Content-Encoding", "identity") != "identity"
+    return (int(length) if length and not encoded else None), False
+
+
+def get_validator(headers: Any) -> str | None:
+    """
+    Returns the value to send as If-Range when resuming a download, so that the server sends the whole file again if
+    it changed meanwhile: the strong ETag of the file or else its modification date.
+    """
+    etag = headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return headers.get("Last-Modified")
+
+
+def split_ranges(size: int, parts: int) -> List[Tuple[int, int]]:
+    """
+    Splits the given size into at most `parts` contiguous ranges of about the same size, end excluded.
+    """
+    part_size = -(-size // max(parts, 1))
+    return [(start, min(start + part_size, size)) for start in range(0, size, part_size)] if size else [(0, 0)]
+
+
+def get_range_headers(start: int, end: int | None, validator: str | None) -> Dict[str, str]:
+    headers = {
+        "Accept": "application/octet-stream",
+        # ranges are taken from the content as stored, not from a compressed version of it
+        "Accept-Encoding": "identity",
+        "Range": f"bytes={start}-{'' if end is None else end - 1}",
+    }
+    if validator:
+        headers["If-Range"] = validator
+    return headers
+
+
+def get_partial_path(dest: str | os.PathLike) -> str:
+    return f"{os.fspath(dest)}.part"
+
+
+def prepare_partial_file(path: str, size: int | None):
+    # the file is allocated upfront, so that the parts can be written in place at their offset
+    with open(path, "wb") as file:
+        if size:
+            file.truncate(size)
+
+
+def write_chunks(path: str, position: int, chunks: List[bytes]):
+    with open(path, "r+b") as file:
+        file.seek(position)
+        file.writelines(chunks)
+
+
+def remove_partial_file(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
 
 class FileManagerEndpoint(AbstractEndpoint):
     def __init__(self, client: "CheshireCatClient"):
@@ -79,6 +189,158 @@ class FileManagerEndpoint(AbstractEndpoint):
 
         return response
 
+    def download_file(
+        self,
+        agent_id: str,
+        file_name: str,
+        dest: str | os.PathLike,
+        chat_id: str | None = None,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        max_connections: int = 4,
+        parallel_threshold: int = PARALLEL_DOWNLOAD_THRESHOLD,
+        max_resumes: int = 5,
+        on_progress: ProgressCallback | None = None,
+    ) -> int:
+        """
+        Download a file from the file manager for the agent specified by agent_id straight to disk, a large chunk at a
+        time. The file is written next to its destination, with a ".part" suffix, and moved there once complete. A
+        dropped connection is resumed from the last byte received, by asking the server for the rest of the file. Files
+        larger than `parallel_threshold` are downloaded as several ranges at once, when the server supports ranges. The
+        bytes are written as sent, never decoded, since the ranges are taken from them.
+        :param agent_id: The agent id
+        :param file_name: The name of the file to download
+        :param dest: The path to save the file to
+        :param chat_id: The chat id, optional
+        :param chunk_size: The size of the chunks written to disk, and at most read from the network at once
+        :param max_connections: The maximum number of ranges downloaded at once
+        :param parallel_threshold: The size from which a file is downloaded as several ranges at once
+        :param max_resumes: The maximum number of times each range is resumed after a dropped connection
+        :param on_progress: The callback notified of the bytes received so far and of the size of the file
+        :return: int, the size of the downloaded file
+        """
+        http_client = self.get_http_client(agent_id, chat_id=chat_id)
+        url = self.format_url(f"/files/{file_name}")
+        path = get_partial_path(dest)
+
+        response = http_client.get(url, stream=True, headers=get_range_headers(0, None, None))
+        try:
+            if response.status_code == 416:  # no range can be satisfied: the file is empty
+                response.close()
+                size, ranged, response = 0, False, None
+            else:
+                response.raise_for_status()
+                size, ranged = get_download_size(response.status_code, response.headers)
+            validator = get_validator(response.headers) if response is not None else None
+            progress = DownloadProgress(size, on_progress)
+            prepare_partial_file(path, size)
+
+            parts = 1
+            if ranged and size >= parallel_threshold:
+                parts = max(1, min(max_connections, size // chunk_size))
+            ranges = split_ranges(size, parts) if size is not None else [(0, None)]
+
+            cancelled = threading.Event()
+            arguments = (http_client, url, path, validator, chunk_size, max_resumes, progress, cancelled)
+            if len(ranges) == 1:
+                size = self.__download_range(*arguments, *ranges[0], response)
+            else:
+                with ThreadPoolExecutor(max_workers=len(ranges) - 1) as executor:
+                    # the parts run within the context of the call, e.g. its deadline
+                    futures = [
+                        executor.submit(copy_context().run, self.__download_range, *arguments, *r) for r in ranges[1:]
+                    ]
+                    try:
+                        # the first range is read from the response at hand
+                        self.__download_range(*arguments, *ranges[0], response)
+                        for future in futures:
+                            future.result()
+                    except BaseException:
+                        cancelled.set()
+                        raise
+            response = None
+
+            os.replace(path, dest)
+            return size
+        except BaseException:
+            if response is not None:
+                response.close()
+            remove_partial_file(path)
+            raise
+
+    def __download_range(
+        self,
+        http_client: HttpSession,
+        url: str,
+        path: str,
+        validator: str | None,
+        chunk_size: int,
+        max_resumes: int,
+        progress: DownloadProgress,
+        cancelled: threading.Event,
+        start: int,
+        end: int | None,
+        response: Response | None = None,
+    ) -> int:
+        """
+        Downloads the range of the file from `start` to `end` excluded, or to its end if None, into the partial file,
+        starting from the given response if any. Returns the position reached.
+        """
+        policy = self.client.http_client.retry_policy or RetryPolicy()
+        position = start
+        resumes = 0
+        try:
+            with open(path, "r+b", buffering=chunk_size) as file:
+                while end is None or position < end:
+                    try:
+                        if response is None:
+                            response = http_client.get(
+                                url, stream=True, headers=get_range_headers(position, end, validator)
+                            )
+                            response.raise_for_status()
+                        if response.status_code != 206 and position > 0:
+                            # the range was ignored, the file having changed: only a whole download can start over
+                            if start > 0:
+                                raise RuntimeError(f"The file {url} changed on the server during the download")
+                            progress.advance(-position)
+                            file.truncate(0)
+                            position = 0
+
+                        file.seek(position)
+                        # the bytes are taken as they come from the network, as sent, and gathered by the file into
+                        # chunk_size writes: a dropped connection loses nothing received
+                        while chunk := response.raw.read1(chunk_size, decode_content=False):
+                            if cancelled.is_set():
+                                return position
+                            if end is not None and position + len(chunk) > end:
+                                chunk = memoryview(chunk)[:end - position]
+                            file.write(chunk)
+                            position += len(chunk)
+                            progress.advance(len(chunk))
+                            if position == end:
+                                break
+                        if end is None:
+                            break
+                    except (ConnectionError, ChunkedEncodingError, Timeout, urllib3.exceptions.HTTPError) as e:
+                        if resumes >= max_resumes:
+                            raise ConnectionError(f"The download of {url} was interrupted at byte {position}") from e
+                    finally:
+                        if response is not None:
+                            response.close()
+                            response = None
+
+                    if end is None or position < end:
+                        # the connection dropped before the end of the range: resume from where it stopped
+                        time.sleep(policy.get_delay(resumes))
+                        resumes += 1
+                        if resumes > max_resumes:
+                            raise ConnectionError(f"The download of {url} was interrupted at byte {position}")
+        finally:
+            # the response given is closed even when the range is empty
+            if response is not None:
+                response.close()
+
+        return position
+
     def delete_file(self, agent_id: str, file_name: str, chat_id: str | None = None) -> FileManagerDeletedFiles:
         """
         Download a file from the file manager for the agent specified by agent_id
@@ -107,3 +369,264 @@ class FileManagerEndpoint(AbstractEndpoint):
             output_class=FileManagerDeletedFiles,
             chat_id=chat_id,
         )
+
+
+class AsyncFileManagerEndpoint(AsyncAbstractEndpoint):
+    def __init__(self, client: "AsyncCheshireCatClient"):
+        super().__init__(client)
+        self.prefix = "/file_manager"
+
+    async def get_file_managers_settings(self, agent_id: str) -> FactoryObjectSettingsOutput:
+        """
+        Get all file managers settings for the agent specified by agent_id
+        :param agent_id: The agent id
+        :return: FactoryObjectSettingsOutput, the settings of all file managers
+        """
+        return await self.get(
+            self.format_url("/settings"),
+            agent_id,
+            output_class=FactoryObjectSettingsOutput,
+        )
+
+    async def get_file_manager_settings(self, file_manager: str, agent_id: str) -> FactoryObjectSettingOutput:
+        """
+        Get the settings of a file manager by name for the agent specified by agent_id
+        :param file_manager: str, the name of the file manager
+        :param agent_id: The agent id
+        :return: FactoryObjectSettingOutput, the settings of the file manager
+        """
+        return await self.get(
+            self.format_url(f"/settings/{file_manager}"),
+            agent_id,
+            output_class=FactoryObjectSettingOutput,
+        )
+
+    async def put_file_manager_settings(
+        self, file_manager: str, agent_id: str, values: Dict[str, Any]
+    ) -> FactoryObjectSettingOutput:
+        """
+        Update the settings of a file manager by name with the given values, for the agent specified by agent_id
+        :param file_manager: str, the name of the file manager
+        :param agent_id: The agent id
+        :param values: Dict[str, Any], the values to update
+        :return: FactoryObjectSettingOutput, the updated settings of the file manager
+        """
+        return await self.put(
+            self.format_url(f"/settings/{file_manager}"),
+            agent_id,
+            output_class=FactoryObjectSettingOutput,
+            payload=values,
+        )
+
+    async def get_file_manager_attributes(self, agent_id: str, chat_id: str | None = None) -> FileManagerAttributes:
+        """
+        Get the attributes of the file manager for the agent specified by agent_id
+        :param agent_id: The agent id
+        :param chat_id: The chat id, optional
+        :return: FileManagerAttributes, the attributes of the file manager
+        """
+        return await self.get(self.prefix, agent_id, output_class=FileManagerAttributes, chat_id=chat_id)
+
+    async def get_file(self, agent_id: str, file_name: str, chat_id: str | None = None) -> Response:
+        """
+        Download a file from the file manager for the agent specified by agent_id
+        :param agent_id: The agent id
+        :param file_name: The name of the file to download
+        :param chat_id: The chat id, optional
+        :return: Response, the response containing the file content
+        """
+        response = await self.get_http_client(agent_id, chat_id=chat_id).get(
+            self.format_url(f"/files/{file_name}"),
+            stream=True,
+            headers={"Accept": "application/octet-stream"}
+        )
+        response.raise_for_status()
+
+        return response
+
+    async def download_file(
+        self,
+        agent_id: str,
+        file_name: str,
+        dest: str | os.PathLike,
+        chat_id: str | None = None,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        max_connections: int = 4,
+        parallel_threshold: int = PARALLEL_DOWNLOAD_THRESHOLD,
+        max_resumes: int = 5,
+        on_progress: ProgressCallback | None = None,
+    ) -> int:
+        """
+        Download a file from the file manager for the agent specified by agent_id straight to disk, a large chunk at a
+        time, the writes running in the executor. The file is written next to its destination, with a ".part" suffix,
+        and moved there once complete. A dropped connection is resumed from the last byte received, by asking the
+        server for the rest of the file. Files larger than `parallel_threshold` are downloaded as several ranges at
+        once, when the server supports ranges. The bytes are written as sent, never decoded, since the ranges are taken
+        from them.
+        :param agent_id: The agent id
+        :param file_name: The name of the file to download
+        :param dest: The path to save the file to
+        :param chat_id: The chat id, optional
+        :param chunk_size: The size of the chunks written to disk
+        :param max_connections: The maximum number of ranges downloaded at once
+        :param parallel_threshold: The size from which a file is downloaded as several ranges at once
+        :param max_resumes: The maximum number of times each range is resumed after a dropped connection
+        :param on_progress: The callback notified of the bytes received so far and of the size of the file
+        :return: int, the size of the downloaded file
+        """
+        loop = asyncio.get_running_loop()
+        http_client = self.get_http_client(agent_id, chat_id=chat_id)
+        url = self.format_url(f"/files/{file_name}")
+        path = get_partial_path(dest)
+
+        response = await http_client.get(url, stream=True, headers=get_range_headers(0, None, None))
+        try:
+            if response.status_code == 416:  # no range can be satisfied: the file is empty
+                await response.aclose()
+                size, ranged, response = 0, False, None
+            else:
+                response.raise_for_status()
+                size, ranged = get_download_size(response.status_code, response.headers)
+            validator = get_validator(response.headers) if response is not None else None
+            progress = DownloadProgress(size, on_progress)
+            await loop.run_in_executor(None, prepare_partial_file, path, size)
+
+            parts = 1
+            if ranged and size >= parallel_threshold:
+                parts = max(1, min(max_connections, size // chunk_size))
+            ranges = split_ranges(size, parts) if size is not None else [(0, None)]
+
+            arguments = (http_client, url, path, validator, chunk_size, max_resumes, progress)
+            if len(ranges) == 1:
+                size = await self.__download_range(*arguments, *ranges[0], response)
+            else:
+                # the first range is read from the response at hand
+                tasks = [asyncio.ensure_future(self.__download_range(*arguments, *ranges[0], response))]
+                tasks += [asyncio.ensure_future(self.__download_range(*arguments, *r)) for r in ranges[1:]]
+                try:
+                    await asyncio.gather(*tasks)
+                except BaseException:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    raise
+            response = None
+
+            await loop.run_in_executor(None, os.replace, path, dest)
+            return size
+        except BaseException:
+            if response is not None:
+                await response.aclose()
+            remove_partial_file(path)
+            raise
+
+    async def __download_range(
+        self,
+        http_client: AsyncHttpSession,
+        url: str,
+        path: str,
+        validator: str | None,
+        chunk_size: int,
+        max_resumes: int,
+        progress: DownloadProgress,
+        start: int,
+        end: int | None,
+        response: httpx.Response | None = None,
+    ) -> int:
+        """
+        Downloads the range of the file from `start` to `end` excluded, or to its end if None, into the partial file,
+        starting from the given response if any. Returns the position reached.
+        """
+        loop = asyncio.get_running_loop()
+        policy = self.client.http_client.retry_policy or RetryPolicy()
+        position = start
+        resumes = 0
+        try:
+            while end is None or position < end:
+                chunks, buffered = [], 0
+                try:
+                    if response is None:
+                        response = await http_client.get(
+                            url, stream=True, headers=get_range_headers(position, end, validator)
+                        )
+                        response.raise_for_status()
+                    if response.status_code != 206 and position > 0:
+                        # the range was ignored, the file having changed: only a whole download can start over
+                        if start > 0:
+                            raise RuntimeError(f"The file {url} changed on the server during the download")
+                        progress.advance(-position)
+                        await loop.run_in_executor(None, os.truncate, path, 0)
+                        position = 0
+
+                    # the chunks are gathered as they come from the network, as sent, and written together once
+                    # large enough
+                    async for chunk in response.aiter_raw():
+                        if end is not None and position + buffered + len(chunk) > end:
+                            chunk = chunk[:end - position - buffered]
+                        chunks.append(chunk)
+                        buffered += len(chunk)
+                        progress.advance(len(chunk))
+                        if buffered >= chunk_size or position + buffered == end:
+                            await loop.run_in_executor(None, write_chunks, path, position, chunks)
+                            position += buffered
+                            chunks, buffered = [], 0
+                            if position == end:
+                                break
+                    if chunks:
+                        await loop.run_in_executor(None, write_chunks, path, position, chunks)
+                        position += buffered
+                    if end is None:
+                        break
+                except httpx.TransportError:
+                    if chunks:
+                        # what was received before the connection dropped is kept
+                        await loop.run_in_executor(None, write_chunks, path, position, chunks)
+                        position += buffered
+                    if resumes >= max_resumes:
+                        raise
+                finally:
+                    if response is not None:
+                        await response.aclose()
+                        response = None
+
+                if end is None or position < end:
+                    # the connection dropped before the end of the range: resume from where it stopped
+                    await asyncio.sleep(policy.get_delay(resumes))
+                    resumes += 1
+                    if resumes > max_resumes:
+                        raise ConnectionError(f"The download of {url} was interrupted at byte {position}")
+        finally:
+            # the response given is closed even when the range is empty
+            if response is not None:
+                await response.aclose()
+
+        return position
+
+    async def delete_file(self, agent_id: str, file_name: str, chat_id: str | None = None) -> FileManagerDeletedFiles:
+        """
+        Download a file from the file manager for the agent specified by agent_id
+        :param agent_id: The agent id
+        :param file_name: The name of the file to delete
+        :param chat_id: The chat id, optional
+        :return: FileManagerDeletedFiles, the response containing info about the deleted file
+        """
+        return await self.delete(
+            self.format_url(f"/files/{file_name}"),
+            agent_id,
+            output_class=FileManagerDeletedFiles,
+            chat_id=chat_id,
+        )
+
+    async def delete_files(self, agent_id: str, chat_id: str | None = None) -> FileManagerDeletedFiles:
+        """
+        Download a file from the file manager for the agent specified by agent_id
+        :param agent_id: The agent id
+        :param chat_id: The chat id, optional
+        :return: bool, True if all files were deleted successfully
+        """
+        return await self.delete(
+            self.format_url("/files"),
+            agent_id,
+            output_class=FileManagerDeletedFiles,
+            chat_id=chat_id,
+        )
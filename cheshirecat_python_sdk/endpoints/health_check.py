@@ -1,4 +1,4 @@
-from cheshirecat_python_sdk.endpoints.base import AbstractEndpoint
+from cheshirecat_python_sdk.endpoints.base import AbstractEndpoint, AsyncAbstractEndpoint
 
 class HealthCheckEndpoint(AbstractEndpoint):
     def liveness(self):
@@ -9,7 +9,7 @@ class HealthCheckEndpoint(AbstractEndpoint):
         response = self.get_http_session().get("/health/liveness")
         response.raise_for_status()
 
-        return response.json()
+        return self.decode(response)
 
     def readiness(self):
         """
@@ -19,4 +19,26 @@ class HealthCheckEndpoint(AbstractEndpoint):
         response = self.get_http_session().get("/health/readiness")
         response.raise_for_status()
 
-        return response.json()
+        return self.decode(response)
+
+
+class AsyncHealthCheckEndpoint(AsyncAbstractEndpoint):
+    async def liveness(self):
+        """
+        This endpoint is used to check if the server is running.
+        :return: dict, the status of the server.
+        """
+        response = await self.get_http_session().get("/health/liveness")
+        response.raise_for_status()
+
+        return self.decode(response)
+
+    async def readiness(self):
+        """
+        This endpoint is used to check if the server is running.
+        :return: dict, the status of the server.
+        """
+        response = await self.get_http_session().get("/health/readiness")
+        response.raise_for_status()
+
+        return self.decode(response)
@@ -1,18 +1,224 @@
-from typing import Dict, Any
-import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from typing import AsyncIterator, Dict, Any, Iterable, Iterator, List, Tuple
+import asyncio
+import time
 
-from cheshirecat_python_sdk.endpoints.base import AbstractEndpoint
+from cheshirecat_python_sdk.clients.codec import JsonCodec
+from cheshirecat_python_sdk.endpoints.base import AbstractEndpoint, AsyncAbstractEndpoint
 from cheshirecat_python_sdk.models.api.memories import (
     CollectionsOutput,
     CollectionPointsDestroyOutput,
     MemoryRecallOutput,
     MemoryPointOutput,
     MemoryPointDeleteOutput,
+    MemoryPointsBulkOutput,
     MemoryPointsDeleteByMetadataOutput,
     MemoryPointsOutput,
 )
-from cheshirecat_python_sdk.models.api.nested.memories import CollectionsItem
+from cheshirecat_python_sdk.models.api.nested.memories import CollectionsItem, MemoryPointFailure, Record
 from cheshirecat_python_sdk.models.dtos import Why, MemoryPoint, FilterSource
+from cheshirecat_python_sdk.models.vectors import compact_vector, is_compact_vectors
+from cheshirecat_python_sdk.utils import deserialize
+
+
+class AdaptivePageSize:
+    """
+    The size of the pages of a scan, adapted to what the previous pages cost: it doubles while pages come back fast and
+    light, and halves as soon as a page takes longer than `target_latency` seconds or weighs more than `max_bytes`.
+    """
+    __slots__ = ("size", "min_size", "max_size", "target_latency", "max_bytes")
+
+    def __init__(
+        self,
+        size: int,
+        max_size: int | None = None,
+        target_latency: float = 1.0,
+        max_bytes: int = 8 * 1024 * 1024,
+    ):
+        self.size = size
+        self.min_size = min(size, 16)
+        self.max_size = max(max_size, size) if max_size is not None else size
+        self.target_latency = target_latency
+        self.max_bytes = max_bytes
+
+    def observe(self, elapsed: float, size_bytes: int):
+        if elapsed > self.target_latency or size_bytes > self.max_bytes:
+            self.size = max(self.min_size, self.size // 2)
+        elif elapsed < self.target_latency / 2 and size_bytes < self.max_bytes / 2:
+            self.size = min(self.max_size, self.size * 2)
+
+
+def project_memory_point(point: Dict[str, Any], with_vectors: bool, payload_fields: List[str] | None):
+    # the server may send what was not asked for: drop it before validation, which is where most of the time and
+    # memory of the vectors goes
+    if not with_vectors:
+        point.pop("vector", None)
+    if payload_fields is not None and isinstance(point.get("payload"), dict):
+        point["payload"] = {key: value for key, value in point["payload"].items() if key in payload_fields}
+
+
+def to_memory_points_page(
+    content: bytes,
+    with_vectors: bool,
+    codec: JsonCodec,
+    trusted: bool = False,
+    payload_fields: List[str] | None = None,
+) -> MemoryPointsOutput:
+    data = codec.loads(content)
+    if not with_vectors or payload_fields is not None:
+        for point in data.get("points", []):
+            project_memory_point(point, with_vectors, payload_fields)
+    return deserialize(data, MemoryPointsOutput, trusted)
+
+
+def to_memory_recall(data: Dict[str, Any], with_vectors: bool, trusted: bool = False) -> MemoryRecallOutput:
+    if not with_vectors:
+        data.get("query", {}).pop("vector", None)
+        for points in data.get("vectors", {}).get("collections", {}).values():
+            for point in points:
+                point.pop("vector", None)
+    return deserialize(data, MemoryRecallOutput, trusted)
+
+
+def serialize_memory_point(memory_point: MemoryPoint, user_id: str | None, codec: JsonCodec) -> bytes:
+    payload = memory_point.model_dump()
+    if user_id and not payload["metadata"].get("source"):
+        payload["metadata"]["source"] = user_id
+    return codec.dumps(payload)
+
+
+def chunk_memory_points(
+    memory_points: Iterable[MemoryPoint],
+    user_id: str | None,
+    chunk_size: int,
+    max_chunk_bytes: int,
+    codec: JsonCodec,
+) -> Iterator[List[Tuple[int, bytes]]]:
+    """
+    Serializes the memory points and groups them into chunks of at most `chunk_size` points and `max_chunk_bytes` bytes
+    (a single point larger than that makes a chunk on its own), pulling from the iterable only one chunk at a time.
+    :return: Iterator[List[Tuple[int, bytes]]], the chunks of (index, body) pairs
+    """
+    chunk, chunk_bytes = [], 0
+    for index, memory_point in enumerate(memory_points):
+        body = serialize_memory_point(memory_point, user_id, codec)
+        if chunk and (len(chunk) >= chunk_size or chunk_bytes + len(body) > max_chunk_bytes):
+            yield chunk
+            chunk, chunk_bytes = [], 0
+
+        chunk.append((index, body))
+        chunk_bytes += len(body)
+
+    if chunk:
+        yield chunk
+
+
+def to_memory_point_failure(index: int, error: Exception) -> MemoryPointFailure:
+    response = getattr(error, "response", None)
+    return MemoryPointFailure(index=index, error=str(error), status_code=getattr(response, "status_code", None))
+
+
+class MemoryRecallBatch:
+    """
+    The results of many memory recalls, in the order of the queries. The recalls run in the background: iterating over
+    the batch waits for each result in turn, so that the first ones can be used while the others are still running.
+    """
+    def __init__(self, futures: List[Future]):
+        self.__futures = futures
+
+    def __len__(self) -> int:
+        return len(self.__futures)
+
+    def __getitem__(self, index: int) -> MemoryRecallOutput:
+        return self.__futures[index].result()
+
+    def __iter__(self) -> Iterator[MemoryRecallOutput]:
+        for future in self.__futures:
+            yield future.result()
+
+
+class AsyncMemoryRecallBatch:
+    """
+    The results of many memory recalls, in the order of the queries. The recalls run in the background: iterating over
+    the batch waits for each result in turn, so that the first ones can be used while the others are still running.
+    """
+    def __init__(self, tasks: List[asyncio.Task]):
+        self.__tasks = tasks
+
+    def __len__(self) -> int:
+        return len(self.__tasks)
+
+    def __await__(self):
+        return asyncio.gather(*self.__tasks).__await__()
+
+    async def __aiter__(self) -> AsyncIterator[MemoryRecallOutput]:
+        try:
+            for task in self.__tasks:
+                yield await task
+        finally:
+            for task in self.__tasks:
+                task.cancel()
+
+
+def encode_metadata(metadata: Dict[str, Any] | None, codec: JsonCodec) -> str | None:
+    return codec.dumps(metadata, sort_keys=True).decode() if metadata else None
+
+
+def source_query(filter_source: FilterSource, chat_id: str | None) -> Tuple[str, Dict[str, Any]]:
+    """
+    Returns the collection to search, and the metadata to filter by, to find the memory points of the given source.
+    """
+    metadata = {"source": filter_source.source} if filter_source.source else {"hash": filter_source.hash}
+    if chat_id:
+        metadata["chat_id"] = chat_id
+
+    return "declarative" if chat_id is None else "episodic", metadata
+
+
+def memory_recall_query(
+    text: str, k: int | None, metadata: str | None, with_vectors: bool, server_projection: bool = False
+) -> Dict:
+    query = {"text": text}
+    if k:
+        query["k"] = k  # type: ignore
+    if metadata:
+        query["metadata"] = metadata
+    if server_projection and not with_vectors:
+        query["with_vectors"] = "false"
+    return query
+
+
+def to_recalled_memory_point(point: Dict[str, Any], with_vectors: bool) -> Dict[str, Any]:
+    if not with_vectors:
+        point.pop("vector", None)
+    elif is_compact_vectors() and "vector" in point:
+        point["vector"] = compact_vector(point["vector"])
+    return point
+
+
+def memory_points_query(
+    limit: int | None,
+    offset: int | str | None,
+    metadata: Dict[str, Any] | None,
+    codec: JsonCodec,
+    with_vectors: bool = True,
+    payload_fields: List[str] | None = None,
+    server_projection: bool = False,
+) -> Dict:
+    query = {}
+    if limit is not None:
+        query["limit"] = limit
+    if offset is not None:
+        query["offset"] = offset
+    if metadata:
+        query["metadata"] = codec.dumps(metadata).decode()
+    if server_projection:
+        if not with_vectors:
+            query["with_vectors"] = "false"
+        if payload_fields is not None:
+            query["payload_fields"] = payload_fields
+    return query
 
 
 class MemoryEndpoint(AbstractEndpoint):
@@ -20,6 +226,12 @@ class MemoryEndpoint(AbstractEndpoint):
         super().__init__(client)
         self.prefix = "/memory"
 
+    def __invalidate_caches(self, agent_id: str):
+        if self.client.recall_cache is not None:
+            self.client.recall_cache.invalidate(agent_id)
+        if self.client.source_cache is not None:
+            self.client.source_cache.invalidate(agent_id)
+
     # Memory Collections API
 
     def get_memory_collections(self, agent_id: str) -> CollectionsOutput:
@@ -40,11 +252,14 @@ class MemoryEndpoint(AbstractEndpoint):
         :param agent_id: The agent ID.
         :return: CollectionPointsDestroyOutput, a message indicating the number of memory points deleted.
         """
-        return self.delete(
-            self.format_url("/collections"),
-            agent_id,
-            output_class=CollectionPointsDestroyOutput,
-        )
+        try:
+            return self.delete(
+                self.format_url("/collections"),
+                agent_id,
+                output_class=CollectionPointsDestroyOutput,
+            )
+        finally:
+            self.__invalidate_caches(agent_id)
 
     def delete_all_single_memory_collection_points(
         self, collection: str, agent_id: str
@@ -55,11 +270,14 @@ class MemoryEndpoint(AbstractEndpoint):
         :param agent_id: The agent ID.
         :return: CollectionPointsDestroyOutput, a message indicating the number of memory points deleted.
         """
-        return self.delete(
-            self.format_url(f"/collections/{collection}"),
-            agent_id,
-            output_class=CollectionPointsDestroyOutput,
-        )
+        try:
+            return self.delete(
+                self.format_url(f"/collections/{collection}"),
+                agent_id,
+                output_class=CollectionPointsDestroyOutput,
+            )
+        finally:
+            self.__invalidate_caches(agent_id)
 
     def post_memory_collections(self, collection_id: str, agent_id: str) -> CollectionsItem:
         """
@@ -86,6 +304,7 @@ class MemoryEndpoint(AbstractEndpoint):
         k: int | None = None,
         metadata: Dict[str, Any] | None = None,
         chat_id: str | None = None,
+        with_vectors: bool = True,
     ) -> MemoryRecallOutput:
         """
         This endpoint retrieves memory points based on the input text. The text parameter is the input text for which
@@ -96,22 +315,120 @@ class MemoryEndpoint(AbstractEndpoint):
         :param k: The number of memory points to retrieve.
         :param metadata: The metadata to filter the memory points.
         :param chat_id: The chat id, optional
+        :param with_vectors: Whether to return the vectors of the query and of the memory points.
         :return: MemoryRecallOutput, a list of memory points retrieved.
         """
-        query = {"text": text}
-        if k:
-            query["k"] = k  # type: ignore
-        if metadata:
-            query["metadata"] = json.dumps(metadata)  # type: ignore
+        encoded_metadata = encode_metadata(metadata, self.client.json_codec)
+        return self.__get_memory_recall(text, agent_id, user_id, k, encoded_metadata, chat_id, with_vectors)
 
-        return self.get(
+    def __get_memory_recall(
+        self,
+        text: str,
+        agent_id: str,
+        user_id: str,
+        k: int | None,
+        metadata: str | None,
+        chat_id: str | None,
+        with_vectors: bool,
+    ) -> MemoryRecallOutput:
+        cache = self.client.recall_cache
+        if cache is not None:
+            key = cache.get_key(agent_id, user_id, chat_id, text, k, metadata, with_vectors)
+            generation = cache.get_generation(agent_id)
+            result = cache.get(key)
+            if result is not None:
+                return result
+
+        query = memory_recall_query(text, k, metadata, with_vectors, self.client.server_projection)
+        data = self.get(self.format_url("/recall"), agent_id, user_id=user_id, query=query, chat_id=chat_id)
+        result = to_memory_recall(data, with_vectors, self.client.trusted_responses)
+        if cache is not None:
+            cache.put(key, result, generation)
+
+        return result
+
+    def get_memory_recall_many(
+        self,
+        texts: Iterable[str],
+        agent_id: str,
+        user_id: str,
+        k: int | None = None,
+        metadata: Dict[str, Any] | None = None,
+        chat_id: str | None = None,
+        concurrency: int = 8,
+        with_vectors: bool = True,
+    ) -> MemoryRecallBatch:
+        """
+        This method retrieves the memory points of many input texts, running at most `concurrency` recalls at a time
+        over the pooled connections of the client. The metadata filter is encoded once for all the recalls.
+        :param texts: The input texts for which the memory points are retrieved.
+        :param agent_id: The agent ID.
+        :param user_id: The user ID to filter the memory points.
+        :param k: The number of memory points to retrieve for each text.
+        :param metadata: The metadata to filter the memory points.
+        :param chat_id: The chat id, optional
+        :param with_vectors: Whether to return the vectors of the queries and of the memory points.
+        :return: MemoryRecallBatch, the results, in the order of the texts
+        """
+        encoded_metadata = encode_metadata(metadata, self.client.json_codec)
+
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="cheshirecat-memory-recall")
+        futures = [
+            executor.submit(
+                copy_context().run,
+                self.__get_memory_recall,
+                text,
+                agent_id,
+                user_id,
+                k,
+                encoded_metadata,
+                chat_id,
+                with_vectors,
+            )
+            for text in texts
+        ]
+        # the recalls already submitted keep running: the workers just go away once they are done
+        executor.shutdown(wait=False)
+
+        return MemoryRecallBatch(futures)
+
+    def stream_memory_recall(
+        self,
+        text: str,
+        agent_id: str,
+        user_id: str,
+        k: int | None = None,
+        metadata: Dict[str, Any] | None = None,
+        chat_id: str | None = None,
+        with_vectors: bool = True,
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        This method streams the memory points recalled for the input text: they are decoded one at a time, while the
+        response is read from the network, so that the memory used does not grow with k. The recall cache is not used.
+        :param text: The input text for which the memory points are retrieved.
+        :param agent_id: The agent ID.
+        :param user_id: The user ID to filter the memory points.
+        :param k: The number of memory points to retrieve.
+        :param metadata: The metadata to filter the memory points.
+        :param chat_id: The chat id, optional
+        :param with_vectors: Whether to return the vectors of the memory points.
+        :return: Iterator[Tuple[str, Dict[str, Any]]], the (collection, memory point) pairs
+        """
+        query = memory_recall_query(
+            text, k, encode_metadata(metadata, self.client.json_codec), with_vectors, self.client.server_projection
+        )
+        loads = self.client.json_codec.loads
+
+        for fragment in self.stream(
             self.format_url("/recall"),
             agent_id,
-            output_class=MemoryRecallOutput,
-            user_id=user_id,
+            [("vectors", "collections", "*")],
             query=query,
+            user_id=user_id,
             chat_id=chat_id,
-        )
+        ):
+            if fragment.item:
+                yield fragment.path[-1], to_recalled_memory_point(loads(fragment.data), with_vectors)
 
     def post_memory_point(
         self,
@@ -133,12 +450,79 @@ class MemoryEndpoint(AbstractEndpoint):
             metadata["source"] = user_id
             memory_point.metadata = metadata
 
-        return self.post_json(
+        try:
+            return self.post_json(
+                self.format_url(f"/collections/{collection}/points"),
+                agent_id,
+                output_class=MemoryPointOutput,
+                payload=memory_point.model_dump(),
+            )
+        finally:
+            self.__invalidate_caches(agent_id)
+
+    def __post_serialized_memory_point(self, collection: str, agent_id: str, body: bytes) -> str:
+        response = self.get_http_client(agent_id).post(
             self.format_url(f"/collections/{collection}/points"),
-            agent_id,
-            output_class=MemoryPointOutput,
-            payload=memory_point.model_dump(),
+            data=body,
+            headers={"Content-Type": "application/json"},
         )
+        response.raise_for_status()
+        return self.decode(response)["id"]
+
+    def post_memory_points(
+        self,
+        collection: str,
+        agent_id: str,
+        user_id: str | None,
+        memory_points: Iterable[MemoryPoint],
+        chunk_size: int = 500,
+        max_chunk_bytes: int = 8 * 1024 * 1024,
+        concurrency: int = 8,
+    ) -> MemoryPointsBulkOutput:
+        """
+        This method posts many memory points, `concurrency` at a time over the pooled connections of the client. The
+        points are pulled from the iterable in chunks bounded by count and size, and each chunk is prepared while the
+        previous one is being sent, so that the whole input never sits in memory. A failed point does not stop the
+        others: it is reported among the failures.
+        :param collection: The collection to post the memory points.
+        :param agent_id: The agent ID.
+        :param user_id: The user ID to associate with the memory points, as their source if they have none.
+        :param memory_points: The memory points to post, as a list or any iterable.
+        :param chunk_size: The max number of memory points of a chunk.
+        :param max_chunk_bytes: The max size of a chunk, in bytes.
+        :param concurrency: The max number of requests in flight.
+        :return: MemoryPointsBulkOutput, the ID of each memory point posted and the failures
+        """
+        ids: List[str | None] = []
+        failures: List[MemoryPointFailure] = []
+
+        def collect(futures: List[Tuple[int, Future]]):
+            for index, future in futures:
+                try:
+                    ids[index] = future.result()
+                except Exception as e:
+                    failures.append(to_memory_point_failure(index, e))
+
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="cheshirecat-memory-points")
+        try:
+            with executor:
+                pending: List[Tuple[int, Future]] = []
+                codec = self.client.json_codec
+                for chunk in chunk_memory_points(memory_points, user_id, chunk_size, max_chunk_bytes, codec):
+                    ids.extend([None] * len(chunk))
+                    submitted = [
+                        (index, executor.submit(
+                            copy_context().run, self.__post_serialized_memory_point, collection, agent_id, body
+                        ))
+                        for index, body in chunk
+                    ]
+                    collect(pending)
+                    pending = submitted
+                collect(pending)
+        finally:
+            self.__invalidate_caches(agent_id)
+
+        return MemoryPointsBulkOutput(ids=ids, failures=failures)
 
     def put_memory_point(
         self,
@@ -162,12 +546,15 @@ class MemoryEndpoint(AbstractEndpoint):
             metadata["source"] = user_id
             memory_point.metadata = metadata
 
-        return self.put(
-            self.format_url(f"/collections/{collection}/points/{point_id}"),
-            agent_id,
-            output_class=MemoryPointOutput,
-            payload=memory_point.model_dump(),
-        )
+        try:
+            return self.put(
+                self.format_url(f"/collections/{collection}/points/{point_id}"),
+                agent_id,
+                output_class=MemoryPointOutput,
+                payload=memory_point.model_dump(),
+            )
+        finally:
+            self.__invalidate_caches(agent_id)
 
     def delete_memory_point(
         self,
@@ -182,11 +569,14 @@ class MemoryEndpoint(AbstractEndpoint):
         :param point_id: The ID of the memory point to delete.
         :return: MemoryPointDeleteOutput, a message indicating the memory point deleted.
         """
-        return self.delete(
-            self.format_url(f"/collections/{collection}/points/{point_id}"),
-            agent_id,
-            output_class=MemoryPointDeleteOutput,
-        )
+        try:
+            return self.delete(
+                self.format_url(f"/collections/{collection}/points/{point_id}"),
+                agent_id,
+                output_class=MemoryPointDeleteOutput,
+            )
+        finally:
+            self.__invalidate_caches(agent_id)
 
     def delete_memory_points_by_metadata(
         self,
@@ -202,12 +592,15 @@ class MemoryEndpoint(AbstractEndpoint):
         :param metadata: The metadata to filter the memory points.
         :return: MemoryPointsDeleteByMetadataOutput, a message indicating the number of memory points deleted.
         """
-        return self.delete(
-            self.format_url(f"/collections/{collection}/points"),
-            agent_id,
-            output_class=MemoryPointsDeleteByMetadataOutput,
-            payload=metadata,
-        )
+        try:
+            return self.delete(
+                self.format_url(f"/collections/{collection}/points"),
+                agent_id,
+                output_class=MemoryPointsDeleteByMetadataOutput,
+                payload=metadata,
+            )
+        finally:
+            self.__invalidate_caches(agent_id)
 
     def get_memory_points(
         self,
@@ -216,6 +609,8 @@ class MemoryEndpoint(AbstractEndpoint):
         limit: int | None = None,
         offset: int | None = None,
         metadata: Dict[str, Any] | None = None,
+        with_vectors: bool = True,
+        payload_fields: List[str] | None = None,
     ) -> MemoryPointsOutput:
         """
         This endpoint retrieves memory points. The limit parameter is the maximum number of memory points to retrieve.
@@ -225,24 +620,632 @@ class MemoryEndpoint(AbstractEndpoint):
         :param limit: The maximum number of memory points to retrieve.
         :param offset: The number of memory points to skip.
         :param metadata: The metadata to filter the memory points.
+        :param with_vectors: Whether to return the vectors of the memory points.
+        :param payload_fields: The fields of the payloads to return; None for all of them.
         :return: MemoryPointsOutput, a list of memory points retrieved.
         """
-        query = {}
-        if limit is not None:
-            query["limit"] = limit
-        if offset is not None:
-            query["offset"] = offset
-        if metadata:
-            query["metadata"] = json.dumps(metadata)  # type: ignore
+        page, _, _ = self.__get_memory_points_page(
+            collection, agent_id, limit, offset, metadata, with_vectors, payload_fields
+        )
+        return page
 
-        return self.get(
+    def stream_memory_points(
+        self,
+        collection: str,
+        agent_id: str,
+        limit: int | None = None,
+        offset: int | None = None,
+        metadata: Dict[str, Any] | None = None,
+        with_vectors: bool = True,
+        payload_fields: List[str] | None = None,
+    ) -> Iterator[Record]:
+        """
+        This method streams a page of memory points: the points are built one at a time, while the response is read
+        from the network, so that the memory used does not grow with the size of the page. To scan a whole collection,
+        page after page, use iter_memory_points.
+        :param collection: The collection to retrieve the memory points.
+        :param agent_id: The agent ID.
+        :param limit: The maximum number of memory points to retrieve.
+        :param offset: The number of memory points to skip.
+        :param metadata: The metadata to filter the memory points.
+        :param with_vectors: Whether to return the vectors of the memory points.
+        :param payload_fields: The fields of the payloads to return; None for all of them.
+        :return: Iterator[Record], the memory points
+        """
+        codec = self.client.json_codec
+        query = memory_points_query(
+            limit, offset, metadata, codec, with_vectors, payload_fields, self.client.server_projection
+        )
+
+        for fragment in self.stream(
+            self.format_url(f"/collections/{collection}/points"), agent_id, [("points",)], query=query
+        ):
+            if fragment.item:
+                point = codec.loads(fragment.data)
+                project_memory_point(point, with_vectors, payload_fields)
+                yield self.deserialize(point, Record)
+
+    def has_source(self, agent_id: str, filter_source: FilterSource, chat_id: str | None = None) -> bool:
+        """
+        Checks if the given filter source exists for a specified agent.
+
+        This method determines whether a specific source, defined by the given filter_source, is associated with the
+        provided agent in the memory database.
+        It optionally considers a specific chat ID when filtering the data. The result indicates the existence of such a
+        source.
+        Only one memory point is fetched, without its vector. If the client has a source cache, the answer is looked up
+        there first, and stored there afterwards.
+
+        Args:
+            agent_id: Unique identifier of the agent for which the check is performed.
+            filter_source: FilterSource object that defines the source or hash to check.
+            chat_id: An optional chat identifier to narrow the scope of the check. If not provided, the check will
+                operate in a broader context.
+
+        Returns:
+            A boolean value indicating whether the specified filter source exists in the agent's memory database.
+        """
+        cache = self.client.source_cache
+        if cache is not None:
+            key = cache.get_key(agent_id, filter_source, chat_id)
+            generation = cache.get_generation(agent_id)
+            found = cache.get(key)
+            if found is not None:
+                return found
+
+        collection_name, metadata = source_query(filter_source, chat_id)
+        page, _, _ = self.__get_memory_points_page(collection_name, agent_id, 1, None, metadata, False)
+        found = len(page.points) > 0
+        if cache is not None:
+            cache.put(key, found, generation)
+
+        return found
+
+    def has_sources(
+        self,
+        agent_id: str,
+        filter_sources: Iterable[FilterSource],
+        chat_id: str | None = None,
+        concurrency: int = 16,
+    ) -> List[bool]:
+        """
+        This method checks many sources at once, running at most `concurrency` checks at a time over the pooled
+        connections of the client. The sources known by the source cache of the client, if any, are not sent at all.
+        :param agent_id: The agent ID.
+        :param filter_sources: The sources or hashes to check.
+        :param chat_id: The chat id, optional
+        :param concurrency: The max number of checks running at a time.
+        :return: List[bool], whether each source exists, in the order of the sources
+        """
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="cheshirecat-has-source") as executor:
+            futures = [
+                executor.submit(copy_context().run, self.has_source, agent_id, filter_source, chat_id)
+                for filter_source in filter_sources
+            ]
+            return [future.result() for future in futures]
+
+    def __get_memory_points_page(
+        self,
+        collection: str,
+        agent_id: str,
+        limit: int | None,
+        offset: int | str | None,
+        metadata: Dict[str, Any] | None,
+        with_vectors: bool,
+        payload_fields: List[str] | None = None,
+    ) -> Tuple[MemoryPointsOutput, int, float]:
+        start = time.monotonic()
+        response = self.get_http_client(agent_id).get(
             self.format_url(f"/collections/{collection}/points"),
+            params=memory_points_query(
+                limit,
+                offset,
+                metadata,
+                self.client.json_codec,
+                with_vectors,
+                payload_fields,
+                self.client.server_projection,
+            ),
+        )
+        response.raise_for_status()
+        content = response.content
+
+        page = to_memory_points_page(
+            content, with_vectors, self.client.json_codec, self.client.trusted_responses, payload_fields
+        )
+        return page, len(content), time.monotonic() - start
+
+    def iter_memory_points(
+        self,
+        collection: str,
+        agent_id: str,
+        metadata: Dict[str, Any] | None = None,
+        page_size: int = 256,
+        max_page_size: int | None = 4096,
+        with_vectors: bool = True,
+        payload_fields: List[str] | None = None,
+    ) -> Iterator[Record]:
+        """
+        This method iterates over all the memory points of a collection, following the pages returned by the endpoint.
+        The next page is fetched in the background while the current one is consumed, and at most two pages are held in
+        memory. The page size starts at page_size and adapts to the latency and size of the pages, up to max_page_size.
+        :param collection: The collection to scan.
+        :param agent_id: The agent ID.
+        :param metadata: The metadata to filter the memory points.
+        :param page_size: The size of the first page.
+        :param max_page_size: The max size of a page; None to keep the size of the pages fixed.
+        :param with_vectors: Whether to return the vectors of the memory points.
+        :param payload_fields: The fields of the payloads to return; None for all of them.
+        :return: Iterator[Record], the memory points
+        """
+        pager = AdaptivePageSize(page_size, max_page_size)
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cheshirecat-memory-points")
+
+        def fetch(offset: int | str | None) -> Future:
+            return executor.submit(
+                copy_context().run,
+                self.__get_memory_points_page,
+                collection,
+                agent_id,
+                pager.size,
+                offset,
+                metadata,
+                with_vectors,
+                payload_fields,
+            )
+
+        future = fetch(None)
+        try:
+            while future is not None:
+                page, size_bytes, elapsed = future.result()
+                pager.observe(elapsed, size_bytes)
+
+                future = fetch(page.next_offset) if page.points and page.next_offset is not None else None
+                yield from page.points
+        finally:
+            if future is not None:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    # END Memory Points API
+
+
+class AsyncMemoryEndpoint(AsyncAbstractEndpoint):
+    def __init__(self, client: "AsyncCheshireCatClient"):
+        super().__init__(client)
+        self.prefix = "/memory"
+
+    def __invalidate_caches(self, agent_id: str):
+        if self.client.recall_cache is not None:
+            self.client.recall_cache.invalidate(agent_id)
+        if self.client.source_cache is not None:
+            self.client.source_cache.invalidate(agent_id)
+
+    # Memory Collections API
+
+    async def get_memory_collections(self, agent_id: str) -> CollectionsOutput:
+        """
+        This endpoint returns the collections of memory points.
+        :param agent_id: The agent ID.
+        :return: CollectionsOutput, a list of collections of memory points.
+        """
+        return await self.get(
+            self.format_url("/collections"),
+            agent_id,
+            output_class=CollectionsOutput,
+        )
+
+    async def delete_all_memory_collection_points(self, agent_id: str) -> CollectionPointsDestroyOutput:
+        """
+        This endpoint deletes all memory points in all collections for the agent identified by the agentId parameter.
+        :param agent_id: The agent ID.
+        :return: CollectionPointsDestroyOutput, a message indicating the number of memory points deleted.
+        """
+        try:
+            return await self.delete(
+                self.format_url("/collections"),
+                agent_id,
+                output_class=CollectionPointsDestroyOutput,
+            )
+        finally:
+            self.__invalidate_caches(agent_id)
+
+    async def delete_all_single_memory_collection_points(
+        self, collection: str, agent_id: str
+    ) -> CollectionPointsDestroyOutput:
+        """
+        This method deletes all the points in a single collection of memory.
+        :param collection: The collection to delete.
+        :param agent_id: The agent ID.
+        :return: CollectionPointsDestroyOutput, a message indicating the number of memory points deleted.
+        """
+        try:
+            return await self.delete(
+                self.format_url(f"/collections/{collection}"),
+                agent_id,
+                output_class=CollectionPointsDestroyOutput,
+            )
+        finally:
+            self.__invalidate_caches(agent_id)
+
+    async def post_memory_collections(self, collection_id: str, agent_id: str) -> CollectionsItem:
+        """
+        This endpoint returns the collections of memory points.
+        :param collection_id: The ID of the collection to create.
+        :param agent_id: The agent ID.
+        :return: CollectionsItem, the collection created.
+        """
+        return await self.post_json(
+            self.format_url(f"/collections/{collection_id}"),
+            agent_id,
+            output_class=CollectionsItem,
+        )
+
+    # END Memory Collections API
+
+    # Memory Points API
+
+    async def get_memory_recall(
+        self,
+        text: str,
+        agent_id: str,
+        user_id: str,
+        k: int | None = None,
+        metadata: Dict[str, Any] | None = None,
+        chat_id: str | None = None,
+        with_vectors: bool = True,
+    ) -> MemoryRecallOutput:
+        """
+        This endpoint retrieves memory points based on the input text. The text parameter is the input text for which
+        the memory points are retrieved. The k parameter is the number of memory points to retrieve.
+        :param text: The input text for which the memory points are retrieved.
+        :param agent_id: The agent ID.
+        :param user_id: The user ID to filter the memory points.
+        :param k: The number of memory points to retrieve.
+        :param metadata: The metadata to filter the memory points.
+        :param chat_id: The chat id, optional
+        :param with_vectors: Whether to return the vectors of the query and of the memory points.
+        :return: MemoryRecallOutput, a list of memory points retrieved.
+        """
+        encoded_metadata = encode_metadata(metadata, self.client.json_codec)
+        return await self.__get_memory_recall(text, agent_id, user_id, k, encoded_metadata, chat_id, with_vectors)
+
+    async def __get_memory_recall(
+        self,
+        text: str,
+        agent_id: str,
+        user_id: str,
+        k: int | None,
+        metadata: str | None,
+        chat_id: str | None,
+        with_vectors: bool,
+    ) -> MemoryRecallOutput:
+        cache = self.client.recall_cache
+        if cache is not None:
+            key = cache.get_key(agent_id, user_id, chat_id, text, k, metadata, with_vectors)
+            generation = cache.get_generation(agent_id)
+            result = cache.get(key)
+            if result is not None:
+                return result
+
+        query = memory_recall_query(text, k, metadata, with_vectors, self.client.server_projection)
+        data = await self.get(self.format_url("/recall"), agent_id, user_id=user_id, query=query, chat_id=chat_id)
+        result = to_memory_recall(data, with_vectors, self.client.trusted_responses)
+        if cache is not None:
+            cache.put(key, result, generation)
+
+        return result
+
+    async def get_memory_recall_many(
+        self,
+        texts: Iterable[str],
+        agent_id: str,
+        user_id: str,
+        k: int | None = None,
+        metadata: Dict[str, Any] | None = None,
+        chat_id: str | None = None,
+        concurrency: int = 8,
+        with_vectors: bool = True,
+    ) -> AsyncMemoryRecallBatch:
+        """
+        This method retrieves the memory points of many input texts, running at most `concurrency` recalls at a time
+        over the pooled connections of the client. The metadata filter is encoded once for all the recalls. The batch
+        can be iterated with `async for`, or awaited to get all the results at once.
+        :param texts: The input texts for which the memory points are retrieved.
+        :param agent_id: The agent ID.
+        :param user_id: The user ID to filter the memory points.
+        :param k: The number of memory points to retrieve for each text.
+        :param metadata: The metadata to filter the memory points.
+        :param chat_id: The chat id, optional
+        :param with_vectors: Whether to return the vectors of the queries and of the memory points.
+        :return: AsyncMemoryRecallBatch, the results, in the order of the texts
+        """
+        encoded_metadata = encode_metadata(metadata, self.client.json_codec)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def recall(text: str) -> MemoryRecallOutput:
+            async with semaphore:
+                return await self.__get_memory_recall(
+                    text, agent_id, user_id, k, encoded_metadata, chat_id, with_vectors
+                )
+
+        return AsyncMemoryRecallBatch([asyncio.create_task(recall(text)) for text in texts])
+
+    async def stream_memory_recall(
+        self,
+        text: str,
+        agent_id: str,
+        user_id: str,
+        k: int | None = None,
+        metadata: Dict[str, Any] | None = None,
+        chat_id: str | None = None,
+        with_vectors: bool = True,
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        This method streams the memory points recalled for the input text: they are decoded one at a time, while the
+        response is read from the network, so that the memory used does not grow with k. The recall cache is not used.
+        :param text: The input text for which the memory points are retrieved.
+        :param agent_id: The agent ID.
+        :param user_id: The user ID to filter the memory points.
+        :param k: The number of memory points to retrieve.
+        :param metadata: The metadata to filter the memory points.
+        :param chat_id: The chat id, optional
+        :param with_vectors: Whether to return the vectors of the memory points.
+        :return: AsyncIterator[Tuple[str, Dict[str, Any]]], the (collection, memory point) pairs
+        """
+        query = memory_recall_query(
+            text, k, encode_metadata(metadata, self.client.json_codec), with_vectors, self.client.server_projection
+        )
+        loads = self.client.json_codec.loads
+
+        async for fragment in self.stream(
+            self.format_url("/recall"),
             agent_id,
-            output_class=MemoryPointsOutput,
+            [("vectors", "collections", "*")],
             query=query,
+            user_id=user_id,
+            chat_id=chat_id,
+        ):
+            if fragment.item:
+                yield fragment.path[-1], to_recalled_memory_point(loads(fragment.data), with_vectors)
+
+    async def post_memory_point(
+        self,
+        collection: str,
+        agent_id: str,
+        user_id: str,
+        memory_point: MemoryPoint,
+    ) -> MemoryPointOutput:
+        """
+        This method posts a memory point.
+        :param collection: The collection to post the memory point.
+        :param agent_id: The agent ID.
+        :param user_id: The user ID to associate with the memory point.
+        :param memory_point: The memory point to post.
+        :return: MemoryPointOutput, the memory point posted.
+        """
+        if user_id and not memory_point.metadata.get("source"):
+            metadata = memory_point.metadata
+            metadata["source"] = user_id
+            memory_point.metadata = metadata
+
+        try:
+            return await self.post_json(
+                self.format_url(f"/collections/{collection}/points"),
+                agent_id,
+                output_class=MemoryPointOutput,
+                payload=memory_point.model_dump(),
+            )
+        finally:
+            self.__invalidate_caches(agent_id)
+
+    async def __post_serialized_memory_point(self, collection: str, agent_id: str, body: bytes) -> str:
+        response = await self.get_http_client(agent_id).post(
+            self.format_url(f"/collections/{collection}/points"),
+            content=body,
+            headers={"Content-Type": "application/json"},
         )
+        response.raise_for_status()
+        return self.decode(response)["id"]
 
-    def has_source(self, agent_id: str, filter_source: FilterSource, chat_id: str | None = None) -> bool:
+    async def post_memory_points(
+        self,
+        collection: str,
+        agent_id: str,
+        user_id: str | None,
+        memory_points: Iterable[MemoryPoint],
+        chunk_size: int = 500,
+        max_chunk_bytes: int = 8 * 1024 * 1024,
+        concurrency: int = 8,
+    ) -> MemoryPointsBulkOutput:
+        """
+        This method posts many memory points, `concurrency` at a time over the pooled connections of the client. The
+        points are pulled from the iterable in chunks bounded by count and size, and each chunk is prepared while the
+        previous one is being sent, so that the whole input never sits in memory. A failed point does not stop the
+        others: it is reported among the failures.
+        :param collection: The collection to post the memory points.
+        :param agent_id: The agent ID.
+        :param user_id: The user ID to associate with the memory points, as their source if they have none.
+        :param memory_points: The memory points to post, as a list or any iterable.
+        :param chunk_size: The max number of memory points of a chunk.
+        :param max_chunk_bytes: The max size of a chunk, in bytes.
+        :param concurrency: The max number of requests in flight.
+        :return: MemoryPointsBulkOutput, the ID of each memory point posted and the failures
+        """
+        ids: List[str | None] = []
+        failures: List[MemoryPointFailure] = []
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def post(body: bytes) -> str:
+            async with semaphore:
+                return await self.__post_serialized_memory_point(collection, agent_id, body)
+
+        async def collect(tasks: List[Tuple[int, asyncio.Task]]):
+            for index, task in tasks:
+                try:
+                    ids[index] = await task
+                except Exception as e:
+                    failures.append(to_memory_point_failure(index, e))
+
+        pending: List[Tuple[int, asyncio.Task]] = []
+        submitted: List[Tuple[int, asyncio.Task]] = []
+        try:
+            codec = self.client.json_codec
+            for chunk in chunk_memory_points(memory_points, user_id, chunk_size, max_chunk_bytes, codec):
+                ids.extend([None] * len(chunk))
+                submitted = [(index, asyncio.create_task(post(body))) for index, body in chunk]
+                await collect(pending)
+                pending = submitted
+            await collect(pending)
+        finally:
+            for _, task in pending + submitted:
+                task.cancel()
+            self.__invalidate_caches(agent_id)
+
+        return MemoryPointsBulkOutput(ids=ids, failures=failures)
+
+    async def put_memory_point(
+        self,
+        collection: str,
+        agent_id: str,
+        user_id: str,
+        memory_point: MemoryPoint,
+        point_id: str,
+    ) -> MemoryPointOutput:
+        """
+        This method puts a memory point, for the agent identified by the agent_id parameter.
+        :param collection: The collection to put the memory point.
+        :param agent_id: The agent ID.
+        :param user_id: The user ID to associate with the memory point.
+        :param memory_point: The memory point to put.
+        :param point_id: The ID of the memory point to put.
+        :return: MemoryPointOutput, the memory point put.
+        """
+        if user_id and not memory_point.metadata.get("source"):
+            metadata = memory_point.metadata
+            metadata["source"] = user_id
+            memory_point.metadata = metadata
+
+        try:
+            return await self.put(
+                self.format_url(f"/collections/{collection}/points/{point_id}"),
+                agent_id,
+                output_class=MemoryPointOutput,
+                payload=memory_point.model_dump(),
+            )
+        finally:
+            self.__invalidate_caches(agent_id)
+
+    async def delete_memory_point(
+        self,
+        collection: str,
+        agent_id: str,
+        point_id: str,
+    ) -> MemoryPointDeleteOutput:
+        """
+        This endpoint deletes a memory point.
+        :param collection: The collection to delete the memory point.
+        :param agent_id: The agent ID.
+        :param point_id: The ID of the memory point to delete.
+        :return: MemoryPointDeleteOutput, a message indicating the memory point deleted.
+        """
+        try:
+            return await self.delete(
+                self.format_url(f"/collections/{collection}/points/{point_id}"),
+                agent_id,
+                output_class=MemoryPointDeleteOutput,
+            )
+        finally:
+            self.__invalidate_caches(agent_id)
+
+    async def delete_memory_points_by_metadata(
+        self,
+        collection: str,
+        agent_id: str,
+        metadata: Dict[str, Any] | None = None,
+    ) -> MemoryPointsDeleteByMetadataOutput:
+        """
+        This endpoint deletes memory points based on the metadata. The metadata parameter is a dictionary of key-value
+        pairs that the memory points must match.
+        :param collection: The collection to delete the memory points.
+        :param agent_id: The agent ID.
+        :param metadata: The metadata to filter the memory points.
+        :return: MemoryPointsDeleteByMetadataOutput, a message indicating the number of memory points deleted.
+        """
+        try:
+            return await self.delete(
+                self.format_url(f"/collections/{collection}/points"),
+                agent_id,
+                output_class=MemoryPointsDeleteByMetadataOutput,
+                payload=metadata,
+            )
+        finally:
+            self.__invalidate_caches(agent_id)
+
+    async def get_memory_points(
+        self,
+        collection: str,
+        agent_id: str,
+        limit: int | None = None,
+        offset: int | None = None,
+        metadata: Dict[str, Any] | None = None,
+        with_vectors: bool = True,
+        payload_fields: List[str] | None = None,
+    ) -> MemoryPointsOutput:
+        """
+        This endpoint retrieves memory points. The limit parameter is the maximum number of memory points to retrieve.
+        The offset parameter is the number of memory points to skip.
+        :param collection: The collection to retrieve the memory points.
+        :param agent_id: The agent ID.
+        :param limit: The maximum number of memory points to retrieve.
+        :param offset: The number of memory points to skip.
+        :param metadata: The metadata to filter the memory points.
+        :param with_vectors: Whether to return the vectors of the memory points.
+        :param payload_fields: The fields of the payloads to return; None for all of them.
+        :return: MemoryPointsOutput, a list of memory points retrieved.
+        """
+        page, _, _ = await self.__get_memory_points_page(
+            collection, agent_id, limit, offset, metadata, with_vectors, payload_fields
+        )
+        return page
+
+    async def stream_memory_points(
+        self,
+        collection: str,
+        agent_id: str,
+        limit: int | None = None,
+        offset: int | None = None,
+        metadata: Dict[str, Any] | None = None,
+        with_vectors: bool = True,
+        payload_fields: List[str] | None = None,
+    ) -> AsyncIterator[Record]:
+        """
+        This method streams a page of memory points: the points are built one at a time, while the response is read
+        from the network, so that the memory used does not grow with the size of the page. To scan a whole collection,
+        page after page, use iter_memory_points.
+        :param collection: The collection to retrieve the memory points.
+        :param agent_id: The agent ID.
+        :param limit: The maximum number of memory points to retrieve.
+        :param offset: The number of memory points to skip.
+        :param metadata: The metadata to filter the memory points.
+        :param with_vectors: Whether to return the vectors of the memory points.
+        :param payload_fields: The fields of the payloads to return; None for all of them.
+        :return: AsyncIterator[Record], the memory points
+        """
+        codec = self.client.json_codec
+        query = memory_points_query(
+            limit, offset, metadata, codec, with_vectors, payload_fields, self.client.server_projection
+        )
+
+        async for fragment in self.stream(
+            self.format_url(f"/collections/{collection}/points"), agent_id, [("points",)], query=query
+        ):
+            if fragment.item:
+                point = codec.loads(fragment.data)
+                project_memory_point(point, with_vectors, payload_fields)
+                yield self.deserialize(point, Record)
+
+    async def has_source(self, agent_id: str, filter_source: FilterSource, chat_id: str | None = None) -> bool:
         """
         Checks if the given filter source exists for a specified agent.
 
@@ -250,6 +1253,8 @@ class MemoryEndpoint(AbstractEndpoint):
         provided agent in the memory database.
         It optionally considers a specific chat ID when filtering the data. The result indicates the existence of such a
         source.
+        Only one memory point is fetched, without its vector. If the client has a source cache, the answer is looked up
+        there first, and stored there afterwards.
 
         Args:
             agent_id: Unique identifier of the agent for which the check is performed.
@@ -260,13 +1265,118 @@ class MemoryEndpoint(AbstractEndpoint):
         Returns:
             A boolean value indicating whether the specified filter source exists in the agent's memory database.
         """
-        metadata = {"source": filter_source.source} if filter_source.source else {"hash": filter_source.hash}
-        if chat_id:
-            metadata["chat_id"] = chat_id
+        cache = self.client.source_cache
+        if cache is not None:
+            key = cache.get_key(agent_id, filter_source, chat_id)
+            generation = cache.get_generation(agent_id)
+            found = cache.get(key)
+            if found is not None:
+                return found
+
+        collection_name, metadata = source_query(filter_source, chat_id)
+        page, _, _ = await self.__get_memory_points_page(collection_name, agent_id, 1, None, metadata, False)
+        found = len(page.points) > 0
+        if cache is not None:
+            cache.put(key, found, generation)
+
+        return found
+
+    async def has_sources(
+        self,
+        agent_id: str,
+        filter_sources: Iterable[FilterSource],
+        chat_id: str | None = None,
+        concurrency: int = 16,
+    ) -> List[bool]:
+        """
+        This method checks many sources at once, running at most `concurrency` checks at a time over the pooled
+        connections of the client. The sources known by the source cache of the client, if any, are not sent at all.
+        :param agent_id: The agent ID.
+        :param filter_sources: The sources or hashes to check.
+        :param chat_id: The chat id, optional
+        :param concurrency: The max number of checks running at a time.
+        :return: List[bool], whether each source exists, in the order of the sources
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def check(filter_source: FilterSource) -> bool:
+            async with semaphore:
+                return await self.has_source(agent_id, filter_source, chat_id)
+
+        return list(await asyncio.gather(*[check(filter_source) for filter_source in filter_sources]))
+
+    async def __get_memory_points_page(
+        self,
+        collection: str,
+        agent_id: str,
+        limit: int | None,
+        offset: int | str | None,
+        metadata: Dict[str, Any] | None,
+        with_vectors: bool,
+        payload_fields: List[str] | None = None,
+    ) -> Tuple[MemoryPointsOutput, int, float]:
+        start = time.monotonic()
+        response = await self.get_http_client(agent_id).get(
+            self.format_url(f"/collections/{collection}/points"),
+            params=memory_points_query(
+                limit,
+                offset,
+                metadata,
+                self.client.json_codec,
+                with_vectors,
+                payload_fields,
+                self.client.server_projection,
+            ),
+        )
+        response.raise_for_status()
+        content = response.content
+
+        page = to_memory_points_page(
+            content, with_vectors, self.client.json_codec, self.client.trusted_responses, payload_fields
+        )
+        return page, len(content), time.monotonic() - start
+
+    async def iter_memory_points(
+        self,
+        collection: str,
+        agent_id: str,
+        metadata: Dict[str, Any] | None = None,
+        page_size: int = 256,
+        max_page_size: int | None = 4096,
+        with_vectors: bool = True,
+        payload_fields: List[str] | None = None,
+    ) -> AsyncIterator[Record]:
+        """
+        This method iterates over all the memory points of a collection, following the pages returned by the endpoint.
+        The next page is fetched in the background while the current one is consumed, and at most two pages are held in
+        memory. The page size starts at page_size and adapts to the latency and size of the pages, up to max_page_size.
+        :param collection: The collection to scan.
+        :param agent_id: The agent ID.
+        :param metadata: The metadata to filter the memory points.
+        :param page_size: The size of the first page.
+        :param max_page_size: The max size of a page; None to keep the size of the pages fixed.
+        :param with_vectors: Whether to return the vectors of the memory points.
+        :param payload_fields: The fields of the payloads to return; None for all of them.
+        :return: AsyncIterator[Record], the memory points
+        """
+        pager = AdaptivePageSize(page_size, max_page_size)
+
+        def fetch(offset: int | str | None) -> asyncio.Task:
+            return asyncio.create_task(self.__get_memory_points_page(
+                collection, agent_id, pager.size, offset, metadata, with_vectors, payload_fields
+            ))
 
-        collection_name = "declarative" if chat_id is None else "episodic"
-        points = self.get_memory_points(collection_name, agent_id, metadata=metadata)
+        task = fetch(None)
+        try:
+            while task is not None:
+                page, size_bytes, elapsed = await task
+                pager.observe(elapsed, size_bytes)
 
-        return len(points.points) > 0
+                task = fetch(page.next_offset) if page.points and page.next_offset is not None else None
+                for point in page.points:
+                    yield point
+        finally:
+            if task is not None:
+                task.cancel()
 
     # END Memory Points API
@@ -1,12 +1,161 @@
-from typing import Callable
+from typing import Any, Callable, Dict
+import asyncio
 import json
 
-from cheshirecat_python_sdk.endpoints.base import AbstractEndpoint
-from cheshirecat_python_sdk.models.api.messages import ChatOutput
+from cheshirecat_python_sdk.clients import WSClient
+from cheshirecat_python_sdk.endpoints.base import AbstractEndpoint, AsyncAbstractEndpoint
+from cheshirecat_python_sdk.models.api.messages import (
+    ChatOutput,
+    ChatOutputEvent,
+    ChatTokenEvent,
+    NotificationEvent,
+    StreamEvent,
+)
 from cheshirecat_python_sdk.models.dtos import Message
 from cheshirecat_python_sdk.utils import deserialize
 
 
+def _to_token_event(data: Dict) -> ChatTokenEvent:
+    return ChatTokenEvent(content=data.get("content", ""))
+
+
+def _to_chat_output_event(data: Dict) -> ChatOutputEvent:
+    return ChatOutputEvent(output=deserialize(data, ChatOutput))
+
+
+def _to_notification_event(data: Dict) -> NotificationEvent:
+    return NotificationEvent(type=data.get("type") or "notification", content=data.get("content", data))
+
+
+# how to build the event of each type of frame; the frames of unknown type are notifications
+FRAME_HANDLERS: Dict[str, Callable[[Dict], StreamEvent]] = {
+    "chat_token": _to_token_event,
+    "chat": _to_chat_output_event,
+}
+
+
+def to_stream_event(frame: str | bytes, loads: Callable[[str | bytes], Any] = json.loads) -> StreamEvent:
+    """
+    Converts a frame received from the websocket into the corresponding event, parsing it only once. Only the final
+    answer is validated.
+    :param frame: The raw frame.
+    :param loads: The function parsing the frame, e.g. the `loads` of the JSON codec of the client.
+    :return: StreamEvent, the event
+    """
+    try:
+        data = loads(frame)
+    except ValueError:
+        return NotificationEvent(type="notification", content=frame)
+    if not isinstance(data, dict):
+        return NotificationEvent(type="notification", content=data)
+
+    frame_type = data.get("type")
+    if frame_type is None:
+        # the final answer carries its type in the message only
+        message = data.get("message")
+        frame_type = message.get("type") if isinstance(message, dict) else None
+
+    return FRAME_HANDLERS.get(frame_type, _to_notification_event)(data)
+
+
+class MessageStream:
+    """
+    The answer to a message sent via WebSocket, as an asynchronous iterator of events: the tokens and notifications
+    sent by the agent while generating the answer, and finally the answer itself, which stays available in `output`.
+    Frames are received in the background into a bounded buffer: when the consumer falls behind and the buffer is full,
+    receiving pauses until the consumer catches up, so that a slow consumer never makes memory grow.
+
+    Use it as an asynchronous context manager, so that the connection is released even if the iteration is abandoned:
+        async with client.message.stream_websocket_message(message, "agent", "user") as stream:
+            async for event in stream:
+                ...
+    """
+    def __init__(
+        self,
+        ws_client: WSClient,
+        payload: bytes,
+        agent_id: str,
+        user_id: str,
+        chat_id: str | None = None,
+        buffer_size: int = 64,
+    ):
+        self.ws_client = ws_client
+        self.payload = payload
+        self.agent_id = agent_id
+        self.user_id = user_id
+        self.chat_id = chat_id
+        self.output: ChatOutput | None = None
+
+        self.__queue: asyncio.Queue[StreamEvent | BaseException] = asyncio.Queue(maxsize=buffer_size)
+        self.__task: asyncio.Task | None = None
+        self.__finished = False
+
+    async def __receive(self):
+        try:
+            async with self.ws_client.connection(self.agent_id, self.user_id, self.chat_id) as client:
+                await client.send(self.payload, text=True)
+
+                while True:
+                    frame = await self.ws_client.receive(client)
+                    if not frame:
+                        raise RuntimeError("Error receiving message")
+
+                    event = to_stream_event(frame, self.ws_client.json_codec.loads)
+                    await self.__queue.put(event)
+                    if isinstance(event, ChatOutputEvent):
+                        return
+        except (TimeoutError, ValueError) as e:
+            await self.__fail(e)
+        except Exception as e:
+            await self.__fail(Exception(f"WebSocket error: {str(e)}"))
+
+    async def __fail(self, error: BaseException):
+        # nobody is waiting for the events anymore when the stream has been closed
+        if not self.__finished:
+            await self.__queue.put(error)
+
+    def __aiter__(self) -> "MessageStream":
+        return self
+
+    async def __anext__(self) -> StreamEvent:
+        if self.__finished:
+            raise StopAsyncIteration
+        if self.__task is None:
+            self.__task = asyncio.create_task(self.__receive())
+
+        event = await self.__queue.get()
+        if isinstance(event, BaseException):
+            self.__finished = True
+            raise event
+
+        if isinstance(event, ChatOutputEvent):
+            self.__finished = True
+            self.output = event.output
+        return event
+
+    async def aclose(self):
+        """
+        Stops receiving. If the answer was not complete yet, the connection is dropped rather than reused.
+        """
+        self.__finished = True
+        task = self.__task
+        if task is None:
+            return
+
+        while not task.done():
+            # a cancellation racing with the end of a receive can get lost (bpo-42130): insist until the task ends
+            task.cancel()
+            await asyncio.wait({task}, timeout=0.1)
+        if not task.cancelled():
+            task.exception()
+
+    async def __aenter__(self) -> "MessageStream":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+
 class MessageEndpoint(AbstractEndpoint):
     def send_http_message(
         self,
@@ -46,32 +195,87 @@ class MessageEndpoint(AbstractEndpoint):
         :param agent_id: the agent id
         :param user_id: the user id
         :param chat_id: the chat id
-        :param callback: callable, a callback function that will be called for each message received
+        :param callback: callable, a callback function that will be called with each raw frame received before the
+            final answer, as it always has been; `stream_websocket_message` yields the same frames as typed events
         :return: ChatOutput object
         """
         try:
-            json_data = json.dumps(message.model_dump())
+            json_data = self.client.json_codec.dumps(message.model_dump())
         except Exception:
             raise RuntimeError("Error encoding message")
 
-        client = await self.get_ws_client(agent_id, user_id, chat_id)
-
+        ws_client = self.client.ws_client
         try:
-            await client.send(json_data)
+            # the connection stays open for the next messages of the conversation, unless something goes wrong
+            async with ws_client.connection(agent_id, user_id, chat_id) as client:
+                await client.send(json_data, text=True)
 
-            while True:
-                response = await client.recv()
-                if not response:
-                    raise RuntimeError("Error receiving message")
+                while True:
+                    frame = await ws_client.receive(client)
+                    if not frame:
+                        raise RuntimeError("Error receiving message")
 
-                if '"type":"chat"' not in response:
+                    event = to_stream_event(frame, ws_client.json_codec.loads)
+                    if isinstance(event, ChatOutputEvent):
+                        return event.output
                     if callback:
-                        callback(response)
-                    continue
-                break
+                        callback(frame)
+        except (TimeoutError, ValueError):
+            raise
         except Exception as e:
-            await client.close()
             raise Exception(f"WebSocket error: {str(e)}")
 
-        await client.close()
-        return deserialize(json.loads(response), ChatOutput)
+    def stream_websocket_message(
+        self,
+        message: Message,
+        agent_id: str,
+        user_id: str,
+        chat_id: str | None = None,
+        buffer_size: int = 64,
+    ) -> MessageStream:
+        """
+        This endpoint sends a message to the agent identified by the agentId parameter via WebSocket, and streams the
+        answer as typed events: ChatTokenEvent for each token, NotificationEvent for the other notifications and
+        ChatOutputEvent, the last one, for the final answer.
+        :param message: Message object, the message to send
+        :param agent_id: the agent id
+        :param user_id: the user id
+        :param chat_id: the chat id (optional)
+        :param buffer_size: the max number of events received and not consumed yet
+        :return: MessageStream, the asynchronous iterator of the events
+        """
+        try:
+            json_data = self.client.json_codec.dumps(message.model_dump())
+        except Exception:
+            raise RuntimeError("Error encoding message")
+
+        return MessageStream(self.client.ws_client, json_data, agent_id, user_id, chat_id, buffer_size)
+
+
+class AsyncMessageEndpoint(AsyncAbstractEndpoint):
+    async def send_http_message(
+        self,
+        message: Message,
+        agent_id: str,
+        user_id: str,
+        chat_id: str | None = None,
+    ) -> ChatOutput:
+        """
+        This endpoint sends a message to the agent identified by the agentId parameter. The message is sent via HTTP.
+        :param message: Message object, the message to send
+        :param agent_id: the agent id
+        :param user_id: the user id
+        :param chat_id: the chat id (optional)
+        :return: ChatOutput object
+        """
+        return await self.post_json(
+            '/message',
+            agent_id,
+            output_class=ChatOutput,
+            payload=message.model_dump(),
+            user_id=user_id,
+            chat_id=chat_id,
+        )
+
+    send_websocket_message = MessageEndpoint.send_websocket_message
+    stream_websocket_message = MessageEndpoint.stream_websocket_message
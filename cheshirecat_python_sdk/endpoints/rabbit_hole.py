@@ -1,96 +1,496 @@
-import json
-from pathlib import Path
-from typing import Dict, Any, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from fnmatch import fnmatch
+from functools import partial
+from itertools import islice
+from typing import AsyncIterator, Callable, Collection, Dict, Any, Iterable, Iterator, List, Set, Tuple
+import asyncio
+import hashlib
+import os
+import re
+import time
+import weakref
+from urllib.parse import urlsplit, urlunsplit
 
-from cheshirecat_python_sdk.endpoints.base import AbstractEndpoint, MultipartPayload
+from cheshirecat_python_sdk.cache import AgentCache
+from cheshirecat_python_sdk.clients.multipart import CHUNK_SIZE, ProgressCallback, UploadSource
+from cheshirecat_python_sdk.clients.resilience import RateLimiter
+from cheshirecat_python_sdk.clients.websocket_client import ConnectionKey, WSClient
+from cheshirecat_python_sdk.endpoints.base import AbstractEndpoint, AsyncAbstractEndpoint, MultipartPayload
+from cheshirecat_python_sdk.endpoints.message import to_stream_event
+from cheshirecat_python_sdk.enums import IngestionFileStatus
+from cheshirecat_python_sdk.models.api.messages import NotificationEvent
 from cheshirecat_python_sdk.models.api.rabbit_holes import (
     AllowedMimeTypesOutput,
+    IngestionFileReport,
+    IngestionReport,
+    IngestionResult,
     UploadSingleFileResponse,
     UploadUrlResponse,
+    WebIngestionResult,
 )
-from cheshirecat_python_sdk.utils import deserialize, file_attributes
+from cheshirecat_python_sdk.models.dtos import FilterSource
+from cheshirecat_python_sdk.utils import mime_type_detector, upload_attributes
+
+FileReportCallback = Callable[[IngestionFileReport], None]
+
+ALLOWED_MIME_TYPES_TTL = 300.0
+WEB_SOURCES_TTL = 300.0
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def walk_files(root: str | os.PathLike, pattern: str = "*", recursive: bool = True) -> Iterator[str]:
+    """
+    Yields the paths of the files under root whose name matches the pattern, directory by directory in name order,
+    without listing the whole tree up front and keeping a single directory open at a time.
+    """
+    directories = [os.fspath(root)]
+    while directories:
+        with os.scandir(directories.pop()) as iterator:
+            entries = sorted(iterator, key=lambda entry: entry.name)
+
+        subdirectories = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    subdirectories.append(entry.path)
+            elif entry.is_file() and fnmatch(entry.name, pattern):
+                yield entry.path
+        directories.extend(reversed(subdirectories))
+
+
+def inspect_file(path: str, allowed_mime_types: Collection[str]) -> IngestionFileReport:
+    """
+    Reads a file once: its MIME type is detected from its head, unless already known, and, if the type is allowed, its
+    content is hashed.
+    """
+    report = IngestionFileReport(path=path)
+    try:
+        with open(path, "rb") as file:
+            head = file.read(CHUNK_SIZE)
+            report.content_type = mime_type_detector.detect_file(path, head, allowed_mime_types or None)
+            if allowed_mime_types and report.content_type not in allowed_mime_types:
+                report.status = IngestionFileStatus.UNSUPPORTED
+                return report
+
+            digest, size = hashlib.sha256(head), len(head)
+            for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+                size += len(chunk)
+            report.hash, report.size = digest.hexdigest(), size
+    except OSError as e:
+        report.status, report.error = IngestionFileStatus.FAILED, str(e)
+    return report
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalizes a web URL, so that the spellings of the same page compare equal: the scheme and the host are lowered,
+    the default port and the fragment are dropped, and an empty path becomes "/".
+    :param url: The URL.
+    :return: str, the normalized URL
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS or not parts.hostname:
+        raise ValueError(f"Invalid web URL: {url!r}")
+
+    host = f"[{parts.hostname}]" if ":" in parts.hostname else parts.hostname
+    port = parts.port
+    netloc = host if port is None or port == _DEFAULT_PORTS[scheme] else f"{host}:{port}"
+    user_info = parts.netloc.rpartition("@")[0]
+    if user_info:
+        netloc = f"{user_info}@{netloc}"
+
+    return urlunsplit((scheme, netloc, parts.path or "/", parts.query, ""))
+
+
+def to_web_sources(urls: Iterable[str]) -> Set[str]:
+    sources = set()
+    for url in urls:
+        try:
+            sources.add(normalize_url(url))
+        except ValueError:
+            sources.add(url)
+    return sources
+
+
+def split_web_urls(
+    urls: Iterable[str], existing: Collection[str]
+) -> Tuple[List[WebIngestionResult], List[WebIngestionResult]]:
+    """
+    Normalizes the URLs and marks the invalid ones as failed, the ones among the existing sources and the repeated ones.
+    :return: the results of all the URLs, in their order, and the results of the URLs to post
+    """
+    results, to_post, seen = [], [], set()
+    for url in urls:
+        try:
+            result = WebIngestionResult(url=url, normalized_url=normalize_url(url))
+        except ValueError as e:
+            results.append(
+                WebIngestionResult(url=url, normalized_url=url, status=IngestionFileStatus.FAILED, error=str(e))
+            )
+            continue
+
+        if result.normalized_url in seen:
+            result.status = IngestionFileStatus.DUPLICATE
+        elif result.normalized_url in existing:
+            result.status = IngestionFileStatus.EXISTING
+        else:
+            seen.add(result.normalized_url)
+            to_post.append(result)
+        results.append(result)
+    return results, to_post
+
+
+def mark_web_failed(result: WebIngestionResult, error: Exception):
+    response = getattr(error, "response", None)
+    result.status, result.error = IngestionFileStatus.FAILED, str(error)
+    result.status_code = getattr(response, "status_code", None)
+
+
+def mark_duplicates(reports: Iterable[IngestionFileReport], seen_hashes: Set[str]) -> List[IngestionFileReport]:
+    """
+    Marks the files whose content has already been met, and returns the others still pending.
+    """
+    pending = []
+    for report in reports:
+        if report.status != IngestionFileStatus.PENDING:
+            continue
+        if report.hash in seen_hashes:
+            report.status = IngestionFileStatus.DUPLICATE
+        else:
+            seen_hashes.add(report.hash)
+            pending.append(report)
+    return pending
+
+
+def batch_files(
+    reports: Iterable[IngestionFileReport], batch_size: int, max_batch_bytes: int
+) -> Iterator[List[IngestionFileReport]]:
+    """
+    Groups the files into batches of at most `batch_size` files and `max_batch_bytes` bytes (a single file larger than
+    that makes a batch on its own). Files with the same name, e.g. the README.md of different folders, go to different
+    batches, since the server answers for each file of a batch by its name.
+    """
+    batch, batch_bytes, names = [], 0, set()
+    for report in reports:
+        name = os.path.basename(report.path)
+        if batch and (len(batch) >= batch_size or batch_bytes + report.size > max_batch_bytes or name in names):
+            yield batch
+            batch, batch_bytes, names = [], 0, set()
+
+        batch.append(report)
+        batch_bytes += report.size
+        names.add(name)
+
+    if batch:
+        yield batch
+
+
+def mark_uploaded(batch: List[IngestionFileReport], result: Dict[str, UploadSingleFileResponse]):
+    for report in batch:
+        report.status = IngestionFileStatus.UPLOADED
+        report.response = result.get(os.path.basename(report.path))
+
+
+def mark_failed(batch: List[IngestionFileReport], error: Exception):
+    response = getattr(error, "response", None)
+    for report in batch:
+        report.status, report.error = IngestionFileStatus.FAILED, str(error)
+        report.status_code = getattr(response, "status_code", None)
+
+
+def to_ingestion_report(reports: List[IngestionFileReport], elapsed: float) -> IngestionReport:
+    uploaded = [report for report in reports if report.status == IngestionFileStatus.UPLOADED]
+    uploaded_bytes = sum(report.size for report in uploaded)
+    failed_files = sum(1 for report in reports if report.status == IngestionFileStatus.FAILED)
+
+    return IngestionReport(
+        files=reports,
+        uploaded_files=len(uploaded),
+        uploaded_bytes=uploaded_bytes,
+        skipped_files=len(reports) - len(uploaded) - failed_files,
+        failed_files=failed_files,
+        elapsed=elapsed,
+        files_per_second=len(uploaded) / elapsed if elapsed > 0 else 0.0,
+        bytes_per_second=uploaded_bytes / elapsed if elapsed > 0 else 0.0,
+    )
+
+
+class IngestionError(RuntimeError):
+    """
+    The server notified that the ingestion of a source failed.
+    """
+    def __init__(self, source: str, detail: str):
+        super().__init__(f"The ingestion of {source} failed: {detail}")
+        self.source = source
+        self.detail = detail
+
+
+# given a notification and the sources awaited, returns the source it is about and its outcome, or None
+IngestionMatcher = Callable[[NotificationEvent, Collection[str]], Tuple[str, IngestionResult | Exception] | None]
+
+_FINISHED_READING = re.compile(r"Finished reading (?P<source>.+?), I made (?P<chunks>\d+) thoughts on it", re.DOTALL)
+
+
+def _get_notification_text(content: Any) -> str | None:
+    if isinstance(content, dict):
+        content = content.get("description") or content.get("content") or content.get("message")
+    return content if isinstance(content, str) else None
+
+
+def match_ingestion_notification(
+    event: NotificationEvent, sources: Collection[str]
+) -> Tuple[str, IngestionResult | Exception] | None:
+    """
+    Recognizes the notifications the Cat sends at the end of an ingestion: "Finished reading <source>, I made <n>
+    thoughts on it." when it succeeds, and the errors mentioning one of the sources awaited when it fails.
+    """
+    text = _get_notification_text(event.content)
+    if text is None:
+        return None
+
+    if event.type == "error":
+        # the longest source mentioned wins, e.g. "https://site.org/a/" over "https://site.org/"
+        mentioned = [source for source in sources if is_source_mentioned(source, text)]
+        source = max(mentioned, key=len, default=None)
+        return None if source is None else (source, IngestionError(source, text))
+
+    match = _FINISHED_READING.search(text)
+    if match is None:
+        return None
+    result = IngestionResult(source=match["source"], chunks=int(match["chunks"]), message=text)
+    return get_notified_source(match["source"]), result
+
+
+def is_source_mentioned(source: str, text: str) -> bool:
+    """
+    Tells whether a text mentions a source as a whole token, i.e. not as a part of a longer name or path: "a.txt" is
+    mentioned by "Error reading 'a.txt'" and by "Error reading /tmp/a.txt.", not by "Error reading data.txt".
+    """
+    spellings = {source, source.rstrip("/")} if "://" in source else {source}
+    return any(
+        re.search(rf"(?<![\w.-]){re.escape(spelling)}(?![\w-]|[./][\w-])", text) for spelling in spellings if spelling
+    )
+
+
+def get_notified_source(source: str) -> str:
+    # the files are notified by the name they were uploaded with, the URLs as they were posted, which may be normalized
+    if "://" not in source:
+        return os.path.basename(source)
+    try:
+        return normalize_url(source)
+    except ValueError:
+        return source
+
+
+class IngestionWatcher:
+    """
+    Matches the notifications received over the websocket connections of a client with the ingestions awaited within
+    an event loop. The connection of an agent, user and chat is listened to as long as an ingestion notified to it is
+    awaited, and released as soon as none is.
+    """
+    def __init__(self, ws_client: WSClient, matcher: IngestionMatcher = match_ingestion_notification):
+        self.ws_client = ws_client
+        self.matcher = matcher
+
+        self.__waiters: Dict[ConnectionKey, Dict[str, List[asyncio.Future]]] = {}
+        self.__unsubscribers: Dict[ConnectionKey, Callable[[], None]] = {}
+
+    def watch(
+        self, source: str, agent_id: str, user_id: str, chat_id: str | None = None, timeout: float | None = None
+    ) -> asyncio.Future:
+        """
+        Returns the future of the ingestion of a source, listening to the notifications from now on.
+        """
+        loop = asyncio.get_running_loop()
+        key = (agent_id, user_id, chat_id)
+        future = loop.create_future()
+
+        self.__waiters.setdefault(key, {}).setdefault(source, []).append(future)
+        if key not in self.__unsubscribers:
+            self.__unsubscribers[key] = self.ws_client.subscribe(
+                agent_id, user_id, chat_id, partial(self.__on_frame, key), partial(self.__on_error, key)
+            )
+
+        if timeout is not None:
+            handle = loop.call_later(timeout, self.__expire, future, source, timeout)
+            future.add_done_callback(lambda _: handle.cancel())
+        future.add_done_callback(partial(self.__forget, key, source))
+        return future
+
+    @staticmethod
+    def __expire(future: asyncio.Future, source: str, timeout: float):
+        if not future.done():
+            future.set_exception(TimeoutError(f"The ingestion of {source} has not been notified within {timeout}s"))
+
+    def __forget(self, key: ConnectionKey, source: str, future: asyncio.Future):
+        waiters = self.__waiters.get(key, {})
+        futures = waiters.get(source, [])
+        if future in futures:
+            futures.remove(future)
+        if not futures:
+            waiters.pop(source, None)
+        if not waiters:
+            self.__waiters.pop(key, None)
+            unsubscribe = self.__unsubscribers.pop(key, None)
+            if unsubscribe is not None:
+                unsubscribe()
+
+    def __on_frame(self, key: ConnectionKey, frame: str | bytes):
+        waiters = self.__waiters.get(key)
+        if not waiters:
+            return
+
+        event = to_stream_event(frame, self.ws_client.json_codec.loads)
+        if not isinstance(event, NotificationEvent):
+            return
+
+        matched = self.matcher(event, list(waiters))
+        if matched is None:
+            return
+
+        source, outcome = matched
+        for future in list(waiters.get(source, [])):
+            if future.done():
+                continue
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    def __on_error(self, key: ConnectionKey, error: BaseException):
+        self.__unsubscribers.pop(key, None)
+        for futures in list(self.__waiters.get(key, {}).values()):
+            for future in list(futures):
+                if not future.done():
+                    future.set_exception(ConnectionError(f"The websocket connection has failed: {error}"))
+
+
+async def as_completed(
+    futures: Iterable[asyncio.Future], timeout: float | None = None
+) -> AsyncIterator[asyncio.Future]:
+    """
+    Yields the futures of some ingestions as they are done, so that the outcome of each one, its result or its
+    exception, is handled as soon as it is known.
+    :param futures: The futures of the ingestions.
+    :param timeout: The max number of seconds to wait for all of them, if any.
+    """
+    pending = set(futures)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while pending:
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+        if not done:
+            raise TimeoutError(f"{len(pending)} ingestions have not been notified within {timeout}s")
+        for future in done:
+            yield future
 
 
 class RabbitHoleEndpoint(AbstractEndpoint):
     def __init__(self, client: "CheshireCatClient"):
         super().__init__(client)
         self.prefix = "/rabbithole"
+        self.__allowed_mime_types = AgentCache(max_size=1024, ttl=ALLOWED_MIME_TYPES_TTL)
+        self.__web_sources = AgentCache(max_size=1024, ttl=WEB_SOURCES_TTL)
+        self.ingestion_matcher: IngestionMatcher = match_ingestion_notification
+        # the futures of the ingestions are bound to the event loop awaiting them, hence one watcher per loop
+        self.__ingestion_watchers: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, IngestionWatcher] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def __record_ingestion(self, agent_id: str, filter_sources: List[FilterSource], chat_id: str | None = None):
+        # what this client ingests changes the memories of the agent, making its cached recalls stale, and is known to
+        # exist, sparing the next has_source calls a request
+        if self.client.recall_cache is not None:
+            self.client.recall_cache.invalidate(agent_id)
+        if self.client.source_cache is not None:
+            for filter_source in filter_sources:
+                self.client.source_cache.remember(agent_id, filter_source, chat_id)
+
+    def __invalidate_recalls(self, agent_id: str, _: asyncio.Future | None = None):
+        if self.client.recall_cache is not None:
+            self.client.recall_cache.invalidate(agent_id)
 
     def post_file(
         self,
-        file_path,
+        file_path: UploadSource,
         agent_id: str,
         chat_id: str | None = None,
         file_name: str | None = None,
         metadata: Dict[str, Any] | None = None,
+        on_progress: ProgressCallback | None = None,
     ) -> UploadSingleFileResponse:
         """
         This method posts a file to the RabbitHole API. The file is uploaded to the RabbitHole server and ingested into
         the RAG system. The file is then processed by the RAG system and the results are stored in the RAG database.
         The process is asynchronous and the results are returned in a batch.
         The CheshireCat processes the injection in background and the client will be informed at the end of the process.
-        :param file_path: The path to the file to upload.
+        :param file_path: The path to the file to upload, or its content, as bytes, a binary file-like object or an
+            iterable of chunks; the file is streamed, a chunk at a time.
         :param agent_id: The ID of the agent.
         :param chat_id: The ID of the chat (optional).
-        :param file_name: The name of the file.
+        :param file_name: The name of the file; required unless file_path is a path.
         :param metadata: The metadata to include with the file.
+        :param on_progress: The callback notified of the bytes sent so far and of the total, None if unknown.
         :return: The response from the RabbitHole API.
         """
-        file_name = file_name or Path(file_path).name
+        file_name, source, content_type = upload_attributes(file_name, file_path)
 
-        payload = MultipartPayload(data={})
+        payload = MultipartPayload(
+            data={}, files=[("file", (file_name, source, content_type))], on_progress=on_progress
+        )
         if metadata is not None:
-            payload.data["metadata"] = json.dumps(metadata)
+            payload.data["metadata"] = self.client.json_codec.dumps(metadata)
 
         endpoint = self.prefix if not chat_id else self.format_url(chat_id)
 
-        with open(file_path, "rb") as file:
-            payload.files = [("file", file_attributes(file_name, file))]
-            result = self.post_multipart(endpoint, agent_id, output_class=UploadSingleFileResponse, payload=payload)
+        result = self.post_multipart(endpoint, agent_id, output_class=UploadSingleFileResponse, payload=payload)
 
+        self.__record_ingestion(agent_id, [FilterSource(source=file_name)], chat_id)
         return result
 
     def post_files(
         self,
-        file_paths: List[str],
+        file_paths: List[UploadSource | Tuple[str, UploadSource]],
         agent_id: str,
         chat_id: str | None = None,
-        metadata: Dict[str, Any] | None = None
+        metadata: Dict[str, Any] | None = None,
+        on_progress: ProgressCallback | None = None,
     ) -> Dict[str, UploadSingleFileResponse]:  # type: ignore
         """
         Posts multiple files to the RabbitHole API. The files are uploaded to the RabbitHole server and
         ingested into the RAG system. The files are processed in a batch. The process is asynchronous.
         The CheshireCat processes the injection in background and the client will be informed at the end of the process.
-        :param file_paths: The paths to the files to upload.
+        :param file_paths: The paths to the files to upload, or (file name, content) pairs, the content being bytes, a
+            binary file-like object or an iterable of chunks; the files are streamed, a chunk at a time.
         :param agent_id: The ID of the agent.
         :param chat_id: The ID of the chat (optional).
         :param metadata: The metadata to include with the files.
+        :param on_progress: The callback notified of the bytes sent so far and of the total, None if unknown.
         :return: The response from the RabbitHole API.
         """
         data = {}
         if metadata is not None:
-            data["metadata"] = json.dumps(metadata)
+            data["metadata"] = self.client.json_codec.dumps(metadata)
 
         files = []
-        file_handles = []
+        for file in file_paths:
+            file_name, source = file if isinstance(file, tuple) else (None, file)
+            files.append(("files", upload_attributes(file_name, source)))
 
         endpoint = self.format_url("/batch") if not chat_id else self.format_url(f"/batch/{chat_id}")
-        try:
-            for file_path in file_paths:
-                file = open(file_path, "rb")
-                file_handles.append(file)
-                files.append(("files", file_attributes(Path(file_path).name, file)))
-
-            response = self.get_http_client(agent_id).post(endpoint, data=data, files=files)
-            response.raise_for_status()
-
-            result = {}
-            for key, item in response.json().items():
-                result[key] = deserialize(item, UploadSingleFileResponse)
-            return result
-        finally:
-            for file in file_handles:
-                file.close()
+        payload = MultipartPayload(data=data, files=files, on_progress=on_progress)
+        response = self.post_multipart(endpoint, agent_id, payload=payload)
+
+        result = {}
+        for key, item in response.items():
+            result[key] = self.deserialize(item, UploadSingleFileResponse)
+
+        self.__record_ingestion(agent_id, [FilterSource(source=file_name) for _, (file_name, _, _) in files], chat_id)
+        return result
 
     def post_web(
         self,
@@ -116,33 +516,83 @@ class RabbitHoleEndpoint(AbstractEndpoint):
 
         endpoint = self.format_url("/web") if not chat_id else self.format_url(f"/web/{chat_id}")
 
-        return self.post_json(endpoint, agent_id, output_class=UploadUrlResponse, payload=payload)
+        result = self.post_json(endpoint, agent_id, output_class=UploadUrlResponse, payload=payload)
+
+        self.__record_ingestion(agent_id, [FilterSource(source=web_url)], chat_id)
+        return result
+
+    def post_webs(
+        self,
+        web_urls: Iterable[str],
+        agent_id: str,
+        chat_id: str | None = None,
+        metadata: Dict[str, Any] | None = None,
+        concurrency: int = 8,
+        rate_limit: float | None = None,
+        skip_existing: bool = True,
+    ) -> List[WebIngestionResult]:
+        """
+        Posts many web URLs to the RabbitHole API, as `post_web` does. The URLs are normalized, and those the agent
+        already has among its web sources, fetched once and cached for a few minutes, are skipped, as are the repeated
+        ones; the others are posted `concurrency` at a time, at most `rate_limit` per second if given. A failed URL does
+        not stop the others: it is reported as failed.
+        :param web_urls: The URLs of the websites to ingest.
+        :param agent_id: The ID of the agent.
+        :param chat_id: The ID of the chat (optional).
+        :param metadata: The metadata to include with each URL.
+        :param concurrency: The max number of URLs posted at a time.
+        :param rate_limit: The max number of URLs posted per second, if any.
+        :param skip_existing: Whether to skip the URLs among the web sources of the agent.
+        :return: List[WebIngestionResult], the result of each URL, in the order of the URLs
+        """
+        existing = self.__get_web_sources(agent_id, chat_id) if skip_existing else set()
+        results, to_post = split_web_urls(web_urls, existing)
+        limiter = RateLimiter(rate_limit, burst=concurrency) if rate_limit else None
+
+        def post(result: WebIngestionResult):
+            if limiter is not None:
+                limiter.acquire()
+            try:
+                result.response = self.post_web(result.normalized_url, agent_id, chat_id, metadata)
+            except Exception as e:
+                mark_web_failed(result, e)
+            else:
+                result.status = IngestionFileStatus.UPLOADED
+                self.__remember_web_source(agent_id, chat_id, result.normalized_url)
+
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="cheshirecat-web") as executor:
+            for future in [executor.submit(copy_context().run, post, result) for result in to_post]:
+                future.result()
+
+        return results
 
     def post_memory(
         self,
-        file_path: str,
+        file_path: UploadSource,
         agent_id: str,
         file_name: str | None = None,
+        on_progress: ProgressCallback | None = None,
     ) -> UploadSingleFileResponse:
         """
         Posts a memory point, for the agent identified by the agent_id parameter.
         The memory point is ingested into the RAG system. The process is asynchronous. The provided file must be in JSON
         format. The CheshireCat processes the injection in the background, and the client will be informed at the end of
         the process.
-        :param file_path: The path to the file to upload.
+        :param file_path: The path to the file to upload, or its content, as bytes, a binary file-like object or an
+            iterable of chunks; the file is streamed, a chunk at a time.
         :param agent_id: The ID of the agent.
-        :param file_name: The name of the file (optional).
+        :param file_name: The name of the file; required unless file_path is a path.
+        :param on_progress: The callback notified of the bytes sent so far and of the total, None if unknown.
         :return: The response from the RabbitHole API.
         """
-        file_name = file_name or Path(file_path).name
+        file_name, source, content_type = upload_attributes(file_name, file_path)
 
-        payload = MultipartPayload()
-        with open(file_path, "rb") as file:
-            payload.files = [("file", file_attributes(file_name, file))]
-            result = self.post_multipart(
-                self.format_url("/memory"), agent_id, output_class=UploadSingleFileResponse, payload=payload
-            )
+        payload = MultipartPayload(files=[("file", (file_name, source, content_type))], on_progress=on_progress)
+        result = self.post_multipart(
+            self.format_url("/memory"), agent_id, output_class=UploadSingleFileResponse, payload=payload
+        )
 
+        self.__record_ingestion(agent_id, [])
         return result
 
     def get_allowed_mime_types(self, agent_id: str) -> AllowedMimeTypesOutput:
@@ -171,3 +621,606 @@ class RabbitHoleEndpoint(AbstractEndpoint):
             agent_id,
             chat_id=chat_id,
         )
+
+    def __get_allowed_mime_types(self, agent_id: str) -> List[str]:
+        generation = self.__allowed_mime_types.get_generation(agent_id)
+        allowed = self.__allowed_mime_types.get((agent_id,))
+        if allowed is None:
+            allowed = self.get_allowed_mime_types(agent_id).allowed
+            self.__allowed_mime_types.put((agent_id,), allowed, generation)
+        return allowed
+
+    def __get_web_sources(self, agent_id: str, chat_id: str | None) -> Set[str]:
+        generation = self.__web_sources.get_generation(agent_id)
+        sources = self.__web_sources.get((agent_id, chat_id))
+        if sources is None:
+            sources = to_web_sources(self.get_web_sources(agent_id, chat_id))
+            self.__web_sources.put((agent_id, chat_id), sources, generation)
+        return sources
+
+    def __remember_web_source(self, agent_id: str, chat_id: str | None, url: str):
+        sources = self.__web_sources.get((agent_id, chat_id))
+        if sources is not None:
+            sources.add(url)
+
+    def __get_ingestion_watcher(self) -> IngestionWatcher:
+        loop = asyncio.get_running_loop()
+        watcher = self.__ingestion_watchers.get(loop)
+        if watcher is None:
+            watcher = self.__ingestion_watchers[loop] = IngestionWatcher(self.client.ws_client, self.ingestion_matcher)
+        return watcher
+
+    def wait_for_ingestion(
+        self,
+        source: str,
+        agent_id: str,
+        user_id: str,
+        chat_id: str | None = None,
+        timeout: float | None = None,
+    ) -> asyncio.Future:
+        """
+        Returns the future of the ingestion of a file or URL, which the server runs in background after the upload. The
+        future is resolved with an IngestionResult when the server notifies that the ingestion is over, or fails with
+        an IngestionError when it notifies that it failed, with a TimeoutError after `timeout` seconds and with a
+        ConnectionError if the websocket connection fails. The notifications are listened to from the call on, so that
+        none is missed when it is made before the upload; meanwhile, the websocket connection of the agent, user and
+        chat is held, and the messages sent through it wait. It must be called within a running event loop.
+        :param source: The name of the file, or its path, or the URL.
+        :param agent_id: The ID of the agent.
+        :param user_id: The ID of the user the notifications are sent to.
+        :param chat_id: The ID of the chat (optional).
+        :param timeout: The max number of seconds to wait for the notification, if any.
+        :return: asyncio.Future, resolved with the IngestionResult
+        """
+        future = self.__get_ingestion_watcher().watch(get_notified_source(source), agent_id, user_id, chat_id, timeout)
+        # the recalls cached while the server was ingesting the source are stale as soon as it is done
+        future.add_done_callback(partial(self.__invalidate_recalls, agent_id))
+        return future
+
+    def wait_for_ingestions(
+        self,
+        sources: Iterable[str],
+        agent_id: str,
+        user_id: str,
+        chat_id: str | None = None,
+        timeout: float | None = None,
+    ) -> List[asyncio.Future]:
+        """
+        Returns the futures of the ingestions of many files or URLs, as `wait_for_ingestion` does; they can be awaited
+        as they are done with `as_completed`.
+        :param sources: The names of the files, or their paths, or the URLs.
+        :param agent_id: The ID of the agent.
+        :param user_id: The ID of the user the notifications are sent to.
+        :param chat_id: The ID of the chat (optional).
+        :param timeout: The max number of seconds to wait for each notification, if any.
+        :return: List[asyncio.Future], the futures, in the order of the sources
+        """
+        return [self.wait_for_ingestion(source, agent_id, user_id, chat_id, timeout) for source in sources]
+
+    as_completed = staticmethod(as_completed)
+
+    def __upload_batch(
+        self,
+        batch: List[IngestionFileReport],
+        agent_id: str,
+        chat_id: str | None,
+        metadata: Dict[str, Any] | None,
+    ) -> List[IngestionFileReport]:
+        try:
+            result = self.post_files([report.path for report in batch], agent_id, chat_id, metadata)
+        except Exception as e:
+            mark_failed(batch, e)
+        else:
+            mark_uploaded(batch, result)
+            self.__record_ingestion(agent_id, [FilterSource(hash=report.hash) for report in batch], chat_id)
+        return batch
+
+    def ingest_directory(
+        self,
+        path: str | os.PathLike,
+        agent_id: str,
+        chat_id: str | None = None,
+        metadata: Dict[str, Any] | None = None,
+        pattern: str = "*",
+        recursive: bool = True,
+        skip_existing: bool = True,
+        concurrency: int = 4,
+        batch_size: int = 32,
+        max_batch_bytes: int = 32 * 1024 * 1024,
+        max_open_files: int = 16,
+        on_file: FileReportCallback | None = None,
+    ) -> IngestionReport:
+        """
+        Ingests all the files of a directory tree, as a pipeline going through it a window of files at a time: the
+        files are listed, read once to detect their MIME type, checked against the MIME types allowed by the agent
+        (cached for a few minutes), and hashed; the files whose content the server already has, checked by hash, are
+        skipped, as are the copies of a file met before, and the others are uploaded in batches bounded by count and
+        size, `concurrency` at a time, while the next window is being read. Each file read or uploaded is held open
+        only while it is read, so that at most `max_open_files` files are open at a time. A failed batch does not stop
+        the others: its files are reported as failed.
+        :param path: The root of the directory tree.
+        :param agent_id: The ID of the agent.
+        :param chat_id: The ID of the chat (optional).
+        :param metadata: The metadata to include with the files.
+        :param pattern: The glob pattern the names of the files must match.
+        :param recursive: Whether to descend into the subdirectories.
+        :param skip_existing: Whether to skip the files whose content the server already has.
+        :param concurrency: The max number of files read, and of batches uploaded, at a time.
+        :param batch_size: The max number of files of a batch.
+        :param max_batch_bytes: The max size of a batch, in bytes.
+        :param max_open_files: The max number of files open at a time; it lowers the concurrency if needed.
+        :param on_file: The callback notified of the report of each file, as soon as its outcome is known.
+        :return: IngestionReport, the report of each file, in the order they have been listed, and the throughput
+        """
+        start = time.monotonic()
+        # each inspection and each upload in flight holds a single file open at a time
+        concurrency = max(1, min(concurrency, max_open_files // 2))
+        allowed_mime_types = frozenset(self.__get_allowed_mime_types(agent_id))
+
+        reports: List[IngestionFileReport] = []
+        seen_hashes: Set[str] = set()
+
+        def notify(batch: List[IngestionFileReport]):
+            if on_file is not None:
+                for report in batch:
+                    on_file(report)
+
+        def collect(futures: List[Future]):
+            for future in futures:
+                notify(future.result())
+
+        files = walk_files(path, pattern, recursive)
+        with (
+            ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="cheshirecat-ingestion") as inspector,
+            ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="cheshirecat-upload") as uploader,
+        ):
+            pending: List[Future] = []
+            while window := list(islice(files, batch_size * concurrency)):
+                inspected = list(inspector.map(lambda file_path: inspect_file(file_path, allowed_mime_types), window))
+                reports.extend(inspected)
+
+                to_upload = mark_duplicates(inspected, seen_hashes)
+                if skip_existing and to_upload:
+                    existing = self.client.memory.has_sources(
+                        agent_id, [FilterSource(hash=report.hash) for report in to_upload], chat_id, concurrency
+                    )
+                    for report, exists in zip(to_upload, existing):
+                        if exists:
+                            report.status = IngestionFileStatus.EXISTING
+                    to_upload = [report for report in to_upload if report.status == IngestionFileStatus.PENDING]
+                notify([report for report in inspected if report.status != IngestionFileStatus.PENDING])
+
+                submitted = [
+                    uploader.submit(copy_context().run, self.__upload_batch, batch, agent_id, chat_id, metadata)
+                    for batch in batch_files(to_upload, batch_size, max_batch_bytes)
+                ]
+                collect(pending)
+                pending = submitted
+            collect(pending)
+
+        return to_ingestion_report(reports, time.monotonic() - start)
+
+
+class AsyncRabbitHoleEndpoint(AsyncAbstractEndpoint):
+    def __init__(self, client: "AsyncCheshireCatClient"):
+        super().__init__(client)
+        self.prefix = "/rabbithole"
+        self.__allowed_mime_types = AgentCache(max_size=1024, ttl=ALLOWED_MIME_TYPES_TTL)
+        self.__web_sources = AgentCache(max_size=1024, ttl=WEB_SOURCES_TTL)
+        self.ingestion_matcher: IngestionMatcher = match_ingestion_notification
+        # the futures of the ingestions are bound to the event loop awaiting them, hence one watcher per loop
+        self.__ingestion_watchers: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, IngestionWatcher] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def __record_ingestion(self, agent_id: str, filter_sources: List[FilterSource], chat_id: str | None = None):
+        # what this client ingests changes the memories of the agent, making its cached recalls stale, and is known to
+        # exist, sparing the next has_source calls a request
+        if self.client.recall_cache is not None:
+            self.client.recall_cache.invalidate(agent_id)
+        if self.client.source_cache is not None:
+            for filter_source in filter_sources:
+                self.client.source_cache.remember(agent_id, filter_source, chat_id)
+
+    def __invalidate_recalls(self, agent_id: str, _: asyncio.Future | None = None):
+        if self.client.recall_cache is not None:
+            self.client.recall_cache.invalidate(agent_id)
+
+    async def post_file(
+        self,
+        file_path: UploadSource,
+        agent_id: str,
+        chat_id: str | None = None,
+        file_name: str | None = None,
+        metadata: Dict[str, Any] | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> UploadSingleFileResponse:
+        """
+        This method posts a file to the RabbitHole API. The file is uploaded to the RabbitHole server and ingested into
+        the RAG system. The file is then processed by the RAG system and the results are stored in the RAG database.
+        The process is asynchronous and the results are returned in a batch.
+        The CheshireCat processes the injection in background and the client will be informed at the end of the process.
+        :param file_path: The path to the file to upload, or its content, as bytes, a binary file-like object or an
+            iterable of chunks; the file is streamed, a chunk at a time.
+        :param agent_id: The ID of the agent.
+        :param chat_id: The ID of the chat (optional).
+        :param file_name: The name of the file; required unless file_path is a path.
+        :param metadata: The metadata to include with the file.
+        :param on_progress: The callback notified of the bytes sent so far and of the total, None if unknown.
+        :return: The response from the RabbitHole API.
+        """
+        file_name, source, content_type = upload_attributes(file_name, file_path)
+
+        payload = MultipartPayload(
+            data={}, files=[("file", (file_name, source, content_type))], on_progress=on_progress
+        )
+        if metadata is not None:
+            payload.data["metadata"] = self.client.json_codec.dumps(metadata)
+
+        endpoint = self.prefix if not chat_id else self.format_url(chat_id)
+
+        result = await self.post_multipart(endpoint, agent_id, output_class=UploadSingleFileResponse, payload=payload)
+
+        self.__record_ingestion(agent_id, [FilterSource(source=file_name)], chat_id)
+        return result
+
+    async def post_files(
+        self,
+        file_paths: List[UploadSource | Tuple[str, UploadSource]],
+        agent_id: str,
+        chat_id: str | None = None,
+        metadata: Dict[str, Any] | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> Dict[str, UploadSingleFileResponse]:  # type: ignore
+        """
+        Posts multiple files to the RabbitHole API. The files are uploaded to the RabbitHole server and
+        ingested into the RAG system. The files are processed in a batch. The process is asynchronous.
+        The CheshireCat processes the injection in background and the client will be informed at the end of the process.
+        :param file_paths: The paths to the files to upload, or (file name, content) pairs, the content being bytes, a
+            binary file-like object or an iterable of chunks; the files are streamed, a chunk at a time.
+        :param agent_id: The ID of the agent.
+        :param chat_id: The ID of the chat (optional).
+        :param metadata: The metadata to include with the files.
+        :param on_progress: The callback notified of the bytes sent so far and of the total, None if unknown.
+        :return: The response from the RabbitHole API.
+        """
+        data = {}
+        if metadata is not None:
+            data["metadata"] = self.client.json_codec.dumps(metadata)
+
+        files = []
+        for file in file_paths:
+            file_name, source = file if isinstance(file, tuple) else (None, file)
+            files.append(("files", upload_attributes(file_name, source)))
+
+        endpoint = self.format_url("/batch") if not chat_id else self.format_url(f"/batch/{chat_id}")
+        payload = MultipartPayload(data=data, files=files, on_progress=on_progress)
+        response = await self.post_multipart(endpoint, agent_id, payload=payload)
+
+        result = {}
+        for key, item in response.items():
+            result[key] = self.deserialize(item, UploadSingleFileResponse)
+
+        self.__record_ingestion(agent_id, [FilterSource(source=file_name) for _, (file_name, _, _) in files], chat_id)
+        return result
+
+    async def post_web(
+        self,
+        web_url: str,
+        agent_id: str,
+        chat_id: str | None = None,
+        metadata: Dict[str, Any] | None = None
+    ) -> UploadUrlResponse:
+        """
+        Posts a web URL to the RabbitHole API. The web URL is ingested into the RAG system. The web URL is
+        processed by the RAG system by Web scraping, and the results are stored in the RAG database.
+        The process is asynchronous.
+        The CheshireCat processes the injection in background, and the client will be informed at the end of the process.
+        :param web_url: The URL of the website to ingest.
+        :param agent_id: The ID of the agent.
+        :param chat_id: The ID of the chat (optional).
+        :param metadata: The metadata to include with the files.
+        :return: The response from the RabbitHole API.
+        """
+        payload = {"url": web_url}
+        if metadata is not None:
+            payload["metadata"] = metadata  # type: ignore
+
+        endpoint = self.format_url("/web") if not chat_id else self.format_url(f"/web/{chat_id}")
+
+        result = await self.post_json(endpoint, agent_id, output_class=UploadUrlResponse, payload=payload)
+
+        self.__record_ingestion(agent_id, [FilterSource(source=web_url)], chat_id)
+        return result
+
+    async def post_webs(
+        self,
+        web_urls: Iterable[str],
+        agent_id: str,
+        chat_id: str | None = None,
+        metadata: Dict[str, Any] | None = None,
+        concurrency: int = 8,
+        rate_limit: float | None = None,
+        skip_existing: bool = True,
+    ) -> List[WebIngestionResult]:
+        """
+        Posts many web URLs to the RabbitHole API, as `post_web` does. The URLs are normalized, and those the agent
+        already has among its web sources, fetched once and cached for a few minutes, are skipped, as are the repeated
+        ones; the others are posted `concurrency` at a time, at most `rate_limit` per second if given. A failed URL does
+        not stop the others: it is reported as failed.
+        :param web_urls: The URLs of the websites to ingest.
+        :param agent_id: The ID of the agent.
+        :param chat_id: The ID of the chat (optional).
+        :param metadata: The metadata to include with each URL.
+        :param concurrency: The max number of URLs posted at a time.
+        :param rate_limit: The max number of URLs posted per second, if any.
+        :param skip_existing: Whether to skip the URLs among the web sources of the agent.
+        :return: List[WebIngestionResult], the result of each URL, in the order of the URLs
+        """
+        existing = await self.__get_web_sources(agent_id, chat_id) if skip_existing else set()
+        results, to_post = split_web_urls(web_urls, existing)
+        limiter = RateLimiter(rate_limit, burst=concurrency) if rate_limit else None
+        queue = iter(to_post)
+
+        async def post():
+            # a few workers taking the URLs in turn, rather than a task per URL
+            for result in queue:
+                if limiter is not None:
+                    await limiter.aacquire()
+                try:
+                    result.response = await self.post_web(result.normalized_url, agent_id, chat_id, metadata)
+                except Exception as e:
+                    mark_web_failed(result, e)
+                else:
+                    result.status = IngestionFileStatus.UPLOADED
+                    self.__remember_web_source(agent_id, chat_id, result.normalized_url)
+
+        await asyncio.gather(*[post() for _ in range(max(1, min(concurrency, len(to_post))))])
+        return results
+
+    async def post_memory(
+        self,
+        file_path: UploadSource,
+        agent_id: str,
+        file_name: str | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> UploadSingleFileResponse:
+        """
+        Posts a memory point, for the agent identified by the agent_id parameter.
+        The memory point is ingested into the RAG system. The process is asynchronous. The provided file must be in JSON
+        format. The CheshireCat processes the injection in the background, and the client will be informed at the end of
+        the process.
+        :param file_path: The path to the file to upload, or its content, as bytes, a binary file-like object or an
+            iterable of chunks; the file is streamed, a chunk at a time.
+        :param agent_id: The ID of the agent.
+        :param file_name: The name of the file; required unless file_path is a path.
+        :param on_progress: The callback notified of the bytes sent so far and of the total, None if unknown.
+        :return: The response from the RabbitHole API.
+        """
+        file_name, source, content_type = upload_attributes(file_name, file_path)
+
+        payload = MultipartPayload(files=[("file", (file_name, source, content_type))], on_progress=on_progress)
+        result = await self.post_multipart(
+            self.format_url("/memory"), agent_id, output_class=UploadSingleFileResponse, payload=payload
+        )
+
+        self.__record_ingestion(agent_id, [])
+        return result
+
+    async def get_allowed_mime_types(self, agent_id: str) -> AllowedMimeTypesOutput:
+        """
+        Retrieves the allowed MIME types for the RabbitHole API. The allowed MIME types are the MIME types
+        that are allowed to be uploaded to the RabbitHole API. The allowed MIME types are returned in a list.
+        :param agent_id: The ID of the agent.
+        :return: AllowedMimeTypesOutput, the details of the allowed MIME types.
+        """
+        return await self.get(
+            self.format_url("/allowed-mimetypes"),
+            agent_id,
+            output_class=AllowedMimeTypesOutput
+        )
+
+    async def get_web_sources(self, agent_id: str, chat_id: str | None = None) -> List[str]:
+        """
+        This method retrieves the web sources for the RabbitHole API. The web sources are the web URLs that are allowed
+        to be uploaded to the RabbitHole API. The web sources are returned in a list.
+        :param agent_id: The ID of the agent.
+        :param chat_id: The chat id, optional
+        :return: List[str]
+        """
+        return await self.get(
+            self.format_url("/web"),
+            agent_id,
+            chat_id=chat_id,
+        )
+
+    async def __get_allowed_mime_types(self, agent_id: str) -> List[str]:
+        generation = self.__allowed_mime_types.get_generation(agent_id)
+        allowed = self.__allowed_mime_types.get((agent_id,))
+        if allowed is None:
+            allowed = (await self.get_allowed_mime_types(agent_id)).allowed
+            self.__allowed_mime_types.put((agent_id,), allowed, generation)
+        return allowed
+
+    async def __get_web_sources(self, agent_id: str, chat_id: str | None) -> Set[str]:
+        generation = self.__web_sources.get_generation(agent_id)
+        sources = self.__web_sources.get((agent_id, chat_id))
+        if sources is None:
+            sources = to_web_sources(await self.get_web_sources(agent_id, chat_id))
+            self.__web_sources.put((agent_id, chat_id), sources, generation)
+        return sources
+
+    def __remember_web_source(self, agent_id: str, chat_id: str | None, url: str):
+        sources = self.__web_sources.get((agent_id, chat_id))
+        if sources is not None:
+            sources.add(url)
+
+    def __get_ingestion_watcher(self) -> IngestionWatcher:
+        loop = asyncio.get_running_loop()
+        watcher = self.__ingestion_watchers.get(loop)
+        if watcher is None:
+            watcher = self.__ingestion_watchers[loop] = IngestionWatcher(self.client.ws_client, self.ingestion_matcher)
+        return watcher
+
+    def wait_for_ingestion(
+        self,
+        source: str,
+        agent_id: str,
+        user_id: str,
+        chat_id: str | None = None,
+        timeout: float | None = None,
+    ) -> asyncio.Future:
+        """
+        Returns the future of the ingestion of a file or URL, which the server runs in background after the upload. The
+        future is resolved with an IngestionResult when the server notifies that the ingestion is over, or fails with
+        an IngestionError when it notifies that it failed, with a TimeoutError after `timeout` seconds and with a
+        ConnectionError if the websocket connection fails. The notifications are listened to from the call on, so that
+        none is missed when it is made before the upload; meanwhile, the websocket connection of the agent, user and
+        chat is held, and the messages sent through it wait. It must be called within a running event loop.
+        :param source: The name of the file, or its path, or the URL.
+        :param agent_id: The ID of the agent.
+        :param user_id: The ID of the user the notifications are sent to.
+        :param chat_id: The ID of the chat (optional).
+        :param timeout: The max number of seconds to wait for the notification, if any.
+        :return: asyncio.Future, resolved with the IngestionResult
+        """
+        future = self.__get_ingestion_watcher().watch(get_notified_source(source), agent_id, user_id, chat_id, timeout)
+        # the recalls cached while the server was ingesting the source are stale as soon as it is done
+        future.add_done_callback(partial(self.__invalidate_recalls, agent_id))
+        return future
+
+    def wait_for_ingestions(
+        self,
+        sources: Iterable[str],
+        agent_id: str,
+        user_id: str,
+        chat_id: str | None = None,
+        timeout: float | None = None,
+    ) -> List[asyncio.Future]:
+        """
+        Returns the futures of the ingestions of many files or URLs, as `wait_for_ingestion` does; they can be awaited
+        as they are done with `as_completed`.
+        :param sources: The names of the files, or their paths, or the URLs.
+        :param agent_id: The ID of the agent.
+        :param user_id: The ID of the user the notifications are sent to.
+        :param chat_id: The ID of the chat (optional).
+        :param timeout: The max number of seconds to wait for each notification, if any.
+        :return: List[asyncio.Future], the futures, in the order of the sources
+        """
+        return [self.wait_for_ingestion(source, agent_id, user_id, chat_id, timeout) for source in sources]
+
+    as_completed = staticmethod(as_completed)
+
+    async def __upload_batch(
+        self,
+        batch: List[IngestionFileReport],
+        agent_id: str,
+        chat_id: str | None,
+        metadata: Dict[str, Any] | None,
+    ) -> List[IngestionFileReport]:
+        try:
+            result = await self.post_files([report.path for report in batch], agent_id, chat_id, metadata)
+        except Exception as e:
+            mark_failed(batch, e)
+        else:
+            mark_uploaded(batch, result)
+            self.__record_ingestion(agent_id, [FilterSource(hash=report.hash) for report in batch], chat_id)
+        return batch
+
+    async def ingest_directory(
+        self,
+        path: str | os.PathLike,
+        agent_id: str,
+        chat_id: str | None = None,
+        metadata: Dict[str, Any] | None = None,
+        pattern: str = "*",
+        recursive: bool = True,
+        skip_existing: bool = True,
+        concurrency: int = 4,
+        batch_size: int = 32,
+        max_batch_bytes: int = 32 * 1024 * 1024,
+        max_open_files: int = 16,
+        on_file: FileReportCallback | None = None,
+    ) -> IngestionReport:
+        """
+        Ingests all the files of a directory tree, as a pipeline going through it a window of files at a time: the
+        files are listed, read once to detect their MIME type, checked against the MIME types allowed by the agent
+        (cached for a few minutes), and hashed; the files whose content the server already has, checked by hash, are
+        skipped, as are the copies of a file met before, and the others are uploaded in batches bounded by count and
+        size, `concurrency` at a time, while the next window is being read. Each file read or uploaded is held open
+        only while it is read, so that at most `max_open_files` files are open at a time. A failed batch does not stop
+        the others: its files are reported as failed.
+        :param path: The root of the directory tree.
+        :param agent_id: The ID of the agent.
+        :param chat_id: The ID of the chat (optional).
+        :param metadata: The metadata to include with the files.
+        :param pattern: The glob pattern the names of the files must match.
+        :param recursive: Whether to descend into the subdirectories.
+        :param skip_existing: Whether to skip the files whose content the server already has.
+        :param concurrency: The max number of files read, and of batches uploaded, at a time.
+        :param batch_size: The max number of files of a batch.
+        :param max_batch_bytes: The max size of a batch, in bytes.
+        :param max_open_files: The max number of files open at a time; it lowers the concurrency if needed.
+        :param on_file: The callback notified of the report of each file, as soon as its outcome is known.
+        :return: IngestionReport, the report of each file, in the order they have been listed, and the throughput
+        """
+        start = time.monotonic()
+        # each inspection and each upload in flight holds a single file open at a time
+        concurrency = max(1, min(concurrency, max_open_files // 2))
+        allowed_mime_types = frozenset(await self.__get_allowed_mime_types(agent_id))
+
+        reports: List[IngestionFileReport] = []
+        seen_hashes: Set[str] = set()
+        semaphore = asyncio.Semaphore(concurrency)
+        loop = asyncio.get_running_loop()
+
+        def notify(batch: List[IngestionFileReport]):
+            if on_file is not None:
+                for report in batch:
+                    on_file(report)
+
+        async def upload(batch: List[IngestionFileReport]) -> List[IngestionFileReport]:
+            async with semaphore:
+                return await self.__upload_batch(batch, agent_id, chat_id, metadata)
+
+        async def collect(tasks: List[asyncio.Task]):
+            for task in tasks:
+                notify(await task)
+
+        files = walk_files(path, pattern, recursive)
+        pending: List[asyncio.Task] = []
+        # the files are listed and read in worker threads, so that the event loop is never blocked on the disk
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="cheshirecat-ingestion") as inspector:
+            try:
+                while window := await loop.run_in_executor(inspector, list, islice(files, batch_size * concurrency)):
+                    inspected = list(await asyncio.gather(*[
+                        loop.run_in_executor(inspector, inspect_file, file_path, allowed_mime_types)
+                        for file_path in window
+                    ]))
+                    reports.extend(inspected)
+
+                    to_upload = mark_duplicates(inspected, seen_hashes)
+                    if skip_existing and to_upload:
+                        existing = await self.client.memory.has_sources(
+                            agent_id, [FilterSource(hash=report.hash) for report in to_upload], chat_id, concurrency
+                        )
+                        for report, exists in zip(to_upload, existing):
+                            if exists:
+                                report.status = IngestionFileStatus.EXISTING
+                        to_upload = [report for report in to_upload if report.status == IngestionFileStatus.PENDING]
+                    notify([report for report in inspected if report.status != IngestionFileStatus.PENDING])
+
+                    submitted = [
+                        asyncio.create_task(upload(batch))
+                        for batch in batch_files(to_upload, batch_size, max_batch_bytes)
+                    ]
+                    # the batches just submitted are cancelled too if collecting the previous ones fails
+                    previous, pending = pending, pending + submitted
+                    await collect(previous)
+                    pending = submitted
+                await collect(pending)
+            finally:
+                for task in pending:
+                    task.cancel()
+
+        return to_ingestion_report(reports, time.monotonic() - start)
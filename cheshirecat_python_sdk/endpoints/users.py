@@ -1,8 +1,7 @@
 from typing import Any, List, Dict
 
-from cheshirecat_python_sdk.endpoints.base import AbstractEndpoint
+from cheshirecat_python_sdk.endpoints.base import AbstractEndpoint, AsyncAbstractEndpoint
 from cheshirecat_python_sdk.models.api.users import UserOutput
-from cheshirecat_python_sdk.utils import deserialize
 
 
 class UsersEndpoint(AbstractEndpoint):
@@ -59,7 +58,7 @@ class UsersEndpoint(AbstractEndpoint):
         response = self.get_http_client(agent_id).get(self.prefix)
         response.raise_for_status()
 
-        return [deserialize(item, UserOutput) for item in response.json()]
+        return self.deserialize_list(self.decode(response), UserOutput)
 
     def get_user(self, user_id: str, agent_id: str) -> UserOutput:
         """
@@ -119,3 +118,119 @@ class UsersEndpoint(AbstractEndpoint):
         :return UserOutput, the deleted user
         """
         return self.delete(self.format_url(user_id), agent_id, output_class=UserOutput)
+
+
+class AsyncUsersEndpoint(AsyncAbstractEndpoint):
+    def __init__(self, client: "AsyncCheshireCatClient"):
+        super().__init__(client)
+        self.prefix = "/users"
+
+    async def post_user(
+        self,
+        agent_id: str,
+        username: str,
+        password: str,
+        permissions: dict[str, Any] | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> UserOutput:
+        """
+        This endpoint is used to create a new user in the system. The user is created with the specified username and
+        password. The user is assigned the specified permissions. The permissions are used to define the access rights
+        of the user in the system and are defined by the system administrator.
+        The endpoint can be used for the agent identified by the agentId parameter.
+        :param agent_id: The id of the agent to create the user for
+        :param username: The username of the user to create
+        :param password: The password of the user to create
+        :param permissions: The permissions of the user to create (optional)
+        :param metadata: The metadata of the user to create (optional)
+        :return UserOutput, the created user
+        """
+        payload = {
+            "username": username,
+            "password": password,
+        }
+        if permissions is not None:
+            payload["permissions"] = permissions  # type: ignore
+
+        if metadata is not None:
+            payload["metadata"] = metadata  # type: ignore
+
+        return await self.post_json(
+            self.prefix,
+            agent_id,
+            output_class=UserOutput,
+            payload=payload,
+        )
+
+    async def get_users(self, agent_id: str) -> List[UserOutput]:
+        """
+        This endpoint is used to get a list of users in the system. The list includes the username and the permissions of
+        each user. The permissions are used to define the access rights of the users in the system and are defined by the
+        system administrator.
+        The endpoint can be used for the agent identified by the agentId parameter.
+        :param agent_id: The id of the agent to get users for
+        :return List[UserOutput], the users in the system with their permissions for the agent identified by agent_id
+        """
+        response = await self.get_http_client(agent_id).get(self.prefix)
+        response.raise_for_status()
+
+        return self.deserialize_list(self.decode(response), UserOutput)
+
+    async def get_user(self, user_id: str, agent_id: str) -> UserOutput:
+        """
+        This endpoint is used to get a user in the system. The user is identified by the userId parameter, previously
+        provided by the CheshireCat API when the user was created. The endpoint returns the username and the permissions
+        of the user. The permissions are used to define the access rights of the user in the system and are defined by
+        the system administrator.
+        The endpoint can be used for the agent identified by the agentId parameter.
+        :param user_id: The id of the user to get
+        :param agent_id: The id of the agent to get the user for
+        :return UserOutput, the user
+        """
+        return await self.get(self.format_url(user_id), agent_id, output_class=UserOutput)
+
+    async def put_user(
+        self,
+        user_id: str,
+        agent_id: str,
+        username: str | None = None,
+        password: str | None = None,
+        permissions: Dict[str, Any] | None = None,
+        metadata: Dict[str, Any] | None = None,
+    ) -> UserOutput:
+        """
+        The endpoint is used to update the user in the system. The user is identified by the userId parameter, previously
+        provided by the CheshireCat API when the user was created. The endpoint updates the username, the password, and
+        the permissions of the user. The permissions are used to define the access rights of the user in the system and
+        are defined by the system administrator.
+        The endpoint can be used for the agent identified by the agentId parameter.
+        :param user_id: The id of the user to update
+        :param agent_id: The id of the agent to update the user for
+        :param username: The new username of the user (optional)
+        :param password: The new password of the user (optional)
+        :param permissions: The new permissions of the user (optional)
+        :param metadata: The new metadata of the user (optional)
+        :return UserOutput, the updated user
+        """
+        payload = {}
+        if username is not None:
+            payload["username"] = username
+        if password is not None:
+            payload["password"] = password
+        if permissions is not None:
+            payload["permissions"] = permissions
+        if metadata is not None:
+            payload["metadata"] = metadata
+
+        return await self.put(self.format_url(user_id), agent_id, output_class=UserOutput, payload=payload)
+
+    async def delete_user(self, user_id: str, agent_id: str) -> UserOutput:
+        """
+        This endpoint is used to delete the user in the system. The user is identified by the userId parameter, previously
+        provided by the CheshireCat API when the user was created.
+        The endpoint can be used for the agent identified by the agentId parameter.
+        :param user_id: The id of the user to delete
+        :param agent_id: The id of the agent to delete the user for
+        :return UserOutput, the deleted user
+        """
+        return await self.delete(self.format_url(user_id), agent_id, output_class=UserOutput)
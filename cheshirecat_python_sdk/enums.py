@@ -28,3 +28,18 @@ class Enum(BaseEnum, metaclass=MetaEnum):
 
     def __hash__(self):
         return hash(self.value)
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class IngestionFileStatus(Enum):
+    PENDING = "pending"
+    UPLOADED = "uploaded"
+    EXISTING = "existing"  # the server already has a file with the same content
+    DUPLICATE = "duplicate"  # a file with the same content has been met before in the same ingestion
+    UNSUPPORTED = "unsupported"  # the MIME type of the file is not allowed
+    FAILED = "failed"
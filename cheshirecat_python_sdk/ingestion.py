@@ -0,0 +1,648 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any, AsyncIterator, Collection, Dict, Iterable, Iterator, List, Tuple
+
+from cheshirecat_python_sdk.endpoints.rabbit_hole import (
+    AsyncRabbitHoleEndpoint,
+    FileReportCallback,
+    RabbitHoleEndpoint,
+    batch_files,
+    inspect_file,
+    mark_duplicates,
+    mark_failed,
+    mark_uploaded,
+    walk_files,
+)
+from cheshirecat_python_sdk.enums import IngestionFileStatus
+from cheshirecat_python_sdk.models.api.rabbit_holes import (
+    IngestionFileReport,
+    IngestionJobReport,
+    UploadSingleFileResponse,
+)
+from cheshirecat_python_sdk.models.dtos import FilterSource
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS job (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    status TEXT NOT NULL,
+    size INTEGER NOT NULL DEFAULT 0,
+    hash TEXT,
+    content_type TEXT,
+    error TEXT,
+    status_code INTEGER,
+    response TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    run INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS files_by_status ON files (status, id);
+CREATE INDEX IF NOT EXISTS files_by_hash ON files (hash);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    ended_at REAL,
+    uploaded_files INTEGER,
+    uploaded_bytes INTEGER,
+    skipped_files INTEGER,
+    failed_files INTEGER
+);
+"""
+
+_FILE_COLUMNS = "path, status, size, hash, content_type, error, status_code, response"
+
+# the statuses of the files processed, for good or not, by an upload attempt
+_ATTEMPTED = (IngestionFileStatus.UPLOADED, IngestionFileStatus.FAILED)
+_SKIPPED = (IngestionFileStatus.EXISTING, IngestionFileStatus.DUPLICATE, IngestionFileStatus.UNSUPPORTED)
+
+INSERT_CHUNK_SIZE = 1000
+
+
+def _to_file_report(row: Tuple) -> IngestionFileReport:
+    path, status, size, file_hash, content_type, error, status_code, response = row
+    return IngestionFileReport(
+        path=path,
+        status=IngestionFileStatus(status),
+        size=size,
+        hash=file_hash,
+        content_type=content_type,
+        error=error,
+        status_code=status_code,
+        response=UploadSingleFileResponse.model_validate_json(response) if response else None,
+    )
+
+
+class IngestionManifest:
+    """
+    The state of the files of an ingestion job, kept in a SQLite database, so that the job can be resumed after a
+    crash: each file is recorded with its status, size, hash, MIME type, last error and server response, and the
+    outcome of each file is committed as soon as it is known. A manifest belongs to a single agent and chat.
+
+    The manifest can be used from many threads, one statement at a time.
+    """
+    def __init__(self, path: str | os.PathLike, agent_id: str, chat_id: str | None = None):
+        self.path = os.fspath(path)
+
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.__connection.execute("PRAGMA journal_mode = WAL")
+        self.__connection.execute("PRAGMA synchronous = NORMAL")
+        self.__connection.executescript(_SCHEMA)
+        self.__check_owner(agent_id, chat_id)
+
+    def __check_owner(self, agent_id: str, chat_id: str | None):
+        owner = json.dumps({"agent_id": agent_id, "chat_id": chat_id})
+        with self.__lock, self.__connection as connection:
+            connection.execute("INSERT OR IGNORE INTO job (key, value) VALUES ('owner', ?)", (owner,))
+            (recorded,) = connection.execute("SELECT value FROM job WHERE key = 'owner'").fetchone()
+        if recorded != owner:
+            raise ValueError(f"The manifest {self.path} belongs to another ingestion job: {recorded}")
+
+    def close(self):
+        with self.__lock:
+            self.__connection.close()
+
+    def add(self, paths: Iterable[str | os.PathLike]) -> int:
+        """
+        Records new files as pending, a chunk at a time; the files already recorded are left as they are.
+        :param paths: The paths of the files.
+        :return: int, the number of files recorded
+        """
+        added, chunk = 0, []
+        now = time.time()
+
+        def flush():
+            with self.__lock, self.__connection as connection:
+                cursor = connection.executemany(
+                    "INSERT OR IGNORE INTO files (path, status, updated_at) VALUES (?, ?, ?)",
+                    [(path, IngestionFileStatus.PENDING.value, now) for path in chunk],
+                )
+                return cursor.rowcount
+
+        for path in paths:
+            chunk.append(os.path.abspath(path))
+            if len(chunk) >= INSERT_CHUNK_SIZE:
+                added += flush()
+                chunk = []
+        if chunk:
+            added += flush()
+        return added
+
+    def get_work(
+        self,
+        statuses: Collection[IngestionFileStatus],
+        after: int,
+        limit: int,
+        max_attempts: int | None = None,
+    ) -> List[Tuple[int, str]]:
+        """
+        Returns the next files to process, in the order they were added.
+        :param statuses: The statuses of the files to process.
+        :param after: The ID of the last file returned before.
+        :param limit: The max number of files to return.
+        :param max_attempts: The max number of upload attempts of a file, if any.
+        :return: List[Tuple[int, str]], the ID and path of each file
+        """
+        placeholders = ", ".join("?" * len(statuses))
+        query = f"SELECT id, path FROM files WHERE status IN ({placeholders}) AND id > ?"
+        parameters: List[Any] = [status.value for status in statuses] + [after]
+        if max_attempts is not None:
+            query += " AND attempts < ?"
+            parameters.append(max_attempts)
+
+        with self.__lock:
+            return self.__connection.execute(f"{query} ORDER BY id LIMIT ?", parameters + [limit]).fetchall()
+
+    def start_run(self) -> int:
+        with self.__lock, self.__connection as connection:
+            return connection.execute("INSERT INTO runs (started_at) VALUES (?)", (time.time(),)).lastrowid
+
+    def end_run(self, run: int, report: IngestionJobReport):
+        with self.__lock, self.__connection as connection:
+            connection.execute(
+                "UPDATE runs SET ended_at = ?, uploaded_files = ?, uploaded_bytes = ?, skipped_files = ?, "
+                "failed_files = ? WHERE id = ?",
+                (
+                    time.time(),
+                    report.uploaded_files,
+                    report.uploaded_bytes,
+                    report.skipped_files,
+                    report.failed_files,
+                    run,
+                ),
+            )
+
+    def mark_recorded_duplicates(self, reports: Iterable[IngestionFileReport], run: int):
+        """
+        Marks as duplicates the pending files whose content has already been uploaded, found on the server or taken up
+        for upload by an earlier file of the same run.
+        """
+        with self.__lock:
+            for report in reports:
+                if report.status != IngestionFileStatus.PENDING:
+                    continue
+                duplicate = self.__connection.execute(
+                    "SELECT 1 FROM files "
+                    "WHERE hash = ? AND path <> ? AND (status IN (?, ?) OR (status = ? AND run = ?)) LIMIT 1",
+                    (
+                        report.hash,
+                        report.path,
+                        IngestionFileStatus.UPLOADED.value,
+                        IngestionFileStatus.EXISTING.value,
+                        IngestionFileStatus.PENDING.value,
+                        run,
+                    ),
+                ).fetchone()
+                if duplicate is not None:
+                    report.status = IngestionFileStatus.DUPLICATE
+
+    def record(self, reports: List[IngestionFileReport], run: int):
+        """
+        Records the state of some files in a single transaction, counting an attempt for those uploaded or failed.
+        """
+        now = time.time()
+        with self.__lock, self.__connection as connection:
+            connection.executemany(
+                "UPDATE files SET status = ?, size = ?, hash = ?, content_type = ?, error = ?, status_code = ?, "
+                "response = ?, attempts = attempts + ?, run = ?, updated_at = ? WHERE path = ?",
+                [
+                    (
+                        report.status.value,
+                        report.size,
+                        report.hash,
+                        report.content_type,
+                        report.error,
+                        report.status_code,
+                        report.response.model_dump_json() if report.response is not None else None,
+                        1 if report.status in _ATTEMPTED else 0,
+                        run,
+                        now,
+                        report.path,
+                    )
+                    for report in reports
+                ],
+            )
+
+    def count_statuses(self) -> Dict[IngestionFileStatus, int]:
+        with self.__lock:
+            rows = self.__connection.execute("SELECT status, COUNT(*) FROM files GROUP BY status").fetchall()
+        return {IngestionFileStatus(status): count for status, count in rows}
+
+    def get_files(
+        self, status: IngestionFileStatus | None = None, after: int = 0, limit: int = 1000
+    ) -> List[Tuple[int, IngestionFileReport]]:
+        """
+        Returns a page of the files, in the order they were added, with their id, to be given as `after` to get the
+        next page.
+        :param status: The status of the files to return, if any.
+        :param after: The id after which the page starts.
+        :param limit: The max number of files to return.
+        """
+        query = f"SELECT id, {_FILE_COLUMNS} FROM files WHERE id > ?"
+        parameters: List[Any] = [after]
+        if status is not None:
+            query += " AND status = ?"
+            parameters.append(status.value)
+
+        with self.__lock:
+            rows = self.__connection.execute(f"{query} ORDER BY id LIMIT ?", parameters + [limit]).fetchall()
+        return [(row[0], _to_file_report(row[1:])) for row in rows]
+
+    def iter_files(
+        self, status: IngestionFileStatus | None = None, page_size: int = 1000
+    ) -> Iterator[IngestionFileReport]:
+        """
+        Yields the state of the files, in the order they were added, reading a page at a time.
+        :param status: The status of the files to yield, if any.
+        :param page_size: The number of files read at a time.
+        """
+        after = 0
+        while page := self.get_files(status, after, page_size):
+            for _, report in page:
+                yield report
+            after = page[-1][0]
+
+
+def get_statuses_to_run(retry_failed: bool) -> List[IngestionFileStatus]:
+    if retry_failed:
+        return [IngestionFileStatus.PENDING, IngestionFileStatus.FAILED]
+    return [IngestionFileStatus.PENDING]
+
+
+def count_outcomes(counts: Counter, reports: Iterable[IngestionFileReport]):
+    for report in reports:
+        if report.status != IngestionFileStatus.PENDING:
+            counts[report.status] += 1
+            if report.status == IngestionFileStatus.UPLOADED:
+                counts["bytes"] += report.size
+
+
+def to_ingestion_job_report(
+    counts: Counter, elapsed: float, statuses: Dict[IngestionFileStatus, int]
+) -> IngestionJobReport:
+    uploaded_files, uploaded_bytes = counts[IngestionFileStatus.UPLOADED], counts["bytes"]
+    return IngestionJobReport(
+        uploaded_files=uploaded_files,
+        uploaded_bytes=uploaded_bytes,
+        skipped_files=sum(counts[status] for status in _SKIPPED),
+        failed_files=counts[IngestionFileStatus.FAILED],
+        elapsed=elapsed,
+        files_per_second=uploaded_files / elapsed if elapsed > 0 else 0.0,
+        bytes_per_second=uploaded_bytes / elapsed if elapsed > 0 else 0.0,
+        statuses=statuses,
+    )
+
+
+class IngestionJob:
+    """
+    A resumable ingestion of many files, whose state is kept in a SQLite manifest. The files are added to the manifest
+    as pending, then uploaded by `run`, with the same pipeline as `RabbitHoleEndpoint.ingest_directory`: the outcome of
+    each file is committed to the manifest as soon as it is known, so that a run interrupted halfway, even by a crash,
+    is resumed by the next one from where it stopped. The files which failed are retried by the next runs, and only
+    them.
+
+    Example:
+        with IngestionJob(cheshire_cat_client.rabbit_hole, "ingestion.db", "agent") as job:
+            job.add_directory("path/to/docs")
+            report = job.run()
+    """
+    def __init__(
+        self,
+        rabbit_hole: RabbitHoleEndpoint,
+        manifest_path: str | os.PathLike,
+        agent_id: str,
+        chat_id: str | None = None,
+        metadata: Dict[str, Any] | None = None,
+    ):
+        self.rabbit_hole = rabbit_hole
+        self.agent_id = agent_id
+        self.chat_id = chat_id
+        self.metadata = metadata
+        self.manifest = IngestionManifest(manifest_path, agent_id, chat_id)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self.manifest.close()
+
+    def add(self, paths: Iterable[str | os.PathLike]) -> int:
+        """
+        Adds files to the job, as pending; the files already added are left as they are.
+        :param paths: The paths of the files.
+        :return: int, the number of files added
+        """
+        return self.manifest.add(paths)
+
+    def add_directory(self, path: str | os.PathLike, pattern: str = "*", recursive: bool = True) -> int:
+        """
+        Adds the files of a directory tree to the job, as pending; the files already added are left as they are.
+        :param path: The root of the directory tree.
+        :param pattern: The glob pattern the names of the files must match.
+        :param recursive: Whether to descend into the subdirectories.
+        :return: int, the number of files added
+        """
+        return self.manifest.add(walk_files(path, pattern, recursive))
+
+    def files(self, status: IngestionFileStatus | None = None) -> Iterator[IngestionFileReport]:
+        """
+        Yields the state of the files of the job, in the order they were added.
+        :param status: The status of the files to yield, if any.
+        """
+        return self.manifest.iter_files(status)
+
+    def __upload_batch(self, batch: List[IngestionFileReport]) -> List[IngestionFileReport]:
+        try:
+            result = self.rabbit_hole.post_files(
+                [report.path for report in batch], self.agent_id, self.chat_id, self.metadata
+            )
+        except Exception as e:
+            mark_failed(batch, e)
+        else:
+            mark_uploaded(batch, result)
+            if self.rabbit_hole.client.source_cache is not None:
+                for report in batch:
+                    self.rabbit_hole.client.source_cache.remember(
+                        self.agent_id, FilterSource(hash=report.hash), self.chat_id
+                    )
+        return batch
+
+    def run(
+        self,
+        retry_failed: bool = True,
+        max_attempts: int | None = None,
+        skip_existing: bool = True,
+        concurrency: int = 4,
+        batch_size: int = 32,
+        max_batch_bytes: int = 32 * 1024 * 1024,
+        max_open_files: int = 16,
+        on_file: FileReportCallback | None = None,
+    ) -> IngestionJobReport:
+        """
+        Uploads the pending files of the job and, unless told otherwise, retries the failed ones; the files uploaded or
+        skipped by an earlier run are not read again. The files are read a window at a time, in the order they were
+        added, and each window is checked, deduplicated and uploaded as `RabbitHoleEndpoint.ingest_directory` does.
+        :param retry_failed: Whether to retry the files which failed in an earlier run.
+        :param max_attempts: The max number of upload attempts of a file, if any: the files which failed as many times
+            are left failed.
+        :param skip_existing: Whether to skip the files whose content the server already has.
+        :param concurrency: The max number of files read, and of batches uploaded, at a time.
+        :param batch_size: The max number of files of a batch.
+        :param max_batch_bytes: The max size of a batch, in bytes.
+        :param max_open_files: The max number of files open at a time; it lowers the concurrency if needed.
+        :param on_file: The callback notified of the report of each file, as soon as its outcome is recorded.
+        :return: IngestionJobReport, the outcome and the throughput of the run, and the state of the whole job
+        """
+        start = time.monotonic()
+        concurrency = max(1, min(concurrency, max_open_files // 2))
+        allowed_mime_types = frozenset(self.rabbit_hole.get_allowed_mime_types(self.agent_id).allowed)
+        statuses = get_statuses_to_run(retry_failed)
+        run = self.manifest.start_run()
+        counts: Counter = Counter()
+
+        def finish(reports: List[IngestionFileReport]):
+            self.manifest.record(reports, run)
+            count_outcomes(counts, reports)
+            if on_file is not None:
+                for report in reports:
+                    if report.status != IngestionFileStatus.PENDING:
+                        on_file(report)
+
+        def collect(futures: List[Future]):
+            for future in futures:
+                finish(future.result())
+
+        after = 0
+        with (
+            ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="cheshirecat-ingestion") as inspector,
+            ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="cheshirecat-upload") as uploader,
+        ):
+            pending: List[Future] = []
+            while window := self.manifest.get_work(statuses, after, batch_size * concurrency, max_attempts):
+                after = window[-1][0]
+                inspected = list(inspector.map(lambda row: inspect_file(row[1], allowed_mime_types), window))
+
+                self.manifest.mark_recorded_duplicates(inspected, run)
+                to_upload = mark_duplicates(inspected, set())
+                if skip_existing and to_upload:
+                    existing = self.rabbit_hole.client.memory.has_sources(
+                        self.agent_id, [FilterSource(hash=report.hash) for report in to_upload], self.chat_id,
+                        concurrency,
+                    )
+                    for report, exists in zip(to_upload, existing):
+                        if exists:
+                            report.status = IngestionFileStatus.EXISTING
+                    to_upload = [report for report in to_upload if report.status == IngestionFileStatus.PENDING]
+                # the files to upload are recorded too, with their hash, so that their copies met later are skipped
+                finish(inspected)
+
+                submitted = [
+                    uploader.submit(copy_context().run, self.__upload_batch, batch)
+                    for batch in batch_files(to_upload, batch_size, max_batch_bytes)
+                ]
+                collect(pending)
+                pending = submitted
+            collect(pending)
+
+        report = to_ingestion_job_report(counts, time.monotonic() - start, self.manifest.count_statuses())
+        self.manifest.end_run(run, report)
+        return report
+
+
+class AsyncIngestionJob:
+    """
+    A resumable ingestion of many files, whose state is kept in a SQLite manifest. The files are added to the manifest
+    as pending, then uploaded by `run`, with the same pipeline as `AsyncRabbitHoleEndpoint.ingest_directory`: the
+    outcome of each file is committed to the manifest as soon as it is known, so that a run interrupted halfway, even by
+    a crash, is resumed by the next one from where it stopped. The files which failed are retried by the next runs, and
+    only them. The manifest is read and written in worker threads, so that the event loop is never blocked on the disk.
+
+    Example:
+        async with AsyncIngestionJob(cheshire_cat_client.rabbit_hole, "ingestion.db", "agent") as job:
+            await job.add_directory("path/to/docs")
+            report = await job.run()
+    """
+    def __init__(
+        self,
+        rabbit_hole: AsyncRabbitHoleEndpoint,
+        manifest_path: str | os.PathLike,
+        agent_id: str,
+        chat_id: str | None = None,
+        metadata: Dict[str, Any] | None = None,
+    ):
+        self.rabbit_hole = rabbit_hole
+        self.agent_id = agent_id
+        self.chat_id = chat_id
+        self.metadata = metadata
+        self.manifest = IngestionManifest(manifest_path, agent_id, chat_id)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        self.manifest.close()
+
+    async def add(self, paths: Iterable[str | os.PathLike]) -> int:
+        """
+        Adds files to the job, as pending; the files already added are left as they are.
+        :param paths: The paths of the files.
+        :return: int, the number of files added
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self.manifest.add, paths)
+
+    async def add_directory(self, path: str | os.PathLike, pattern: str = "*", recursive: bool = True) -> int:
+        """
+        Adds the files of a directory tree to the job, as pending; the files already added are left as they are.
+        :param path: The root of the directory tree.
+        :param pattern: The glob pattern the names of the files must match.
+        :param recursive: Whether to descend into the subdirectories.
+        :return: int, the number of files added
+        """
+        return await self.add(walk_files(path, pattern, recursive))
+
+    async def files(
+        self, status: IngestionFileStatus | None = None, page_size: int = 1000
+    ) -> AsyncIterator[IngestionFileReport]:
+        """
+        Yields the state of the files of the job, in the order they were added, reading a page at a time in the
+        executor.
+        :param status: The status of the files to yield, if any.
+        :param page_size: The number of files read at a time.
+        """
+        loop = asyncio.get_running_loop()
+        after = 0
+        while page := await loop.run_in_executor(None, self.manifest.get_files, status, after, page_size):
+            for _, report in page:
+                yield report
+            after = page[-1][0]
+
+    async def __upload_batch(self, batch: List[IngestionFileReport]) -> List[IngestionFileReport]:
+        try:
+            result = await self.rabbit_hole.post_files(
+                [report.path for report in batch], self.agent_id, self.chat_id, self.metadata
+            )
+        except Exception as e:
+            mark_failed(batch, e)
+        else:
+            mark_uploaded(batch, result)
+            if self.rabbit_hole.client.source_cache is not None:
+                for report in batch:
+                    self.rabbit_hole.client.source_cache.remember(
+                        self.agent_id, FilterSource(hash=report.hash), self.chat_id
+                    )
+        return batch
+
+    async def run(
+        self,
+        retry_failed: bool = True,
+        max_attempts: int | None = None,
+        skip_existing: bool = True,
+        concurrency: int = 4,
+        batch_size: int = 32,
+        max_batch_bytes: int = 32 * 1024 * 1024,
+        max_open_files: int = 16,
+        on_file: FileReportCallback | None = None,
+    ) -> IngestionJobReport:
+        """
+        Uploads the pending files of the job and, unless told otherwise, retries the failed ones; the files uploaded or
+        skipped by an earlier run are not read again. The files are read a window at a time, in the order they were
+        added, and each window is checked, deduplicated and uploaded as `AsyncRabbitHoleEndpoint.ingest_directory`
+        does.
+        :param retry_failed: Whether to retry the files which failed in an earlier run.
+        :param max_attempts: The max number of upload attempts of a file, if any: the files which failed as many times
+            are left failed.
+        :param skip_existing: Whether to skip the files whose content the server already has.
+        :param concurrency: The max number of files read, and of batches uploaded, at a time.
+        :param batch_size: The max number of files of a batch.
+        :param max_batch_bytes: The max size of a batch, in bytes.
+        :param max_open_files: The max number of files open at a time; it lowers the concurrency if needed.
+        :param on_file: The callback notified of the report of each file, as soon as its outcome is recorded.
+        :return: IngestionJobReport, the outcome and the throughput of the run, and the state of the whole job
+        """
+        start = time.monotonic()
+        concurrency = max(1, min(concurrency, max_open_files // 2))
+        allowed_mime_types = frozenset((await self.rabbit_hole.get_allowed_mime_types(self.agent_id)).allowed)
+        statuses = get_statuses_to_run(retry_failed)
+        semaphore = asyncio.Semaphore(concurrency)
+        loop = asyncio.get_running_loop()
+        counts: Counter = Counter()
+
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="cheshirecat-ingestion") as inspector:
+            run = await loop.run_in_executor(inspector, self.manifest.start_run)
+
+            async def finish(reports: List[IngestionFileReport]):
+                await loop.run_in_executor(inspector, self.manifest.record, reports, run)
+                count_outcomes(counts, reports)
+                if on_file is not None:
+                    for report in reports:
+                        if report.status != IngestionFileStatus.PENDING:
+                            on_file(report)
+
+            async def upload(batch: List[IngestionFileReport]) -> List[IngestionFileReport]:
+                async with semaphore:
+                    return await self.__upload_batch(batch)
+
+            async def collect(tasks: List[asyncio.Task]):
+                for task in tasks:
+                    await finish(await task)
+
+            after = 0
+            pending: List[asyncio.Task] = []
+            try:
+                while window := await loop.run_in_executor(
+                    inspector, self.manifest.get_work, statuses, after, batch_size * concurrency, max_attempts
+                ):
+                    after = window[-1][0]
+                    inspected = list(await asyncio.gather(*[
+                        loop.run_in_executor(inspector, inspect_file, file_path, allowed_mime_types)
+                        for _, file_path in window
+                    ]))
+
+                    await loop.run_in_executor(inspector, self.manifest.mark_recorded_duplicates, inspected, run)
+                    to_upload = mark_duplicates(inspected, set())
+                    if skip_existing and to_upload:
+                        existing = await self.rabbit_hole.client.memory.has_sources(
+                            self.agent_id, [FilterSource(hash=report.hash) for report in to_upload], self.chat_id,
+                            concurrency,
+                        )
+                        for report, exists in zip(to_upload, existing):
+                            if exists:
+                                report.status = IngestionFileStatus.EXISTING
+                        to_upload = [report for report in to_upload if report.status == IngestionFileStatus.PENDING]
+                    # the files to upload are recorded too, with their hash, so that their copies met later are skipped
+                    await finish(inspected)
+
+                    submitted = [
+                        asyncio.create_task(upload(batch))
+                        for batch in batch_files(to_upload, batch_size, max_batch_bytes)
+                    ]
+                    # the batches just submitted are cancelled too if collecting the previous ones fails
+                    previous, pending = pending, pending + submitted
+                    await collect(previous)
+                    pending = submitted
+                await collect(pending)
+            finally:
+                for task in pending:
+                    task.cancel()
+
+            statuses_after = await loop.run_in_executor(inspector, self.manifest.count_statuses)
+            report = to_ingestion_job_report(counts, time.monotonic() - start, statuses_after)
+            await loop.run_in_executor(inspector, self.manifest.end_run, run, report)
+        return report
@@ -1,5 +1,5 @@
 from typing import Dict, List, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 
 
 class FactoryObjectSettingOutput(BaseModel):
@@ -7,11 +7,13 @@ class FactoryObjectSettingOutput(BaseModel):
     value: Dict[str, Any]
     scheme: Dict[str, Any] | None = None
 
-    def __init__(self, /, **data: Any) -> None:
-        # if tags is a list, convert it to a comma-separated string
-        if "scheme" in data and isinstance(data["scheme"], Dict) and not data["scheme"]:
-            data["scheme"] = None
-        super().__init__(**data)
+    @model_validator(mode="before")
+    @classmethod
+    def normalize_scheme(cls, data: Any) -> Any:
+        # an empty scheme means no scheme
+        if isinstance(data, Dict) and isinstance(data.get("scheme"), Dict) and not data["scheme"]:
+            data = {**data, "scheme": None}
+        return data
 
 
 class FactoryObjectSettingsOutput(BaseModel):
@@ -1,14 +1,21 @@
 from typing import Dict, List, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, field_serializer, field_validator
 
 from cheshirecat_python_sdk.models.api.nested.memories import (
     CollectionsItem,
+    MemoryPointFailure,
     MemoryPointsDeleteByMetadataInfo,
     Record,
     MemoryRecallQuery,
     MemoryRecallVectors,
 )
 from cheshirecat_python_sdk.models.dtos import MemoryPoint
+from cheshirecat_python_sdk.models.vectors import (
+    compact_vector_validator,
+    get_dense_vector,
+    plain_vector_serializer,
+    stack_vectors,
+)
 
 
 class CollectionPointsDestroyOutput(BaseModel):
@@ -25,17 +32,36 @@ class MemoryPointDeleteOutput(BaseModel):
 
 class MemoryPointOutput(MemoryPoint):
     id: str
-    vector: List[float] | List[List[float]] | Dict[str, Any]
+    vector: List[float] | List[List[float]] | Dict[str, Any] | None = None  # None when the vectors are omitted
+
+    _compact_vector = field_validator("vector", mode="wrap")(compact_vector_validator)
+    _plain_vector = field_serializer("vector")(plain_vector_serializer)
 
 
 class MemoryPointsDeleteByMetadataOutput(BaseModel):
     deleted: MemoryPointsDeleteByMetadataInfo
 
 
+class MemoryPointsBulkOutput(BaseModel):
+    ids: List[str | None]  # the ID of each memory point, in the order of the input; None for the failed ones
+    failures: List[MemoryPointFailure]
+
+
 class MemoryPointsOutput(BaseModel):
     points: List[Record]
     next_offset: str | int | None = None
 
+    def get_vectors_matrix(self, name: str | None = None) -> Any:
+        """
+        Stacks the dense vectors of the page into a (n, dim) matrix, in the order of the points: a float32 numpy array
+        if numpy is installed, a two-dimensional memoryview of float32 otherwise. The points without a vector are
+        skipped.
+        :param name: The name of the vector to stack, when the points have named vectors.
+        :return: the matrix
+        """
+        vectors = [get_dense_vector(point.vector, name) for point in self.points if point.vector is not None]
+        return stack_vectors([vector for vector in vectors if vector is not None])
+
 
 class MemoryRecallOutput(BaseModel):
     query: MemoryRecallQuery
@@ -1,3 +1,4 @@
+from typing import Any
 from pydantic import Field, BaseModel
 
 from cheshirecat_python_sdk.models.dtos import MessageBase, Why
@@ -14,3 +15,37 @@ class ChatOutput(BaseModel):
     user_id: str
     chat_id: str
     message: MessageOutput
+
+
+class StreamEvent:
+    """
+    An event of the answer streamed via WebSocket. Events are built once per frame, at token-stream rates: they are
+    plain objects with slots, instead of models, so that building them costs no validation.
+    """
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        attributes = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({attributes})"
+
+
+class ChatTokenEvent(StreamEvent):
+    __slots__ = ("content",)
+
+    def __init__(self, content: str):
+        self.content = content
+
+
+class NotificationEvent(StreamEvent):
+    __slots__ = ("type", "content")
+
+    def __init__(self, type: str, content: Any = None):
+        self.type = type
+        self.content = content
+
+
+class ChatOutputEvent(StreamEvent):
+    __slots__ = ("output",)
+
+    def __init__(self, output: ChatOutput):
+        self.output = output
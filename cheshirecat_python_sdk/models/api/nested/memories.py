@@ -1,7 +1,13 @@
 from typing import Dict, List, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, field_serializer, field_validator
 
 from cheshirecat_python_sdk.models.dtos import MessageBase, Why
+from cheshirecat_python_sdk.models.vectors import (
+    compact_recall_collections_validator,
+    compact_vector_validator,
+    plain_recall_collections_serializer,
+    plain_vector_serializer,
+)
 
 
 class CollectionsItem(BaseModel):
@@ -24,15 +30,27 @@ class MemoryPointsDeleteByMetadataInfo(BaseModel):
     status: str
 
 
+class MemoryPointFailure(BaseModel):
+    index: int
+    error: str
+    status_code: int | None = None
+
+
 class MemoryRecallQuery(BaseModel):
     text: str
-    vector: List[float] | List[List[float]] | Dict[str, Any]
+    vector: List[float] | List[List[float]] | Dict[str, Any] | None = None  # None when the vectors are omitted
+
+    _compact_vector = field_validator("vector", mode="wrap")(compact_vector_validator)
+    _plain_vector = field_serializer("vector")(plain_vector_serializer)
 
 
 class MemoryRecallVectors(BaseModel):
     embedder: str
     collections: Dict[str, List[Dict[str, Any]]]
 
+    _compact_vectors = field_validator("collections", mode="wrap")(compact_recall_collections_validator)
+    _plain_vectors = field_serializer("collections")(plain_recall_collections_serializer)
+
 
 class Record(BaseModel):
     id: str
@@ -40,3 +58,6 @@ class Record(BaseModel):
     vector: List[float] | List[List[float]] | Dict[str, Any] | None = None
     shard_key: int | str | None = None
     order_value: int | float | None = None
+
+    _compact_vector = field_validator("vector", mode="wrap")(compact_vector_validator)
+    _plain_vector = field_serializer("vector")(plain_vector_serializer)
@@ -1,5 +1,5 @@
 from typing import Dict, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 
 
 class PropertySettingsOutput(BaseModel):
@@ -20,8 +20,10 @@ class PluginSettingsOutput(BaseModel):
     value: Dict[str, Any]
     scheme: PluginSchemaSettings | None = None
 
-    def __init__(self, /, **data: Any) -> None:
-        # if tags is a list, convert it to a comma-separated string
-        if "scheme" in data and isinstance(data["scheme"], Dict) and not data["scheme"]:
-            data["scheme"] = None
-        super().__init__(**data)
+    @model_validator(mode="before")
+    @classmethod
+    def normalize_scheme(cls, data: Any) -> Any:
+        # an empty scheme means no scheme
+        if isinstance(data, Dict) and isinstance(data.get("scheme"), Dict) and not data["scheme"]:
+            data = {**data, "scheme": None}
+        return data
@@ -1,5 +1,5 @@
 from typing import List, Any, Dict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from cheshirecat_python_sdk.models.api.nested.plugins import PluginSettingsOutput
 
@@ -40,11 +40,13 @@ class PluginItemOutput(BaseModel):
     version: str | None = None
     local_info: Dict = Field(default_factory=dict)
 
-    def __init__(self, /, **data: Any) -> None:
+    @model_validator(mode="before")
+    @classmethod
+    def normalize_tags(cls, data: Any) -> Any:
         # if tags is a list, convert it to a comma-separated string
-        if "tags" in data and isinstance(data["tags"], list):
-            data["tags"] = ", ".join(data["tags"])
-        super().__init__(**data)
+        if isinstance(data, Dict) and isinstance(data.get("tags"), list):
+            data = {**data, "tags": ", ".join(data["tags"])}
+        return data
 
 
 class PluginCollectionOutput(BaseModel):
@@ -65,11 +67,13 @@ class PluginItemRegistryOutput(BaseModel):
     version: str | None = None
     url: str | None = None
 
-    def __init__(self, /, **data: Any) -> None:
+    @model_validator(mode="before")
+    @classmethod
+    def normalize_tags(cls, data: Any) -> Any:
         # if tags is a list, convert it to a comma-separated string
-        if "tags" in data and isinstance(data["tags"], list):
-            data["tags"] = ", ".join(data["tags"])
-        super().__init__(**data)
+        if isinstance(data, Dict) and isinstance(data.get("tags"), list):
+            data = {**data, "tags": ", ".join(data["tags"])}
+        return data
 
 
 class PluginsSettingsOutput(BaseModel):
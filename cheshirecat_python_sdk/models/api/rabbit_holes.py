@@ -1,6 +1,8 @@
-from typing import List
+from typing import Dict, List
 from pydantic import BaseModel
 
+from cheshirecat_python_sdk.enums import IngestionFileStatus
+
 
 class UploadSingleFileResponse(BaseModel):
     filename: str
@@ -15,3 +17,52 @@ class UploadUrlResponse(BaseModel):
 
 class AllowedMimeTypesOutput(BaseModel):
     allowed: List[str]
+
+
+class IngestionFileReport(BaseModel):
+    path: str
+    status: IngestionFileStatus = IngestionFileStatus.PENDING
+    size: int = 0
+    hash: str | None = None  # the SHA-256 of the content
+    content_type: str | None = None
+    error: str | None = None
+    status_code: int | None = None
+    response: UploadSingleFileResponse | None = None
+
+
+class IngestionReport(BaseModel):
+    files: List[IngestionFileReport]
+    uploaded_files: int
+    uploaded_bytes: int
+    skipped_files: int
+    failed_files: int
+    elapsed: float
+    files_per_second: float  # of the files uploaded
+    bytes_per_second: float  # of the files uploaded
+
+
+class IngestionJobReport(BaseModel):
+    uploaded_files: int  # in the run
+    uploaded_bytes: int  # in the run
+    skipped_files: int  # in the run
+    failed_files: int  # in the run
+    elapsed: float
+    files_per_second: float  # of the files uploaded in the run
+    bytes_per_second: float  # of the files uploaded in the run
+    statuses: Dict[IngestionFileStatus, int]  # the number of files of the manifest by status, after the run
+
+
+class IngestionResult(BaseModel):
+    source: str  # the name of the file, or the URL, as notified by the server
+    chunks: int | None = None  # the number of chunks made of the source, if notified
+    message: str | None = None  # the text of the notification
+
+
+class WebIngestionResult(BaseModel):
+    url: str  # as given
+    normalized_url: str
+    # uploaded, existing (among the web sources of the agent), duplicate (of a URL given before) or failed
+    status: IngestionFileStatus = IngestionFileStatus.PENDING
+    response: UploadUrlResponse | None = None
+    error: str | None = None
+    status_code: int | None = None
@@ -0,0 +1,143 @@
+from array import array
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional: dense vectors fall back to array("f")
+    np = None
+
+_compact_vectors: ContextVar[bool] = ContextVar("cheshirecat_compact_vectors", default=False)
+
+
+def is_compact_vectors() -> bool:
+    return _compact_vectors.get()
+
+
+@contextmanager
+def compact_vectors(enabled: bool = True) -> Iterator[None]:
+    """
+    Makes the memory points and recalls read inside the block, in the current thread or task, hold their dense vectors
+    as contiguous float32 arrays: numpy arrays if numpy is installed, `array("f")` otherwise. Sparse vectors are kept
+    as they are.
+
+    Example:
+        with compact_vectors():
+            page = client.memory.get_memory_points("declarative", "agent")
+        matrix = page.get_vectors_matrix()
+
+    :param enabled: Whether to compact the vectors inside the block.
+    """
+    token = _compact_vectors.set(enabled)
+    try:
+        yield
+    finally:
+        _compact_vectors.reset(token)
+
+
+def is_dense(values: Any) -> bool:
+    return isinstance(values, list) and (not values or isinstance(values[0], (int, float)))
+
+
+def to_dense_vector(values: Sequence[float]) -> Any:
+    if np is not None:
+        return np.asarray(values, dtype=np.float32)
+    return array("f", values)
+
+
+def compact_vector(vector: Any) -> Any:
+    """
+    Converts a vector as returned by the API into its compact form: a dense vector becomes a float32 array, a
+    multi-vector a (n, dim) matrix (a list of arrays without numpy), and each dense vector of a named vector is converted
+    the same way. Sparse vectors, i.e. {"indices": [...], "values": [...]}, and anything else are returned unchanged.
+    """
+    if is_dense(vector):
+        return to_dense_vector(vector)
+    if isinstance(vector, list) and all(is_dense(values) for values in vector):
+        if np is not None:
+            return np.asarray(vector, dtype=np.float32)
+        return [to_dense_vector(values) for values in vector]
+    if isinstance(vector, dict) and not {"indices", "values"} <= vector.keys():
+        return {name: compact_vector(values) for name, values in vector.items()}
+    return vector
+
+
+def compact_vector_validator(value: Any, handler) -> Any:
+    # skips the validation of the single floats, which is where most of the time and memory of a vector goes
+    if value is not None and is_compact_vectors():
+        compacted = compact_vector(value)
+        if compacted is not value:
+            return compacted
+    return handler(value)
+
+
+def to_plain_vector(vector: Any) -> Any:
+    """
+    Converts a compact vector back into plain lists of floats, as returned by the API. Anything else is returned
+    unchanged.
+    """
+    if isinstance(vector, array) or (np is not None and isinstance(vector, np.ndarray)):
+        return vector.tolist()
+    if isinstance(vector, list) and not is_dense(vector):
+        return [to_plain_vector(values) for values in vector]
+    if isinstance(vector, dict):
+        return {name: to_plain_vector(values) for name, values in vector.items()}
+    return vector
+
+
+def plain_vector_serializer(value: Any) -> Any:
+    # the compact vectors are dumped as the lists they were read from, so that the models still round-trip
+    return to_plain_vector(value)
+
+
+def plain_recall_collections_serializer(collections: Dict[str, List[Dict[str, Any]]]) -> Any:
+    return {
+        name: [
+            {**point, "vector": to_plain_vector(point["vector"])} if "vector" in point else point for point in points
+        ]
+        for name, points in collections.items()
+    }
+
+
+def compact_recall_collections_validator(value: Any, handler) -> Any:
+    collections = handler(value)
+    if is_compact_vectors():
+        for points in collections.values():
+            for point in points:
+                if "vector" in point:
+                    point["vector"] = compact_vector(point["vector"])
+    return collections
+
+
+def stack_vectors(vectors: List[Any]) -> Any:
+    """
+    Stacks dense vectors of the same size into a (n, dim) matrix: a numpy array if numpy is installed, a
+    two-dimensional memoryview of float32 otherwise.
+    :param vectors: The dense vectors, either lists of floats or compact vectors.
+    :return: the matrix
+    """
+    if np is not None:
+        if not vectors:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack([np.asarray(vector, dtype=np.float32) for vector in vectors])
+
+    if not vectors:
+        # memoryviews cannot have zeros in their shape
+        return memoryview(array("f"))
+
+    dim = len(vectors[0])
+    flat = array("f")
+    for vector in vectors:
+        if len(vector) != dim:
+            raise ValueError(f"Cannot stack vectors of different sizes: {len(vector)} != {dim}")
+        flat.extend(vector)
+    return memoryview(flat).cast("B").cast("f", (len(vectors), dim))
+
+
+def get_dense_vector(vector: Any, name: str | None) -> Any:
+    if isinstance(vector, dict):
+        if name is None:
+            raise ValueError("The vectors are named: choose one of them by name")
+        return vector.get(name)
+    return vector
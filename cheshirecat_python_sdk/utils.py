@@ -1,20 +1,460 @@
 import os
-from typing import Dict, Type, TypeVar, BinaryIO, Tuple
+import threading
+import types
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, repeat
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Type,
+    TypeVar,
+    BinaryIO,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
 import magic
+from pydantic import BaseModel, TypeAdapter
+from pydantic.fields import FieldInfo
+
+from cheshirecat_python_sdk.clients.multipart import CHUNK_SIZE, UploadSource, is_path
 
 T = TypeVar("T")
 
+Builder = Callable[[Any], Any]
+
+
+def deserialize(data: Dict, cls: Type[T], trusted: bool = False) -> T:
+    """
+    Builds the model of a response body.
+    :param data: The decoded body.
+    :param cls: The class of the model.
+    :param trusted: Whether the data can be trusted, so that the validation can be skipped where it is worth it.
+    :return: the model
+    """
+    if trusted and has_number_lists(cls):
+        return construct(data, cls)
+    return cls.model_validate(data)  # type: ignore
+
+
+def deserialize_list(data: List[Dict], cls: Type[T], trusted: bool = False) -> List[T]:
+    """
+    Builds the models of a response body made of a list, validating the whole list at once.
+    :param data: The decoded body.
+    :param cls: The class of the models.
+    :param trusted: Whether the data can be trusted, so that the validation can be skipped where it is worth it.
+    :return: the models
+    """
+    if trusted and has_number_lists(cls):
+        return construct(data, List[cls])  # type: ignore
+    return get_type_adapter(List[cls]).validate_python(data)  # type: ignore
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(annotation: Any) -> TypeAdapter:
+    # building an adapter compiles its validator: do it once per type
+    return TypeAdapter(annotation)
+
+
+@lru_cache(maxsize=None)
+def has_number_lists(cls: Type[BaseModel]) -> bool:
+    """
+    Tells whether a model holds, at any depth, lists of numbers, i.e. vectors. Validating them costs one check per
+    number, and that is where skipping the validation pays off: any other model is validated by pydantic-core about as
+    fast as it can be assembled in Python, so it is validated anyway.
+    """
+    def walk(annotation: Any, seen: set) -> bool:
+        if _is_model_type(annotation):
+            if annotation in seen:
+                return False
+            seen.add(annotation)
+            if not annotation.__pydantic_complete__:
+                annotation.model_rebuild()
+            return any(walk(field.annotation, seen) for field in annotation.model_fields.values())
+
+        origin, args = get_origin(annotation), get_args(annotation)
+        if origin in (list, List) and args and args[0] in (float, int):
+            return True
+        return any(walk(arg, seen) for arg in args)
+
+    return walk(cls, set())
+
+
+def construct(data: Any, annotation: Any) -> Any:
+    """
+    Builds the value of the given type from a trusted response body, without validating it: models are built like
+    `model_construct` does, nested models and lists and dicts of models included, after the normalizations of their
+    "before" model validators, while the "wrap" field validators run with the trusted build as handler. Scalar values,
+    enums included, are kept as they come.
+    :param data: The decoded body.
+    :param annotation: The type to build, e.g. a model class or List[model class].
+    :return: the value
+    """
+    builder = get_builder(annotation)
+    return data if builder is None else builder(data)
+
+
+@lru_cache(maxsize=None)
+def get_builder(annotation: Any) -> Builder | None:
+    """
+    Returns the function building a value of the given type from trusted data, or None if the data is kept as it is.
+    """
+    if _is_model_type(annotation):
+        return _get_model_builder(annotation)
+
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin in (list, List) and args:
+        item_builder = get_builder(args[0])
+        if item_builder is None:
+            return None
+        return lambda data: [item_builder(item) for item in data] if isinstance(data, list) else data
+
+    if origin in (dict, Dict) and len(args) == 2:
+        value_builder = get_builder(args[1])
+        if value_builder is None:
+            return None
+        return lambda data: (
+            {key: value_builder(value) for key, value in data.items()} if isinstance(data, dict) else data
+        )
+
+    if origin in (Union, types.UnionType):
+        # trusted data needs no discrimination: objects go to the first type built from an object, lists to the first
+        # type built from a list
+        dict_builder = next((get_builder(arg) for arg in args if _is_object_type(arg)), None)
+        list_builder = next((get_builder(arg) for arg in args if get_origin(arg) in (list, List)), None)
+        if dict_builder is None and list_builder is None:
+            return None
+
+        def build_union(data: Any) -> Any:
+            if isinstance(data, dict) and dict_builder is not None:
+                return dict_builder(data)
+            if isinstance(data, list) and list_builder is not None:
+                return list_builder(data)
+            return data
+
+        return build_union
+
+    return None
+
+
+def _is_model_type(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _is_object_type(annotation: Any) -> bool:
+    return _is_model_type(annotation) or get_origin(annotation) in (dict, Dict)
+
+
+def _get_field_converter(builder: Builder | None, wrappers: List[Callable]) -> Builder | None:
+    if not wrappers:
+        return builder
+
+    handler = builder or (lambda value: value)
+
+    def convert(value: Any) -> Any:
+        for wrapper in wrappers:
+            value = wrapper(value, handler)
+        return value
+
+    return convert
+
+
+def _get_default_factory(field: FieldInfo) -> Callable[[], Any] | None:
+    if field.is_required():
+        return None
+    if field.default_factory is None and isinstance(field.default, (type(None), bool, int, float, str, tuple)):
+        default = field.default
+        return lambda: default
+    return lambda: field.get_default(call_default_factory=True)
+
+
+def _get_model_builder(cls: Type[BaseModel]) -> Builder:
+    if not cls.__pydantic_complete__:
+        cls.model_rebuild()
+
+    decorators = cls.__pydantic_decorators__
+    normalizers = [
+        decorator.func for decorator in decorators.model_validators.values() if decorator.info.mode == "before"
+    ]
+    wrappers: Dict[str, List[Callable]] = {}
+    for decorator in decorators.field_validators.values():
+        if decorator.info.mode == "wrap":
+            for field_name in decorator.info.fields:
+                wrappers.setdefault(field_name, []).append(decorator.func)
+
+    fields = [
+        (
+            name,
+            field.alias or name,
+            _get_field_converter(get_builder(field.annotation), wrappers.get(name, [])),
+            _get_default_factory(field),
+        )
+        for name, field in cls.model_fields.items()
+    ]
+    # the instance is assembled as model_construct does, minus its per-call overhead, unless the model needs more
+    assemble_directly = not cls.__private_attributes__ and cls.model_config.get("extra") != "allow"
+
+    def build(data: Any) -> Any:
+        for normalize in normalizers:
+            data = normalize(data)
+        if not isinstance(data, dict):
+            return data
 
-def deserialize(data: Dict, cls: Type[T]) -> T:
-    return cls(**data)
+        values, fields_set = {}, set()
+        for name, key, convert, get_default in fields:
+            if key in data:
+                value = data[key]
+                values[name] = value if convert is None or value is None else convert(value)
+                fields_set.add(name)
+            elif get_default is not None:
+                values[name] = get_default()
+
+        if not assemble_directly:
+            return cls.model_construct(fields_set, **values)
+
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, "__dict__", values)
+        object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        return instance
+
+    return build
+
+
+MIME_HEAD_SIZE = 2048
+
+# formats told apart by their first bytes alone, which libmagic reports with the same types
+_SIGNATURES: List[Tuple[int, bytes, str]] = [
+    (0, b"%PDF-", "application/pdf"),
+    (0, b"\x89PNG\r\n\x1a\n\x00\x00\x00\x0dIHDR", "image/png"),
+    (0, b"\xff\xd8\xff", "image/jpeg"),
+    (0, b"GIF87a", "image/gif"),
+    (0, b"GIF89a", "image/gif"),
+    (8, b"WEBP", "image/webp"),
+]
+
+def _detect_path(path: str, candidates: Collection[str] | None) -> Tuple[str, os.stat_result | None, str | None]:
+    # run by the workers of the process pool: the result is cached by the parent
+    try:
+        with open(path, "rb") as file:
+            stat = os.fstat(file.fileno())
+            return path, stat, mime_type_detector.detect(file.read(MIME_HEAD_SIZE), candidates)
+    except OSError:
+        return path, None, None
+
+
+class MimeTypeDetector:
+    """
+    Detects the MIME types of files, once per version of each file. The common formats are recognized from their
+    signature or, for text formats, from their extension, without calling libmagic; the others are handed to an
+    instance of libmagic kept by each thread, so that the files are detected in parallel instead of queueing on a single
+    instance, and without loading the database of libmagic again for every file.
+
+    The types detected are cached by path, modification time and size, so that a file is detected again only once it
+    has changed. Large batches of files are detected by a pool of processes.
+
+    When the candidate types are given, e.g. the ones allowed by an agent, a type recognized without libmagic is kept
+    only if it is a candidate, so that libmagic has the last word on the other files.
+    """
+    def __init__(self, cache_size: int = 65536, process_threshold: int = 1024):
+        self.cache_size = cache_size
+        self.process_threshold = process_threshold
+
+        self.__local = threading.local()
+        self.__lock = threading.Lock()
+        self.__cache: OrderedDict = OrderedDict()
+
+    def __get_magic(self) -> magic.Magic:
+        instance = getattr(self.__local, "magic", None)
+        if instance is None:
+            instance = self.__local.magic = magic.Magic(mime=True)
+        return instance
+
+    @staticmethod
+    def __get_cache_key(
+        path: str | os.PathLike, stat: os.stat_result, candidates: Collection[str] | None
+    ) -> Tuple[Any, ...]:
+        return (
+            os.path.abspath(path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            None if candidates is None else frozenset(candidates),
+        )
+
+    def __get_cached(self, key: Tuple[Any, ...]) -> str | None:
+        with self.__lock:
+            content_type = self.__cache.get(key)
+            if content_type is not None:
+                self.__cache.move_to_end(key)
+            return content_type
+
+    def __put_cached(self, key: Tuple[Any, ...], content_type: str):
+        with self.__lock:
+            self.__cache[key] = content_type
+            self.__cache.move_to_end(key)
+            while len(self.__cache) > self.cache_size:
+                self.__cache.popitem(last=False)
+
+    def clear(self):
+        with self.__lock:
+            self.__cache.clear()
+
+    def detect(self, head: bytes, candidates: Collection[str] | None = None) -> str:
+        """
+        Detects the MIME type of a file from its first bytes. The formats told apart by a signature skip libmagic; the
+        others, text formats included, are left to it, since their extension may not match their content.
+        :param head: The first bytes of the file; the first 2048 bytes are used.
+        :param candidates: The types expected, if any.
+        :return: str, the MIME type
+        """
+        head = head[:MIME_HEAD_SIZE]
+
+        content_type = next(
+            (
+                content_type
+                for offset, signature, content_type in _SIGNATURES
+                if head.startswith(signature, offset) and (offset == 0 or head.startswith(b"RIFF"))
+            ),
+            None,
+        )
+        if content_type is not None and (candidates is None or content_type in candidates):
+            return content_type
+        return self.__get_magic().from_buffer(head)
+
+    def detect_file(
+        self, path: str | os.PathLike, head: bytes | None = None, candidates: Collection[str] | None = None
+    ) -> str:
+        """
+        Detects the MIME type of a file, unless the same version of the file has already been detected.
+        :param path: The path of the file.
+        :param head: The first bytes of the file, if already read; otherwise they are read from the file when needed.
+        :param candidates: The types expected, if any.
+        :return: str, the MIME type
+        """
+        key = self.__get_cache_key(path, os.stat(path), candidates)
+        content_type = self.__get_cached(key)
+        if content_type is not None:
+            return content_type
+
+        if head is None:
+            with open(path, "rb") as file:
+                head = file.read(MIME_HEAD_SIZE)
+
+        content_type = self.detect(head, candidates)
+        self.__put_cached(key, content_type)
+        return content_type
+
+    def detect_files(
+        self,
+        paths: Iterable[str | os.PathLike],
+        candidates: Collection[str] | None = None,
+        max_workers: int | None = None,
+    ) -> List[str | None]:
+        """
+        Detects the MIME types of many files. The files not cached yet are detected by a pool of threads or, when there
+        are at least `process_threshold` of them, by a pool of processes.
+        :param paths: The paths of the files.
+        :param candidates: The types expected, if any.
+        :param max_workers: The number of threads or processes; by default, the one chosen by the executor.
+        :return: List[str | None], the MIME types, in the order of the paths; None for the files which cannot be read
+        """
+        paths = [os.fspath(path) for path in paths]
+        candidates = None if candidates is None else frozenset(candidates)
+
+        content_types: Dict[str, str | None] = {}
+        missing = []
+        for path in paths:
+            try:
+                content_types[path] = self.__get_cached(self.__get_cache_key(path, os.stat(path), candidates))
+            except OSError:
+                content_types[path] = None
+                continue
+            if content_types[path] is None:
+                missing.append(path)
+
+        if len(missing) >= self.process_threshold:
+            workers = max_workers or os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunk_size = max(1, len(missing) // (4 * workers))
+                results = list(executor.map(_detect_path, missing, repeat(candidates), chunksize=chunk_size))
+        elif missing:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cheshirecat-mime") as executor:
+                results = list(executor.map(_detect_path, missing, repeat(candidates)))
+        else:
+            results = []
+
+        for path, stat, content_type in results:
+            content_types[path] = content_type
+            if stat is not None and content_type is not None:
+                self.__put_cached(self.__get_cache_key(path, stat, candidates), content_type)
+
+        return [content_types[path] for path in paths]
+
+
+# shared by the whole process
+mime_type_detector = MimeTypeDetector()
+
+
+def get_mime_type(head: bytes, candidates: Collection[str] | None = None) -> str:
+    """
+    Detects the MIME type of a file from its first bytes.
+    """
+    return mime_type_detector.detect(head, candidates)
 
 
 def file_attributes(filename: str, file: BinaryIO) -> Tuple[str, BinaryIO, str]:
     current_pos = file.tell()
 
-    mime = magic.Magic(mime=True)
-    content_type = mime.from_buffer(file.read(2048))
+    content_type = get_mime_type(file.read(MIME_HEAD_SIZE))
 
     file.seek(current_pos)
 
     return os.path.basename(filename), file, content_type
+
+
+def upload_attributes(file_name: str | None, source: UploadSource) -> Tuple[str, UploadSource, str]:
+    """
+    Returns the name, the source and the MIME type of a file to upload. The MIME type is detected from the head of the
+    source: when the source can only be read once, the head is read and chained back in front of the rest.
+    :param file_name: The name of the file; optional only if the source is a path.
+    :param source: The path of the file, its content, a binary file-like object or an iterable of chunks.
+    :return: Tuple[str, UploadSource, str], the name, the source to upload and the MIME type
+    """
+    if file_name is None:
+        if not is_path(source):
+            raise ValueError("The file name is required when uploading from something other than a path")
+        file_name = os.fspath(source)
+
+    if hasattr(source, "read") and getattr(source, "seekable", lambda: False)():
+        return file_attributes(file_name, source)  # type: ignore
+
+    if is_path(source):
+        return os.path.basename(file_name), source, mime_type_detector.detect_file(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        head = bytes(memoryview(source).cast("B")[:MIME_HEAD_SIZE])
+    elif hasattr(source, "read"):
+        file = source
+        head = file.read(MIME_HEAD_SIZE)
+        source = chain([head], iter(lambda: file.read(CHUNK_SIZE), b""))  # type: ignore
+    elif isinstance(source, Iterable):
+        iterator, chunks, size = iter(source), [], 0
+        for chunk in iterator:
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= MIME_HEAD_SIZE:
+                break
+        head = b"".join(chunks)[:MIME_HEAD_SIZE]
+        source = chain(chunks, iterator)
+    else:
+        # asynchronous iterables cannot be peeked at from here
+        return os.path.basename(file_name), source, "application/octet-stream"
+
+    return os.path.basename(file_name), source, get_mime_type(head)
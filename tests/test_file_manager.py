@@ -0,0 +1,179 @@
+import asyncio
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from requests.exceptions import ConnectionError
+
+from cheshirecat_python_sdk import AsyncCheshireCatClient, CheshireCatClient, Configuration
+
+DATA = os.urandom(3 * 1024 * 1024 + 12345)
+CHUNK_SIZE = 64 * 1024
+SINGLE = {"parallel_threshold": 1 << 40}
+PARALLEL = {"parallel_threshold": 1 << 20}
+
+
+class FileServer(ThreadingHTTPServer):
+    """Serves `data` to every GET, honouring the ranges unless told otherwise, and dropping the next `drops` bodies."""
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FileHandler)
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self, data: bytes = DATA, ranges: bool = True, drops: int = 0):
+        with self.lock:
+            self.data, self.ranges, self.drops = data, ranges, drops
+            self.requested_ranges = []
+
+    def take_drop(self) -> bool:
+        with self.lock:
+            if self.drops <= 0:
+                return False
+            self.drops -= 1
+            return True
+
+
+class FileHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server, data = self.server, self.server.data
+        requested_range = self.headers.get("Range")
+        with server.lock:
+            server.requested_ranges.append(requested_range)
+
+        start, end, status = 0, len(data), 200
+        if requested_range and server.ranges:
+            match = re.fullmatch(r"bytes=(\d+)-(\d*)", requested_range)
+            start = int(match.group(1))
+            end = int(match.group(2)) + 1 if match.group(2) else len(data)
+            if start >= len(data):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(data)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            status = 206
+
+        self.send_response(status)
+        self.send_header("Content-Length", str(end - start))
+        self.send_header("ETag", '"v1"')
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end - 1}/{len(data)}")
+        self.end_headers()
+
+        body = data[start:end]
+        if server.take_drop():
+            self.wfile.write(body[:len(body) // 3])
+            self.wfile.flush()
+            self.close_connection = True
+            self.connection.shutdown(2)
+            return
+        self.wfile.write(body)
+
+
+@pytest.fixture(scope="module")
+def server():
+    file_server = FileServer()
+    thread = threading.Thread(target=file_server.serve_forever, daemon=True)
+    thread.start()
+    yield file_server
+    file_server.shutdown()
+    file_server.server_close()
+
+
+@pytest.fixture(params=["sync", "async"])
+def download(request, server):
+    configuration = Configuration(host="127.0.0.1", port=server.server_port, auth_key="k")
+
+    def download_file(dest, **kwargs):
+        kwargs.setdefault("chunk_size", CHUNK_SIZE)
+        if request.param == "sync":
+            return CheshireCatClient(configuration).file_manager.download_file("agent", "file.bin", dest, **kwargs)
+
+        async def main():
+            async with AsyncCheshireCatClient(configuration) as client:
+                return await client.file_manager.download_file("agent", "file.bin", dest, **kwargs)
+
+        return asyncio.run(main())
+
+    return download_file
+
+
+def read(path) -> bytes:
+    assert not os.path.exists(f"{path}.part")
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def test_downloads_a_file(server, download, tmp_path):
+    progress = []
+    server.reset()
+
+    size = download(tmp_path / "file.bin", on_progress=lambda *args: progress.append(args), **SINGLE)
+
+    assert size == len(DATA)
+    assert read(tmp_path / "file.bin") == DATA
+    assert server.requested_ranges == ["bytes=0-"]
+    assert progress[-1] == (len(DATA), len(DATA))
+    assert [received for received, _ in progress] == sorted(received for received, _ in progress)
+
+
+def test_downloads_a_large_file_as_parallel_ranges(server, download, tmp_path):
+    server.reset()
+
+    assert download(tmp_path / "file.bin", max_connections=3, **PARALLEL) == len(DATA)
+    assert read(tmp_path / "file.bin") == DATA
+    # the first range is read from the response which told the size of the file
+    assert len(server.requested_ranges) == 3
+    assert server.requested_ranges[0] == "bytes=0-"
+
+
+def test_resumes_from_the_last_byte_received(server, download, tmp_path):
+    server.reset(drops=2)
+
+    assert download(tmp_path / "file.bin", **SINGLE) == len(DATA)
+    assert read(tmp_path / "file.bin") == DATA
+    resumed_at = len(DATA) // 3
+    assert server.requested_ranges[:2] == ["bytes=0-", f"bytes={resumed_at}-{len(DATA) - 1}"]
+    assert len(server.requested_ranges) == 3
+
+
+def test_resumes_the_parallel_ranges(server, download, tmp_path):
+    server.reset(drops=3)
+
+    assert download(tmp_path / "file.bin", **PARALLEL) == len(DATA)
+    assert read(tmp_path / "file.bin") == DATA
+
+
+def test_restarts_when_the_server_ignores_the_ranges(server, download, tmp_path):
+    server.reset(ranges=False, drops=1)
+
+    assert download(tmp_path / "file.bin", **PARALLEL) == len(DATA)
+    assert read(tmp_path / "file.bin") == DATA
+    assert len(server.requested_ranges) == 2
+
+
+@pytest.mark.parametrize("ranges", [True, False], ids=["416", "200"])
+def test_downloads_an_empty_file(server, download, tmp_path, ranges):
+    server.reset(data=b"", ranges=ranges)
+
+    assert download(tmp_path / "empty.bin") == 0
+    assert read(tmp_path / "empty.bin") == b""
+
+
+def test_gives_up_after_max_resumes(server, download, tmp_path):
+    server.reset(drops=100)
+
+    with pytest.raises((ConnectionError, httpx.TransportError)):
+        download(tmp_path / "file.bin", max_resumes=2, **SINGLE)
+
+    assert len(server.requested_ranges) == 3
+    assert not os.path.exists(tmp_path / "file.bin")
+    assert not os.path.exists(tmp_path / "file.bin.part")
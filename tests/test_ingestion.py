@@ -0,0 +1,143 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from cheshirecat_python_sdk import IngestionJob
+from cheshirecat_python_sdk.enums import IngestionFileStatus
+from cheshirecat_python_sdk.ingestion import IngestionManifest
+from cheshirecat_python_sdk.models.api.rabbit_holes import (
+    AllowedMimeTypesOutput,
+    IngestionFileReport,
+    UploadSingleFileResponse,
+)
+
+
+class Crash(BaseException):
+    pass
+
+
+class FakeRabbitHole:
+    """The endpoints used by an ingestion job, with a server which already has the files in `existing`."""
+    def __init__(self, existing=(), fail_calls=(), crash_calls=()):
+        self.existing = set(existing)
+        self.fail_calls = set(fail_calls)
+        self.crash_calls = set(crash_calls)
+        self.posted = []
+        self.calls = 0
+        self.client = SimpleNamespace(memory=SimpleNamespace(has_sources=self.has_sources), source_cache=None)
+
+    def get_allowed_mime_types(self, agent_id):
+        return AllowedMimeTypesOutput(allowed=["text/plain"])
+
+    def has_sources(self, agent_id, sources, chat_id=None, concurrency=None):
+        return [source.hash in self.existing for source in sources]
+
+    def post_files(self, paths, agent_id, chat_id=None, metadata=None):
+        self.calls += 1
+        if self.calls in self.crash_calls:
+            raise Crash()
+        if self.calls in self.fail_calls:
+            raise RuntimeError("Service unavailable")
+        self.posted.extend(os.path.basename(path) for path in paths)
+        return {
+            os.path.basename(path): UploadSingleFileResponse(
+                filename=os.path.basename(path), content_type="text/plain", info="File is being ingested"
+            )
+            for path in paths
+        }
+
+
+@pytest.fixture
+def documents(tmp_path):
+    directory = tmp_path / "docs"
+    directory.mkdir()
+    for i in range(6):
+        (directory / f"doc{i}.txt").write_text(f"The document number {i}.\n" * 10)
+    return directory
+
+
+def test_manifest_records_the_files(tmp_path):
+    manifest = IngestionManifest(tmp_path / "manifest.db", "agent")
+    paths = [str(tmp_path / f"file{i}") for i in range(5)]
+
+    assert manifest.add(paths) == 5
+    assert manifest.add(paths[:2]) == 0
+
+    run = manifest.start_run()
+    manifest.record([IngestionFileReport(path=paths[1], status=IngestionFileStatus.FAILED, error="boom")], run)
+    manifest.close()
+
+    manifest = IngestionManifest(tmp_path / "manifest.db", "agent")
+    assert manifest.count_statuses() == {IngestionFileStatus.PENDING: 4, IngestionFileStatus.FAILED: 1}
+    assert [path for _, path in manifest.get_work([IngestionFileStatus.PENDING], 0, 10)] == paths[:1] + paths[2:]
+    assert manifest.get_work([IngestionFileStatus.FAILED], 0, 10, max_attempts=1) == []
+
+    first_page = manifest.get_files(limit=3)
+    second_page = manifest.get_files(after=first_page[-1][0], limit=3)
+    assert [report.path for _, report in first_page + second_page] == paths
+    assert [report.error for report in manifest.iter_files(IngestionFileStatus.FAILED)] == ["boom"]
+    manifest.close()
+
+
+def test_manifest_belongs_to_a_single_job(tmp_path):
+    IngestionManifest(tmp_path / "manifest.db", "agent", "chat").close()
+
+    with pytest.raises(ValueError):
+        IngestionManifest(tmp_path / "manifest.db", "agent", "another chat")
+
+
+def test_job_retries_only_the_failed_files(tmp_path, documents):
+    rabbit_hole = FakeRabbitHole(fail_calls={2})
+
+    with IngestionJob(rabbit_hole, tmp_path / "manifest.db", "agent") as job:
+        job.add_directory(documents)
+        report = job.run(concurrency=1, batch_size=2)
+        assert (report.uploaded_files, report.failed_files) == (4, 2)
+        failed = sorted(os.path.basename(file.path) for file in job.files(IngestionFileStatus.FAILED))
+
+        rabbit_hole.posted.clear()
+        report = job.run(concurrency=1, batch_size=2)
+
+    assert sorted(rabbit_hole.posted) == failed
+    assert (report.uploaded_files, report.failed_files) == (2, 0)
+    assert report.statuses == {IngestionFileStatus.UPLOADED: 6}
+
+
+def test_job_resumes_after_a_crash(tmp_path, documents):
+    rabbit_hole = FakeRabbitHole(crash_calls={2})
+    with IngestionJob(rabbit_hole, tmp_path / "manifest.db", "agent") as job:
+        job.add_directory(documents)
+        with pytest.raises(Crash):
+            job.run(concurrency=1, batch_size=2)
+        uploaded = [os.path.basename(file.path) for file in job.files(IngestionFileStatus.UPLOADED)]
+    assert uploaded == ["doc0.txt", "doc1.txt"]
+
+    rabbit_hole.posted.clear()
+    with IngestionJob(rabbit_hole, tmp_path / "manifest.db", "agent") as job:
+        report = job.run(concurrency=1, batch_size=2)
+
+    assert not set(rabbit_hole.posted) & set(uploaded)
+    assert report.statuses == {IngestionFileStatus.UPLOADED: 6}
+
+
+def test_job_skips_the_duplicates_and_the_existing_files(tmp_path, documents):
+    (documents / "copy.txt").write_bytes((documents / "doc0.txt").read_bytes())
+    (documents / "image.png").write_bytes(b"\x89PNG\r\n\x1a\n" + bytes(64))
+    with IngestionJob(FakeRabbitHole(), tmp_path / "seed.db", "agent") as job:
+        job.add([documents / "doc5.txt"])
+        job.run()
+        existing = next(job.files()).hash
+
+    rabbit_hole = FakeRabbitHole(existing={existing})
+    with IngestionJob(rabbit_hole, tmp_path / "manifest.db", "agent") as job:
+        job.add([documents / f"doc{i}.txt" for i in range(6)] + [documents / "copy.txt", documents / "image.png"])
+        report = job.run()
+
+    assert sorted(rabbit_hole.posted) == [f"doc{i}.txt" for i in range(5)]
+    assert report.statuses == {
+        IngestionFileStatus.UPLOADED: 5,
+        IngestionFileStatus.EXISTING: 1,
+        IngestionFileStatus.DUPLICATE: 1,
+        IngestionFileStatus.UNSUPPORTED: 1,
+    }
@@ -0,0 +1,50 @@
+import pytest
+
+from cheshirecat_python_sdk.clients.json_stream import JsonFragment, JsonStreamSplitter
+
+DOCUMENT = (
+    b'{"vectors": {"collections": {"declarative": [{"id": "a", "page_content": "[not] an \\"array\\""}, '
+    b'{"id": "b", "metadata": {"tags": [1, 2]}}], "procedural": []}}, "next_offset": null, "meta": {"k": [1]}}'
+)
+
+
+def split(splitter: JsonStreamSplitter, data: bytes, chunk_size: int):
+    fragments = []
+    for i in range(0, len(data), chunk_size):
+        fragments.extend(splitter.feed(data[i:i + chunk_size]))
+    splitter.close()
+    return fragments
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, len(DOCUMENT)])
+def test_splits_the_items_of_the_arrays(chunk_size):
+    fragments = split(JsonStreamSplitter([("vectors", "collections", "*")]), DOCUMENT, chunk_size)
+
+    assert fragments == [
+        JsonFragment(
+            ("vectors", "collections", "declarative"),
+            b'{"id": "a", "page_content": "[not] an \\"array\\""}',
+            True,
+        ),
+        JsonFragment(("vectors", "collections", "declarative"), b'{"id": "b", "metadata": {"tags": [1, 2]}}', True),
+        JsonFragment(("next_offset",), b"null", False),
+        JsonFragment(("meta",), b'{"k": [1]}', False),
+    ]
+
+
+def test_splits_a_top_level_array():
+    fragments = split(JsonStreamSplitter([()]), b'[{"a": 1}, "x", 2]', 3)
+
+    assert [(fragment.path, fragment.data, fragment.item) for fragment in fragments] == [
+        ((), b'{"a": 1}', True),
+        ((), b'"x"', True),
+        ((), b"2", True),
+    ]
+
+
+def test_raises_on_a_truncated_document():
+    splitter = JsonStreamSplitter([("items",)])
+    splitter.feed(b'{"items": [{"a": 1}, {"b"')
+
+    with pytest.raises(ValueError):
+        splitter.close()
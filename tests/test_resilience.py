@@ -0,0 +1,177 @@
+import time
+
+import pytest
+from requests.exceptions import ConnectionError, TooManyRedirects
+
+from cheshirecat_python_sdk import CheshireCatClient, CircuitBreakerPolicy, Configuration, RetryPolicy
+from cheshirecat_python_sdk.clients import CircuitOpenError
+from cheshirecat_python_sdk.clients.resilience import CircuitBreaker, CircuitBreakerEvent, RetryEvent
+from cheshirecat_python_sdk.enums import CircuitState
+
+HOST = "cat:1865"
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, headers: dict | None = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def get_session(monkeypatch, outcomes: list, **options):
+    """Returns the HTTP session of a client whose transport plays the given responses and errors, in order."""
+    events, sent = [], []
+    client = CheshireCatClient(
+        Configuration(host="127.0.0.1", port=9, auth_key="k", transport_hook=events.append, **options)
+    )
+
+    def request(method, url, **kwargs):
+        sent.append(method)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(client.http_client.get_base_session(), "request", request)
+    return client.http_client, client.http_client.get_client("agent"), sent, events
+
+
+def test_retry_policy_delays():
+    policy = RetryPolicy(backoff_factor=0.5, backoff_max=3, jitter=False)
+
+    assert [policy.get_delay(attempt) for attempt in range(5)] == [0.5, 1, 2, 3, 3]
+    assert policy.get_delay(0, "2") == 2
+    assert policy.get_delay(0, "120") == 3
+    assert 0 <= RetryPolicy(backoff_factor=0.5).get_delay(2) <= 2
+
+
+def test_retry_policy_decisions():
+    policy = RetryPolicy()
+
+    assert policy.should_retry_status("GET", 502)
+    assert not policy.should_retry_status("GET", 500)
+    # a POST is retried only when the server surely did not process it
+    assert not policy.should_retry_status("POST", 502)
+    assert policy.should_retry_status("POST", 503)
+    assert policy.should_retry_status("POST", 429)
+    assert policy.should_retry_error("GET", connect_failed=False)
+    assert not policy.should_retry_error("POST", connect_failed=False)
+    assert policy.should_retry_error("POST", connect_failed=True)
+
+
+def test_circuit_breaker_transitions():
+    events = []
+    breaker = CircuitBreaker(CircuitBreakerPolicy(failure_threshold=2, recovery_timeout=0.05), events.append)
+
+    breaker.before_request(HOST)
+    breaker.record_failure(HOST)
+    assert breaker.get_state(HOST) == CircuitState.CLOSED
+    breaker.record_failure(HOST)
+    assert breaker.get_state(HOST) == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(HOST)
+
+    time.sleep(0.06)
+    breaker.before_request(HOST)
+    assert breaker.get_state(HOST) == CircuitState.HALF_OPEN
+    # a single probe at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(HOST)
+
+    # a failed probe opens the circuit again
+    breaker.record_failure(HOST)
+    assert breaker.get_state(HOST) == CircuitState.OPEN
+
+    time.sleep(0.06)
+    breaker.before_request(HOST)
+    breaker.record_success(HOST)
+    assert breaker.get_state(HOST) == CircuitState.CLOSED
+
+    assert [(event.previous_state, event.state) for event in events] == [
+        (CircuitState.CLOSED, CircuitState.OPEN),
+        (CircuitState.OPEN, CircuitState.HALF_OPEN),
+        (CircuitState.HALF_OPEN, CircuitState.OPEN),
+        (CircuitState.OPEN, CircuitState.HALF_OPEN),
+        (CircuitState.HALF_OPEN, CircuitState.CLOSED),
+    ]
+
+
+def test_circuit_breaker_release_frees_the_probe():
+    breaker = CircuitBreaker(CircuitBreakerPolicy(failure_threshold=1, recovery_timeout=0.0))
+    breaker.record_failure(HOST)
+
+    breaker.before_request(HOST)
+    breaker.release(HOST)
+    breaker.before_request(HOST)
+    assert breaker.get_state(HOST) == CircuitState.HALF_OPEN
+
+
+def test_retries_are_off_by_default(monkeypatch):
+    _, session, sent, events = get_session(monkeypatch, [FakeResponse(503)])
+
+    assert session.get("/x").status_code == 503
+    assert sent == ["GET"]
+    assert events == []
+
+
+def test_retries_an_idempotent_request(monkeypatch):
+    failed = FakeResponse(503, {"Retry-After": "0"})
+    _, session, sent, events = get_session(
+        monkeypatch,
+        [failed, ConnectionError("reset"), FakeResponse(200)],
+        retry_policy=RetryPolicy(backoff_factor=0.001),
+    )
+
+    assert session.get("/x").status_code == 200
+    assert sent == ["GET"] * 3
+    assert failed.closed
+    assert [(event.attempt, event.status_code) for event in events if isinstance(event, RetryEvent)] == [
+        (1, 503), (2, None)
+    ]
+
+
+def test_does_not_retry_a_post_the_server_may_have_processed(monkeypatch):
+    _, session, sent, _ = get_session(
+        monkeypatch, [FakeResponse(502), FakeResponse(200)], retry_policy=RetryPolicy(backoff_factor=0.001)
+    )
+
+    assert session.post("/x").status_code == 502
+    assert sent == ["POST"]
+
+
+def test_gives_up_after_max_retries(monkeypatch):
+    _, session, sent, _ = get_session(
+        monkeypatch, [FakeResponse(504)] * 3, retry_policy=RetryPolicy(max_retries=2, backoff_factor=0.001)
+    )
+
+    assert session.get("/x").status_code == 504
+    assert sent == ["GET"] * 3
+
+
+def test_the_session_goes_through_the_circuit_breaker(monkeypatch):
+    http_client, session, sent, events = get_session(
+        monkeypatch,
+        [ConnectionError("refused"), TooManyRedirects("loop"), FakeResponse(200)],
+        circuit_breaker_policy=CircuitBreakerPolicy(failure_threshold=1, recovery_timeout=0.05),
+    )
+    host = http_client.get_netloc()
+
+    with pytest.raises(ConnectionError):
+        session.get("/x")
+    assert http_client.circuit_breaker.get_state(host) == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        session.get("/x")
+
+    # a probe failing on the client side does not keep the circuit half-open for good
+    time.sleep(0.06)
+    with pytest.raises(TooManyRedirects):
+        session.get("/x")
+    assert session.get("/x").status_code == 200
+    assert http_client.circuit_breaker.get_state(host) == CircuitState.CLOSED
+    assert sent == ["GET"] * 3
+    assert [event.state for event in events if isinstance(event, CircuitBreakerEvent)] == [
+        CircuitState.OPEN, CircuitState.HALF_OPEN, CircuitState.CLOSED
+    ]